@@ -0,0 +1,53 @@
+"""
+Benchmark chat index build and query latency.
+
+Usage:
+    cd api && python -m benchmarks.bench_chat [queries]
+"""
+import statistics
+import sys
+import time
+
+from benchmarks.fixtures import synthetic_items
+from handlers import chat, resume_all
+
+QUESTIONS = [
+    "What does he do?",
+    "Tell me about serverless projects",
+    "Which roles used terraform and aws lambda?",
+    "How did he reduce latency and cost?",
+    "What databases has he worked with, like dynamodb or postgres?",
+]
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def main():
+    queries = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+
+    for jobs in (10, 40, 200):
+        data = resume_all._partition(synthetic_items(jobs=jobs))
+
+        builds = []
+        for _ in range(20):
+            start = time.perf_counter()
+            index = chat.BM25Index(chat.build_passages(data))
+            builds.append(time.perf_counter() - start)
+
+        latencies = []
+        for i in range(queries):
+            start = time.perf_counter()
+            index.search(QUESTIONS[i % len(QUESTIONS)])
+            latencies.append(time.perf_counter() - start)
+
+        print(f"jobs={jobs:<4} passages={len(index.passages):<5} terms={len(index.postings):<4} "
+              f"build={statistics.median(builds) * 1000:7.2f} ms  "
+              f"query p50={_percentile(latencies, 0.50) * 1e6:7.1f} µs  "
+              f"p99={_percentile(latencies, 0.99) * 1e6:7.1f} µs")
+
+
+if __name__ == '__main__':
+    main()
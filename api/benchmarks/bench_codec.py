@@ -0,0 +1,70 @@
+"""
+Benchmark compressed attribute storage (handlers/codec.py).
+
+For synthetic resumes of increasing size, reports:
+
+    size      Mean and largest work-experience item, plain → compressed
+    scan      Read units for one full Scan (eventually consistent:
+              0.5 RCU per 4 KB of items scanned), dictionary item included
+    load      Write units for load_resume.py (1 WCU per started KB, per item)
+    decode    Extra cache-build time spent decompressing
+
+Usage:
+    cd api && python -m benchmarks.bench_codec [iterations]
+"""
+import copy
+import math
+import statistics
+import sys
+import time
+
+from benchmarks.fixtures import synthetic_items
+from handlers import codec, ordering, resume_all
+
+
+def _scan_rcu(items):
+    return math.ceil(sum(map(codec.item_size, items)) / 4096) * 0.5
+
+
+def _load_wcu(items):
+    return sum(math.ceil(codec.item_size(item) / 1024) for item in items)
+
+
+def _build_us(items, iterations):
+    """Median partition time; each run gets a fresh copy (decoding is in place)."""
+    copies = [copy.deepcopy(items) for _ in range(iterations)]
+    samples = []
+    for fresh in copies:
+        start = time.perf_counter()
+        resume_all._partition(fresh)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    for jobs, accomplishments in ((5, 4), (40, 8), (200, 12)):
+        plain = ordering.assign_ranks(synthetic_items(jobs=jobs, accomplishments=accomplishments))
+        packed = copy.deepcopy(plain)
+        codec_dict = codec.compress_items(packed)
+        packed.append(codec_dict)
+        assert resume_all._partition(copy.deepcopy(packed)) == resume_all._partition(copy.deepcopy(plain))
+
+        work = [(codec.item_size(a), codec.item_size(b)) for a, b in zip(plain, packed)
+                if a['type'] == 'work_experience']
+        mean_before = statistics.mean(a for a, _ in work)
+        mean_after = statistics.mean(b for _, b in work)
+        max_before = max(a for a, _ in work)
+        max_after = max(b for _, b in work)
+
+        print(f"jobs={jobs:<4} item {mean_before:6.0f} → {mean_after:6.0f} B "
+              f"(max {max_before:5d} → {max_after:5d})  "
+              f"scan {_scan_rcu(plain):5.1f} → {_scan_rcu(packed):5.1f} RCU  "
+              f"load {_load_wcu(plain):4d} → {_load_wcu(packed):4d} WCU  "
+              f"build {_build_us(plain, iterations):7.1f} → {_build_us(packed, iterations):7.1f} µs  "
+              f"dict {codec.item_size(codec_dict)} B")
+
+
+if __name__ == '__main__':
+    main()
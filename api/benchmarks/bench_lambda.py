@@ -0,0 +1,114 @@
+"""
+Benchmark the raw Lambda fast path against Mangum + FastAPI for GET /resume.
+
+cold   Fresh interpreter: import the entry point and serve the first
+       request (DynamoDB replaced by an in-memory table, so this is pure
+       import + build + encode cost). Median of several processes.
+warm   Repeated requests against a warm cache in one process: p50/p99.
+
+Usage:
+    cd api && python -m benchmarks.bench_lambda [warm requests]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROCESSES = 7
+
+# Keep per-request INFO lines (e.g. Mangum's access log) out of the output
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+
+def _event(path='/resume'):
+    """A complete HTTP API / Function URL (2.0) event, as Mangum expects."""
+    return {
+        'version': '2.0', 'routeKey': '$default', 'rawPath': path, 'rawQueryString': '',
+        'headers': {'accept': 'application/json', 'host': 'example.lambda-url.us-east-1.on.aws'},
+        'requestContext': {
+            'http': {'method': 'GET', 'path': path, 'protocol': 'HTTP/1.1',
+                     'sourceIp': '127.0.0.1', 'userAgent': 'bench'},
+            'requestId': 'bench', 'stage': '$default',
+        },
+        'isBase64Encoded': False,
+    }
+
+
+class _FakeTable:
+    def __init__(self, items):
+        self.items = items
+
+    def scan(self, **kwargs):
+        return {'Items': self.items}
+
+    # Synthetic items are all the default tenant's: the TenantIndex Query returns them
+    query = scan
+
+
+def _use_fake_table(items=None):
+    from benchmarks.fixtures import synthetic_items
+    from handlers import resume_all
+    table = _FakeTable(items or synthetic_items())
+    resume_all.get_dynamodb_table = lambda: table
+
+
+def cold(entry_point):
+    """Run in a fresh process: time import + first request, print ms."""
+    from benchmarks.fixtures import synthetic_items
+    items = synthetic_items()
+    start = time.perf_counter()
+    import lambda_handler  # boto3, handlers and (for `handler`) FastAPI are all counted
+    _use_fake_table(items)
+    response = getattr(lambda_handler, entry_point)(_event(), None)
+    elapsed = time.perf_counter() - start
+    assert response['statusCode'] == 200, response
+    print(f"{elapsed * 1000:.2f}")
+
+
+def _cold_ms(entry_point):
+    samples = []
+    for _ in range(PROCESSES):
+        result = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.bench_lambda', '--cold', entry_point],
+            capture_output=True, text=True, check=True
+        )
+        samples.append(float(result.stdout.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def _warm_us(fn, requests):
+    event = _event()
+    for _ in range(200):
+        fn(event, None)
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        fn(event, None)
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return samples[len(samples) // 2], samples[int(len(samples) * 0.99)]
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+
+    print(f"Cold start (import + first GET /resume, median of {PROCESSES} processes):")
+    for entry_point in ('handler', 'raw_handler'):
+        print(f"  {entry_point:<12} {_cold_ms(entry_point):8.1f} ms")
+
+    _use_fake_table()
+    import lambda_handler
+    from handlers import metrics
+    print(f"\nWarm GET /resume ({requests} requests):")
+    for name in ('handler', 'raw_handler'):
+        p50, p99 = _warm_us(getattr(lambda_handler, name), requests)
+        print(f"  {name:<12} p50 {p50:8.1f} us   p99 {p99:8.1f} us")
+    metrics.reset()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 2 and sys.argv[1] == '--cold':
+        cold(sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,93 @@
+"""
+Benchmark per-request logging overhead on the calling thread.
+
+"before" is the old logging.basicConfig setup: a StreamHandler that formats
+and writes synchronously. "after" is logging_config's queue pipeline, where
+the request thread only enqueues and a listener thread formats and writes.
+
+Two sinks are measured:
+    file     a temp file (fast, page-cache backed writes)
+    blocked  a sink whose write blocks for 100 µs, like stdout when the
+             log collector falls behind
+
+Usage:
+    cd api && python -m benchmarks.bench_logging [requests]
+"""
+import logging
+import sys
+import tempfile
+import time
+
+import logging_config
+
+LINES_PER_REQUEST = 3
+BLOCKED_WRITE_SECONDS = 0.0001
+
+
+class _BlockedSink:
+    """Stream whose writes block (and release the GIL) like a full pipe."""
+
+    def write(self, text):
+        time.sleep(BLOCKED_WRITE_SECONDS)
+
+    def flush(self):
+        pass
+
+
+def _simulate(logger, requests):
+    start = time.perf_counter()
+    for i in range(requests):
+        logger.info("Request started path=%s", "/resume")
+        logger.info("Cache hit for %s", "resume")
+        logger.info("Request finished status=%d in %.2fms", 200, 1.5)
+    return (time.perf_counter() - start) / requests
+
+
+def _reset_root():
+    root = logging.getLogger()
+    for handler in root.handlers:
+        handler.close()
+    root.handlers = []
+
+
+def _before(sink, requests):
+    handler = logging.StreamHandler(sink)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s — %(message)s"))
+    _reset_root()
+    logging.getLogger().addHandler(handler)
+    logging.getLogger().setLevel(logging.INFO)
+    elapsed = _simulate(logging.getLogger('bench'), requests)
+    _reset_root()
+    return elapsed
+
+
+def _after(sink, requests):
+    logging_config.configure_logging(stream=sink)
+    elapsed = _simulate(logging.getLogger('bench'), requests)
+    logging_config.stop_logging()
+    _reset_root()
+    return elapsed
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    blocked_requests = max(requests // 20, 1)
+
+    print(f"{LINES_PER_REQUEST} log lines per request; µs per request on the request thread\n")
+    print(f"{'sink':<10} {'requests':>9} {'before':>10} {'after':>10}")
+
+    with tempfile.TemporaryFile('w') as sink:
+        before = _before(sink, requests)
+    with tempfile.TemporaryFile('w') as sink:
+        after = _after(sink, requests)
+    print(f"{'file':<10} {requests:>9} {before * 1e6:10.2f} {after * 1e6:10.2f}")
+
+    before = _before(_BlockedSink(), blocked_requests)
+    after = _after(_BlockedSink(), blocked_requests)
+    print(f"{'blocked':<10} {blocked_requests:>9} {before * 1e6:10.2f} {after * 1e6:10.2f}")
+
+    print(f"\nrecords dropped by the bounded queue: {logging_config.dropped_records()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark memory: import footprint, cache build, encoding and per-route garbage.
+
+imports   Traced bytes retained by importing boto3, the raw Lambda entry
+          point and the FastAPI app
+cold      Per dataset size: peak and retained bytes of the cache build, the
+          rebuild hooks (/resume encoding, search and chat indexes), the
+          PDF render and the routes that triggered them
+warm      Repeated requests against the warm cache. Retained bytes per call
+          should stay ~0; anything else is a per-request leak
+totals    Traced bytes by package, the top allocation sites and max RSS
+          (compare with the Lambda's memory_size)
+
+Figures come from handlers/memprof.py, as served by /debug/memory.
+Requests go straight to the ASGI app and response bodies are dropped, so
+nothing outside the app holds on to them.
+
+Usage:
+    cd api && python -m benchmarks.bench_memory [warm requests]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+
+# Trace before anything else is imported, keep per-phase allocation sites,
+# and have main.py mount the middleware and /debug/memory
+os.environ['MEMPROF'] = '1'
+os.environ['MEMPROF_SITES'] = '1'
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+from handlers import memprof  # noqa: E402
+
+memprof.start()
+
+with memprof.phase('import boto3'):
+    import boto3  # noqa: E402,F401
+with memprof.phase('import lambda_handler'):
+    import lambda_handler  # noqa: E402,F401
+with memprof.phase('import main'):
+    import main  # noqa: E402
+
+from benchmarks.bench_lambda import _use_fake_table  # noqa: E402
+from benchmarks.fixtures import synthetic_items  # noqa: E402
+from handlers import pdf, resume_all  # noqa: E402
+
+
+async def _get(path, query=b''):
+    """Serve one GET through the full middleware stack, discarding the body."""
+    scope = {
+        'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+        'method': 'GET', 'scheme': 'http', 'path': path, 'raw_path': path.encode(),
+        'root_path': '', 'query_string': query, 'headers': [(b'host', b'bench')],
+        'client': ('127.0.0.1', 1), 'server': ('bench', 80),
+    }
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        pass
+
+    await main.app(scope, receive, send)
+
+
+def _kib(size):
+    return f"{size / 1024:10.1f}"
+
+
+def _print_phases(phases):
+    print(f"  {'phase':<40} {'calls':>5} {'peak KiB':>10} {'retained KiB':>12} "
+          f"{'retained/call':>13} {'gc':>4}")
+    for name, stats in phases.items():
+        per_call = stats['retained_bytes_total'] / stats['calls']
+        print(f"  {name:<40} {stats['calls']:5d} {_kib(stats['peak_bytes'])}   "
+              f"{_kib(stats['retained_bytes'])}    {_kib(per_call)} {stats['gc_collections']:4d}")
+
+
+async def run(warm):
+    pdf.CACHE_DIR = tempfile.mkdtemp(prefix='bench-memory-')
+
+    print("imports")
+    _print_phases(memprof.phases())
+
+    for jobs in (5, 40, 200):
+        _use_fake_table(synthetic_items(jobs=jobs))
+        resume_all.clear_cache()
+        pdf.clear_cache()
+        memprof.reset()
+
+        await _get('/resume')          # cold: scan, build, rebuild hooks
+        await _get('/resume.pdf')      # first render
+        cold = memprof.phases()
+        memprof.reset()
+        for _ in range(warm):
+            await _get('/resume')
+            await _get('/resume.pdf')
+            await _get('/resume/search', b'q=aws+lambda')
+
+        print(f"\njobs={jobs} cold")
+        _print_phases(cold)
+        print(f"jobs={jobs} warm x{warm}")
+        _print_phases(memprof.phases())
+        print("  cache.build top sites: " + ", ".join(
+            f"{site['site']} {site['size_bytes'] / 1024:.1f} KiB"
+            for site in cold['cache.build']['top_sites'][:4]))
+
+    report = memprof.report(limit=8)
+    print(f"\ntraced {report['traced_bytes'] / 1048576:.1f} MiB "
+          f"(peak {report['traced_peak_bytes'] / 1048576:.1f} MiB), "
+          f"max RSS {report['max_rss_bytes'] / 1048576:.1f} MiB")
+    print("by package")
+    for entry in report['by_package']:
+        print(f"  {entry['package']:<24} {_kib(entry['size_bytes'])} KiB")
+    print("top sites")
+    for site in report['top_sites']:
+        print(f"  {site['site']:<64} {_kib(site['size_bytes'])} KiB {site['count']:7d} blocks")
+
+
+def main_():
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 50))
+
+
+if __name__ == '__main__':
+    main_()
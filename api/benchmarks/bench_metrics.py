@@ -0,0 +1,58 @@
+"""
+Benchmark the per-request overhead of MetricsMiddleware.
+
+Drives a bare ASGI app directly (no network, no HTTP client) with and
+without the middleware and reports the difference per request.
+
+Usage:
+    cd api && python -m benchmarks.bench_metrics [iterations]
+"""
+import asyncio
+import sys
+import time
+
+from handlers import metrics
+from middleware.metrics import MetricsMiddleware
+
+
+class _Route:
+    path = "/resume"
+
+
+async def _bare_app(scope, receive, send):
+    scope['route'] = _Route
+    await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+    await send({'type': 'http.response.body', 'body': b'{}'})
+
+
+async def _receive():
+    return {'type': 'http.request', 'body': b''}
+
+
+async def _send(message):
+    pass
+
+
+async def _run(app, iterations):
+    scope = {'type': 'http', 'method': 'GET', 'path': '/resume'}
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await app(dict(scope), _receive, _send)
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    bare = asyncio.run(_run(_bare_app, iterations))
+    wrapped = asyncio.run(_run(MetricsMiddleware(_bare_app), iterations))
+    metrics.reset()
+
+    print(f"iterations:          {iterations}")
+    print(f"bare app:            {bare * 1e6:8.2f} µs/request")
+    print(f"with metrics:        {wrapped * 1e6:8.2f} µs/request")
+    print(f"middleware overhead: {(wrapped - bare) * 1e6:8.2f} µs/request")
+
+
+if __name__ == '__main__':
+    main()
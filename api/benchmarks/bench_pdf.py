@@ -0,0 +1,59 @@
+"""
+Benchmark the resume PDF: render time and cache-hit latency.
+
+render   Full layout + serialization of a fresh dataset (median)
+disk     get_pdf() with an empty memory cache and the file on disk
+memory   get_pdf() for the current dataset: p50/p99
+
+Usage:
+    cd api && python -m benchmarks.bench_pdf [iterations]
+"""
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks.fixtures import synthetic_items
+from handlers import pdf, resume_all
+
+
+def _samples_us(fn, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return samples
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    pdf.CACHE_DIR = tempfile.mkdtemp(prefix='bench-pdf-')
+
+    for jobs in (5, 40, 200):
+        data = resume_all._partition(synthetic_items(jobs=jobs))
+        body = pdf.render(data)
+        pages = body.count(b'/Type /Page ')
+
+        render = statistics.median(_samples_us(lambda: pdf.render(data), max(iterations // 5, 3)))
+
+        pdf.clear_cache()
+        key = pdf.content_key(data)
+        pdf.get_pdf(data, key)  # render once and write the file
+
+        def disk_hit():
+            pdf.clear_cache()
+            pdf.get_pdf(data, key)
+        disk = statistics.median(_samples_us(disk_hit, iterations))
+
+        pdf.get_pdf(data)
+        memory = _samples_us(lambda: pdf.get_pdf(data, pdf.content_key(data)), iterations * 100)
+
+        print(f"jobs={jobs:<4} {pages:3d} pages {len(body) / 1024:6.1f} KiB  "
+              f"render {render / 1000:7.2f} ms  disk hit {disk:7.1f} µs  "
+              f"memory hit p50 {memory[len(memory) // 2]:5.2f} µs p99 {memory[int(len(memory) * 0.99)]:5.2f} µs")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark the cached resume representation: dicts of Decimals (before)
+versus typed __slots__ records (after).
+
+Reports the cache build time (partition + sort; the records build places
+items by their ingest-time rank), the retained memory of the cached dataset
+(tracemalloc), and per-request encode time:
+
+    before   jsonable_encoder walk + json.dumps (what JSONResponse did)
+    after    encoding.dumps on records (orjson, or the stdlib fallback)
+    cached   encoding.dumps_cached, what /resume does between rebuilds
+
+Usage:
+    cd api && python -m benchmarks.bench_records [iterations]
+"""
+import copy
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+
+from fastapi.encoders import jsonable_encoder
+
+from benchmarks.fixtures import synthetic_items
+from handlers import encoding, ordering, resume_all
+
+
+def _legacy_build(items):
+    """The dict-of-Decimals cache build this replaced."""
+    result = {"profile": None, "work_experience": [], "education": [], "skills": []}
+    for item in items:
+        item_type = item.get('type')
+        if item_type == 'profile':
+            item.pop('id', None)
+            item.pop('type', None)
+            result["profile"] = item
+        elif item_type in result:
+            result[item_type].append(item)
+    result["work_experience"].sort(key=lambda x: x.get('start_date', ''), reverse=True)
+    result["work_experience"].sort(key=lambda x: not x.get('is_current', False))
+    result["education"].sort(key=lambda x: x.get('start_date', ''), reverse=True)
+    result["skills"].sort(key=lambda x: (int(x.get('sort_order', 999)), x.get('category', '')))
+    return result
+
+
+def _records_build(items):
+    return resume_all._partition(items)
+
+
+def _median_us(fn, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6
+
+
+def _median_build_us(build, items, iterations):
+    """Time a build on fresh copies (the legacy build mutates its input)."""
+    copies = [copy.deepcopy(items) for _ in range(iterations)]
+    samples = []
+    for fresh in copies:
+        start = time.perf_counter()
+        build(fresh)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6
+
+
+def _retained(build, items):
+    """
+    Container memory still held once the scan output is dropped and only
+    the cache remains. Strings are shared by both representations, so
+    they are not counted.
+    """
+    build(copy.deepcopy(items))  # warm up one-time allocations
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    fresh = copy.deepcopy(items)  # stands in for the boto3 scan result
+    data = build(fresh)
+    del fresh
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return data, retained
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print(f"orjson: {'yes' if encoding.ORJSON_AVAILABLE else 'no (stdlib fallback)'}")
+
+    for jobs in (5, 40, 200):
+        items = synthetic_items(jobs=jobs)
+        # As stored by scripts/load_resume.py
+        ranked = ordering.assign_ranks(copy.deepcopy(items))
+        legacy, legacy_bytes = _retained(_legacy_build, items)
+        records, records_bytes = _retained(_records_build, ranked)
+        assert json.loads(encoding.dumps(records)) == jsonable_encoder(legacy)
+
+        build_before = _median_build_us(_legacy_build, items, max(iterations // 4, 1))
+        build_unranked = _median_build_us(_records_build, items, max(iterations // 4, 1))
+        build_after = _median_build_us(_records_build, ranked, max(iterations // 4, 1))
+        before = _median_us(lambda: json.dumps(jsonable_encoder(legacy)).encode(), iterations)
+        after = _median_us(lambda: encoding.dumps(records), iterations)
+        cached = _median_us(lambda: encoding.dumps_cached(records), iterations)
+
+        print(f"jobs={jobs:<4} memory {legacy_bytes / 1024:7.1f} → {records_bytes / 1024:7.1f} KiB  "
+              f"build {build_before:8.1f} → {build_after:8.1f} µs (unranked {build_unranked:7.1f})  "
+              f"encode {before:8.1f} → {after:7.1f} µs (cached {cached:4.2f} µs)  "
+              f"payload {len(encoding.dumps(records)) / 1024:6.1f} KiB")
+
+
+if __name__ == '__main__':
+    main()
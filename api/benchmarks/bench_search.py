@@ -0,0 +1,53 @@
+"""
+Benchmark search index build time, memory and query latency.
+
+Usage:
+    cd api && python -m benchmarks.bench_search [queries]
+"""
+import statistics
+import sys
+import time
+
+from benchmarks.fixtures import synthetic_items
+from handlers import resume_all
+from handlers.search import SearchIndex
+
+QUERIES = [
+    {"query": "serverless"},
+    {"query": "terra"},
+    {"query": "aws lambda dynamodb"},
+    {"skill": "python", "section": "work_experience"},
+    {"query": "lat", "prefix": True},
+]
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def main():
+    queries = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+
+    for jobs in (10, 40, 200):
+        data = resume_all._partition(synthetic_items(jobs=jobs))
+
+        builds = [SearchIndex(data) for _ in range(10)]
+        index = builds[-1]
+        stats = index.stats()
+
+        latencies = []
+        for i in range(queries):
+            start = time.perf_counter()
+            index.search(**QUERIES[i % len(QUERIES)])
+            latencies.append(time.perf_counter() - start)
+
+        print(f"jobs={jobs:<4} docs={stats['documents']:<4} terms={stats['terms']:<4} "
+              f"build={statistics.median(b.build_seconds for b in builds) * 1000:7.2f} ms  "
+              f"memory={stats['memory_bytes'] / 1024:7.1f} KiB  "
+              f"query p50={_percentile(latencies, 0.5) * 1e6:7.1f} µs  "
+              f"p99={_percentile(latencies, 0.99) * 1e6:7.1f} µs")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark the per-tenant resume cache: 10k tenants, Zipf-distributed traffic.
+
+Each tenant's payload is a real encoded resume (3–15 jobs, roughly 5–25 KB).
+For each byte budget it reports the hit ratio, how many DynamoDB loads
+the misses would cost, the bytes the cache accounts for, and the memory
+tracemalloc actually sees retained (payloads plus LRU bookkeeping). Those
+are the numbers to size TENANT_CACHE_MAX_BYTES against a 512 MB Lambda.
+
+Usage:
+    cd api && python -m benchmarks.bench_tenants [requests]
+"""
+import itertools
+import random
+import sys
+import time
+import tracemalloc
+
+from benchmarks.fixtures import synthetic_items
+from handlers import encoding, resume_all
+from handlers.tenant_cache import TenantCache
+
+TENANTS = 10_000
+ZIPF_S = 1.0
+BUDGETS_MIB = (8, 32, 64, 128)
+TEMPLATES = 40
+
+
+def _templates():
+    """A pool of distinct encoded resumes; tenants reuse them as templates."""
+    pool = []
+    for seed in range(TEMPLATES):
+        data = resume_all._partition(synthetic_items(jobs=3 + seed % 13, seed=seed))
+        pool.append(encoding.dumps(data))
+    return pool
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    pool = _templates()
+
+    def loader(tenant):
+        # A fresh bytes object per load, as a real DynamoDB read would produce
+        return pool[tenant % TEMPLATES] + b' ' * (tenant % 64)
+
+    total_bytes = sum(len(pool[t % TEMPLATES]) + t % 64 for t in range(TENANTS))
+    rng = random.Random(11)
+    weights = list(itertools.accumulate(1 / (rank + 1) ** ZIPF_S for rank in range(TENANTS)))
+    stream = rng.choices(range(TENANTS), cum_weights=weights, k=requests)
+
+    print(f"tenants={TENANTS} zipf_s={ZIPF_S} requests={requests} "
+          f"all resumes={total_bytes / 2**20:.1f} MiB "
+          f"(avg {total_bytes / TENANTS / 1024:.1f} KiB)")
+
+    for budget in BUDGETS_MIB:
+        loads = 0
+
+        def counting_loader(tenant):
+            nonlocal loads
+            loads += 1
+            return loader(tenant)
+
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        cache = TenantCache(counting_loader, max_bytes=budget * 2**20, ttl=3600)
+        start = time.perf_counter()
+        for tenant in stream:
+            cache.get(tenant)
+        elapsed = time.perf_counter() - start
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+
+        stats = cache.stats()
+        print(f"budget={budget:>4} MiB  hit ratio={1 - loads / requests:6.1%}  "
+              f"loads={loads:<7} entries={stats['entries']:<6} "
+              f"accounted={stats['bytes'] / 2**20:6.1f} MiB  "
+              f"retained={retained / 2**20:6.1f} MiB  "
+              f"{elapsed / requests * 1e6:5.2f} µs/request (traced)")
+
+
+if __name__ == '__main__':
+    main()
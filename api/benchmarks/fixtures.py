@@ -0,0 +1,63 @@
+"""
+Synthetic resume data for benchmarks.
+
+Produces raw items shaped like a ResumeData scan (Decimals included), sized
+well beyond a real resume so per-item costs are visible.
+"""
+import random
+from decimal import Decimal
+
+_WORDS = (
+    "aws lambda dynamodb terraform python fastapi serverless api gateway cloudfront "
+    "kubernetes docker react typescript postgres redis kafka observability latency "
+    "migrated designed led built automated reduced improved scaled mentored shipped "
+    "platform pipeline infrastructure reliability cost performance security team"
+).split()
+
+# Real prose has a long-tailed vocabulary: pad the tech words with filler
+# terms and draw from a Zipf-like distribution so common words dominate
+# but most terms are rare.
+_VOCABULARY = _WORDS + [f"word{i}" for i in range(2000)]
+_WEIGHTS = [1 / (rank + 1) for rank in range(len(_VOCABULARY))]
+
+
+def _sentence(rng, words):
+    return " ".join(rng.choices(_VOCABULARY, _WEIGHTS, k=words)).capitalize() + "."
+
+
+def synthetic_items(jobs=40, accomplishments=8, education=4, skill_categories=12, seed=7):
+    """
+    Build a list of raw DynamoDB-style items.
+
+    Returns:
+        list[dict]: profile + work_experience + education + skills items
+    """
+    rng = random.Random(seed)
+    items = [{
+        'id': 'profile', 'type': 'profile', 'name': 'Bench Person', 'title': 'Engineer',
+        'summary': _sentence(rng, 30), 'professional_summary': _sentence(rng, 60),
+        'location': 'Remote', 'email': 'bench@example.com',
+    }]
+    for i in range(jobs):
+        year = 2024 - i
+        items.append({
+            'id': f'work_{i + 1:03d}', 'type': 'work_experience',
+            'job_title': f'Engineer {i}', 'company_name': f'Company {i}',
+            'start_date': f'{year}-01', 'end_date': None if i == 0 else f'{year}-12',
+            'is_current': i == 0, 'is_additional': i >= jobs - 3,
+            'description': _sentence(rng, 40),
+            'accomplishments': [_sentence(rng, 18) for _ in range(accomplishments)],
+        })
+    for i in range(education):
+        items.append({
+            'id': f'edu_{i + 1:03d}', 'type': 'education', 'degree': f'Degree {i}',
+            'institution': f'University {i}', 'start_date': str(2000 + i * 4),
+            'end_date': str(2004 + i * 4), 'description': _sentence(rng, 12),
+        })
+    for i in range(skill_categories):
+        items.append({
+            'id': f'skills_{i + 1:03d}', 'type': 'skills', 'category': f'Category {i}',
+            'skills': rng.sample(_WORDS, 8), 'sort_order': Decimal(i % 5),
+        })
+    rng.shuffle(items)
+    return items
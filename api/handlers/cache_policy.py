@@ -0,0 +1,107 @@
+"""
+CDN caching policy for API responses.
+
+Each cacheable route gets a Cache-Control header that browsers and CloudFront
+both honor:
+
+    max-age                 Browser freshness (kept short)
+    s-maxage                CloudFront freshness; load_resume.py purges early
+    stale-while-revalidate  Serve the cached copy while CloudFront refetches
+    stale-if-error          Keep serving it while the origin is failing
+
+Responses are also tagged with the data they were built from, as
+`Surrogate-Key` (space separated) and `Cache-Tag` (comma separated):
+
+    resume              Anything built from the default tenant's resume
+    resume-v<N>         The resume version a /resume response carries
+    section-<name>      Resume sections contained in the response
+    tenant-<name>       /resume/{tenant}
+    health, projects    The other cacheable routes
+
+CloudFront has no tag purge, so scripts/cdn.py maps tags back to paths.
+A tag-aware CDN can purge by the headers directly. Shared by
+middleware/cache_control.py and the raw Lambda handler.
+
+Environment:
+    CDN_TTL      s-maxage for resume responses (default 300)
+    BROWSER_TTL  max-age for resume responses (default 60)
+"""
+import os
+from handlers.resume_all import SECTIONS
+
+CDN_TTL = int(os.getenv('CDN_TTL', '300'))
+BROWSER_TTL = int(os.getenv('BROWSER_TTL', '60'))
+
+_RESUME = (f"public, max-age={BROWSER_TTL}, s-maxage={CDN_TTL}, "
+           f"stale-while-revalidate=60, stale-if-error=86400")
+
+# Route template (without the Lambda /api prefix) -> Cache-Control
+POLICIES = {
+    '/resume': _RESUME,
+    '/resume/{tenant}': _RESUME,
+    '/resume.pdf': _RESUME,
+    '/resume/search': _RESUME,
+    '/resume/search/stats': _RESUME,
+    # New versions append changes, so keep the window short
+    '/resume/changes': "public, max-age=0, s-maxage=30, stale-while-revalidate=30",
+    # Health checks must see outages, so no stale-if-error
+    '/health': "public, max-age=0, s-maxage=10",
+}
+
+_RESUME_ROUTES = ('/resume', '/resume.pdf', '/resume/search', '/resume/search/stats',
+                  '/resume/changes')
+
+
+def resume_tag(tenant=None):
+    """Purge tag for everything built from one tenant's resume (None: the default)."""
+    return 'resume' if tenant is None else f"tenant-{tenant}"
+
+
+def tags_for(route, path_params=None, section=None, version=None):
+    """
+    Surrogate keys for a response.
+
+    Args:
+        route: Route template without the /api prefix, e.g. "/resume/{tenant}"
+        path_params: Matched path parameters
+        section: Section a search was limited to, if any
+        version: Resume version the response was built from, if known
+
+    Returns:
+        list[str]: Empty for untagged routes
+    """
+    if route in _RESUME_ROUTES:
+        tags = [resume_tag()]
+        if version is not None:
+            tags.append(f"resume-v{version}")
+        tags.extend(f"section-{name}" for name in ((section,) if section else SECTIONS))
+        return tags
+    if route == '/resume/{tenant}':
+        return [resume_tag((path_params or {}).get('tenant'))]
+    if route in ('/health', '/projects'):
+        return [route[1:]]
+    return []
+
+
+def cache_headers(route, path_params=None, section=None, version=None, cache_control=True):
+    """
+    Cache-Control and tag headers for a successful GET.
+
+    Args:
+        route: Route template without the /api prefix
+        path_params: Matched path parameters
+        section: Section a search was limited to, if any
+        version: Resume version the response was built from, if known
+        cache_control: False when the route already chose its own Cache-Control
+
+    Returns:
+        dict: Empty for routes with no policy
+    """
+    headers = {}
+    if cache_control and route in POLICIES:
+        headers["Cache-Control"] = POLICIES[route]
+    tags = tags_for(route, path_params, section, version)
+    if tags:
+        headers["Surrogate-Key"] = " ".join(tags)
+        headers["Cache-Tag"] = ",".join(tags)
+    return headers
@@ -0,0 +1,248 @@
+"""
+Resume chat handler.
+
+Answers visitor questions from an in-memory BM25 index over the resume:
+profile, job descriptions, accomplishments, skills and education. The
+index is rebuilt once per resume cache rebuild (see resume_all.on_rebuild),
+so a question costs one index lookup and no DynamoDB calls.
+
+The answer backend is pluggable via CHAT_BACKEND ("module:attribute",
+naming a class or factory). The default LocalAnswerBackend is
+deterministic and fully offline.
+"""
+import heapq
+import importlib
+import logging
+import math
+import os
+import re
+import time
+from collections import Counter, defaultdict
+from handlers import metrics, resume_all, timing
+from handlers.text import tokenize
+
+logger = logging.getLogger(__name__)
+
+metrics.describe('chat_index_build_seconds', 'Time to build the chat retrieval index')
+metrics.describe('chat_retrieve_seconds', 'Time to retrieve passages for a question')
+
+TOP_K = int(os.getenv('CHAT_TOP_K', '4'))
+
+# BM25 parameters (standard defaults)
+K1 = 1.2
+B = 0.75
+
+
+class BM25Index:
+    """
+    Okapi BM25 over a list of passages.
+
+    Postings are precomputed per term, so a query only touches the
+    documents that contain at least one of its terms.
+    """
+
+    def __init__(self, passages):
+        self.passages = passages
+        self.postings = defaultdict(list)  # term → [(passage index, term frequency)]
+        self.lengths = []
+
+        for index, passage in enumerate(passages):
+            terms = tokenize(passage['text'])
+            self.lengths.append(len(terms))
+            for term, count in Counter(terms).items():
+                self.postings[term].append((index, count))
+
+        total = len(passages)
+        self.avg_length = (sum(self.lengths) / total) if total else 0.0
+        self.idf = {
+            term: math.log(1 + (total - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in self.postings.items()
+        }
+        # Per-passage length normalization, fixed once the index is built
+        self.norms = [
+            K1 * (1 - B + B * length / (self.avg_length or 1)) for length in self.lengths
+        ]
+
+    def search(self, query, k=TOP_K, ignore=()):
+        """
+        Rank passages for a query.
+
+        Args:
+            query: Free-text question
+            k: Number of passages to return
+            ignore: Terms to drop from the query (e.g. the person's name)
+
+        Returns:
+            list[tuple[float, dict]]: (score, passage), best first
+        """
+        scores = defaultdict(float)
+        norms = self.norms
+        for term in set(tokenize(query)) - set(ignore):
+            idf = self.idf.get(term)
+            if idf is None:
+                continue
+            for index, tf in self.postings[term]:
+                scores[index] += idf * tf * (K1 + 1) / (tf + norms[index])
+
+        ranked = heapq.nsmallest(k, scores.items(), key=lambda kv: (-kv[1], kv[0]))
+        return [(score, self.passages[index]) for index, score in ranked]
+
+
+def build_passages(data):
+    """
+    Flatten the resume into retrievable passages.
+
+    Returns:
+        list[dict]: {text, section, source}
+    """
+    passages = []
+    profile = data.get('profile') or {}
+
+    for field in ('title', 'summary', 'professional_summary', 'location'):
+        if profile.get(field):
+            passages.append({'text': str(profile[field]), 'section': 'profile', 'source': field})
+
+    for job in data.get('work_experience', []):
+        source = f"{job.get('job_title', '')}, {job.get('company_name', '')}"
+        dates = f"{job.get('start_date', '')} to {'present' if job.get('is_current') else job.get('end_date') or ''}"
+        passages.append({
+            'text': f"{job.get('job_title', '')} at {job.get('company_name', '')} ({dates}). {job.get('description', '')}".strip(),
+            'section': 'work_experience',
+            'source': source
+        })
+        for accomplishment in job.get('accomplishments', []):
+            passages.append({'text': accomplishment, 'section': 'work_experience', 'source': source})
+
+    for category in data.get('skills', []):
+        passages.append({
+            'text': f"{category.get('category', '')}: {', '.join(category.get('skills', []))}",
+            'section': 'skills',
+            'source': category.get('category', '')
+        })
+
+    for edu in data.get('education', []):
+        passages.append({
+            'text': f"{edu.get('degree', '')} from {edu.get('institution', '')}. {edu.get('description', '')}".strip(),
+            'section': 'education',
+            'source': edu.get('institution', '')
+        })
+
+    return passages
+
+
+# ---------------------------------------------------------------------------
+# Module-level index — rebuilt with the resume cache
+# ---------------------------------------------------------------------------
+_index = None
+_index_source = None
+_name_terms = ()
+
+
+def _rebuild_index(data):
+    global _index, _index_source, _name_terms
+    start = time.perf_counter()
+    index = BM25Index(build_passages(data))
+    elapsed = time.perf_counter() - start
+    metrics.observe('chat_index_build_seconds', elapsed)
+    logger.info("Chat index built: %d passages, %d terms in %.2fms",
+                len(index.passages), len(index.postings), elapsed * 1000)
+
+    profile = data.get('profile') or {}
+    _index, _index_source = index, data
+    _name_terms = tuple(tokenize(profile.get('name', '')))
+
+
+resume_all.on_rebuild(_rebuild_index)
+
+
+def get_index():
+    """Return the index for the current resume dataset."""
+    data = resume_all.get_all_resume_data()
+    if _index_source is not data:
+        # Cache was built before this module registered its hook
+        _rebuild_index(data)
+    return _index
+
+
+def retrieve(question, k=TOP_K):
+    """
+    Find the passages that best answer a question.
+
+    Returns:
+        list[tuple[float, dict]]: (score, passage), best first
+    """
+    index = get_index()
+    with metrics.timer('chat_retrieve_seconds'), timing.span('chat.retrieve'):
+        return index.search(question, k=k, ignore=_name_terms)
+
+
+# ---------------------------------------------------------------------------
+# Answer backends
+# ---------------------------------------------------------------------------
+
+class LocalAnswerBackend:
+    """
+    Deterministic extractive answers built from the retrieved passages.
+    No network access and no model — the same question always gets the
+    same answer for the same resume.
+    """
+
+    def answer(self, question, hits, profile):
+        """
+        Stream an answer.
+
+        Args:
+            question: The visitor's question
+            hits: (score, passage) pairs from retrieve()
+            profile: Resume profile dict
+
+        Yields:
+            str: Answer text chunks
+        """
+        name = (profile or {}).get('name', '').split(' ')[0] or 'the candidate'
+
+        if not hits:
+            text = (f"I couldn't find anything about that in {name}'s resume. "
+                    "Try asking about experience, skills, projects or education.")
+        else:
+            lines = [f"Here's what {name}'s resume says:"]
+            for _, passage in hits:
+                label = passage['source'] if passage['section'] != 'profile' else 'Profile'
+                lines.append(f"- {passage['text']} ({label})")
+            text = "\n".join(lines)
+
+        # Whitespace-preserving word chunks, like a token stream
+        yield from re.findall(r'\S+\s*', text)
+
+
+def _load_backend():
+    spec = os.getenv('CHAT_BACKEND', '')
+    if not spec:
+        return LocalAnswerBackend()
+    module_name, _, attribute = spec.partition(':')
+    factory = getattr(importlib.import_module(module_name), attribute)
+    return factory()
+
+
+_backend = None
+
+
+def get_backend():
+    """Return the configured answer backend (created on first use)."""
+    global _backend
+    if _backend is None:
+        _backend = _load_backend()
+    return _backend
+
+
+def answer_question(question):
+    """
+    Retrieve passages and stream the backend's answer.
+
+    Returns:
+        tuple: (iterator of answer chunks, list of source labels)
+    """
+    hits = retrieve(question)
+    profile = resume_all.get_all_resume_data().get('profile')
+    sources = [passage['source'] for _, passage in hits]
+    return get_backend().answer(question, hits, profile), sources
@@ -0,0 +1,140 @@
+"""
+Circuit breaker for DynamoDB calls.
+
+When DynamoDB is throttling or unreachable, retrying the scan on every
+request only adds load. After FAILURE_THRESHOLD consecutive failures the
+circuit opens. Calls then fail fast with CircuitOpenError, and callers
+serve the last good snapshot instead (see resume_all). Once
+RESET_TIMEOUT seconds have passed, one half-open probe is let through: if
+it succeeds the circuit closes, if it fails it stays open for another
+RESET_TIMEOUT.
+
+Client errors such as a bad request or a missing index don't trip the
+breaker. They say nothing about DynamoDB's health.
+
+Environment:
+    DYNAMODB_CIRCUIT_FAILURES  Consecutive failures that open the circuit (default 5)
+    DYNAMODB_CIRCUIT_RESET     Seconds before a half-open probe (default 30)
+"""
+import os
+import threading
+import time
+from botocore.exceptions import BotoCoreError, ClientError
+from handlers import metrics
+
+metrics.describe('circuit_open_total', 'Times a circuit breaker opened')
+metrics.describe('circuit_rejected_total', 'Calls failed fast while a circuit was open')
+
+CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+# Error codes that mean "DynamoDB is overloaded or failing", not "bad request"
+_FAILURE_CODES = frozenset({
+    'ProvisionedThroughputExceededException',
+    'ThrottlingException',
+    'RequestLimitExceeded',
+    'InternalServerError',
+    'ServiceUnavailable',
+})
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling DynamoDB while the circuit is open."""
+
+    def __init__(self, name, retry_after):
+        super().__init__(f"{name} circuit open; retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+def is_failure(error):
+    """Whether an exception counts against the service's health."""
+    if isinstance(error, ClientError):
+        code = error.response.get('Error', {}).get('Code', '')
+        status = error.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0)
+        return code in _FAILURE_CODES or status >= 500
+    # Connection errors, timeouts, missing credentials
+    return isinstance(error, (BotoCoreError, OSError))
+
+
+class CircuitBreaker:
+    """
+    Closed → open after consecutive failures → half-open probe → closed.
+
+    Args:
+        name: Used in errors and metric labels
+        failure_threshold: Consecutive failures that open the circuit
+        reset_timeout: Seconds to stay open before probing
+        clock: Monotonic time source (injectable for tests)
+    """
+
+    def __init__(self, name, failure_threshold, reset_timeout, clock=time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def call(self, fn, *args, **kwargs):
+        """Call fn through the breaker."""
+        probe = self._before()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            self._after(e, probe)
+            raise
+        self._after(None, probe)
+        return result
+
+    def _before(self):
+        """Admit or reject a call; returns True if it is the half-open probe."""
+        with self._lock:
+            if self.state == CLOSED:
+                return False
+            remaining = self.opened_at + self.reset_timeout - self.clock()
+            if remaining <= 0 and not self._probing:
+                # Let exactly one request probe; the rest keep failing fast
+                self.state = HALF_OPEN
+                self._probing = True
+                return True
+        metrics.inc('circuit_rejected_total', circuit=self.name)
+        raise CircuitOpenError(self.name, max(remaining, 0.0))
+
+    def _after(self, error, probe):
+        with self._lock:
+            if probe:
+                self._probing = False
+            if error is None or not is_failure(error):
+                if probe:
+                    self.state = CLOSED
+                if self.state == CLOSED:
+                    self.failures = 0
+                return
+            self.failures += 1
+            if probe or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    metrics.inc('circuit_open_total', circuit=self.name)
+                self.state = OPEN
+                self.opened_at = self.clock()
+
+    def retry_after(self):
+        """Seconds until the next probe (0 when closed)."""
+        with self._lock:
+            if self.state == CLOSED:
+                return 0.0
+            return max(self.opened_at + self.reset_timeout - self.clock(), 0.0)
+
+    def reset(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._probing = False
+
+
+dynamodb = CircuitBreaker(
+    'dynamodb',
+    failure_threshold=int(os.getenv('DYNAMODB_CIRCUIT_FAILURES', '5')),
+    reset_timeout=float(os.getenv('DYNAMODB_CIRCUIT_RESET', '30'))
+)
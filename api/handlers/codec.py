@@ -0,0 +1,206 @@
+"""
+Compressed storage for bulky resume attributes.
+
+Long `description` and `accomplishments` attributes can push an item across
+a 1 KB write-unit or 4 KB read-unit boundary. With
+`scripts/load_resume.py --compress` they are stored as DynamoDB binary
+values: a raw deflate stream primed with a preset dictionary trained on
+the resume's own text.
+
+The dictionary is stored once per load, as a `codec_dict` item next to the
+resume items. Readers find it in the same scan.
+
+Encoded value layout:
+
+    0xC1 | kind (b's' str, b'j' JSON) | dictionary id (crc32, 4 bytes) | deflate
+
+Decoding happens once per cache rebuild, in resume_all._partition(), when the
+items become records. Tables without a codec_dict item skip it entirely.
+stdlib zlib keeps the Lambda package free of a zstd dependency.
+"""
+import json
+import struct
+import zlib
+from collections import Counter
+from boto3.dynamodb.types import Binary
+
+DICT_TYPE = 'codec_dict'
+DICT_SIZE = 8 * 1024            # zlib uses at most the last 32 KB
+MIN_BYTES = 200                 # Shorter values rarely compress below their size
+COMPRESSED_ATTRIBUTES = ('description', 'accomplishments')
+
+_MAGIC = 0xC1
+_HEADER = struct.Struct('>BcI')
+_LEVEL = 9
+
+
+def _raw(value):
+    return value.value if isinstance(value, Binary) else value
+
+
+def _texts(items):
+    for item in items:
+        for name in COMPRESSED_ATTRIBUTES:
+            value = item.get(name)
+            if isinstance(value, str):
+                yield value
+            elif isinstance(value, (list, tuple)):
+                yield from (v for v in value if isinstance(v, str))
+
+
+def train_dict(texts, size=DICT_SIZE):
+    """
+    Build a zlib preset dictionary from sample text.
+
+    Picks the word runs (one to four words) that recur most, weighted by
+    length, and puts the most valuable last: deflate reaches the end of the
+    dictionary with the shortest distances.
+
+    Args:
+        texts: Sample strings (the text about to be compressed)
+        size: Maximum dictionary size in bytes
+
+    Returns:
+        bytes: The dictionary (empty when nothing recurs)
+    """
+    counts = Counter()
+    for text in texts:
+        words = text.split()
+        for n in (1, 2, 3, 4):
+            for i in range(len(words) - n + 1):
+                counts[' '.join(words[i:i + n])] += 1
+
+    scored = sorted(
+        ((count * len(phrase), phrase) for phrase, count in counts.items()
+         if count > 1 and len(phrase) > 3),
+        reverse=True
+    )
+    chosen, used = [], 0
+    for _, phrase in scored:
+        encoded = phrase.encode('utf-8') + b' '
+        if used + len(encoded) > size:
+            continue
+        chosen.append(encoded)
+        used += len(encoded)
+    return b''.join(reversed(chosen))
+
+
+def dict_id(zdict):
+    return zlib.crc32(zdict)
+
+
+def encode_value(value, zdict):
+    """
+    Compress a string or list attribute.
+
+    Returns:
+        Binary | original value: The original when compression doesn't pay
+    """
+    if isinstance(value, str):
+        kind, data = b's', value.encode('utf-8')
+    else:
+        kind, data = b'j', json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    if len(data) < MIN_BYTES:
+        return value
+
+    compressor = zlib.compressobj(_LEVEL, zlib.DEFLATED, -15, zdict=zdict) if zdict else \
+        zlib.compressobj(_LEVEL, zlib.DEFLATED, -15)
+    encoded = _HEADER.pack(_MAGIC, kind, dict_id(zdict)) + compressor.compress(data) + compressor.flush()
+    return Binary(encoded) if len(encoded) < len(data) else value
+
+
+def decode_value(value, dicts):
+    """
+    Inverse of encode_value(); other values are returned unchanged.
+
+    Args:
+        value: Attribute value as read from DynamoDB
+        dicts: {dictionary id: dictionary bytes}
+
+    Raises:
+        ValueError: The value needs a dictionary that wasn't loaded
+    """
+    data = _raw(value)
+    if not isinstance(data, (bytes, bytearray)) or len(data) < _HEADER.size or data[0] != _MAGIC:
+        return value
+
+    _, kind, zdict_id = _HEADER.unpack_from(data)
+    zdict = dicts.get(zdict_id)
+    if zdict is None:
+        raise ValueError(f"Compressed attribute needs missing codec dictionary {zdict_id}")
+    decompressor = zlib.decompressobj(-15, zdict=zdict) if zdict else zlib.decompressobj(-15)
+    text = (decompressor.decompress(data[_HEADER.size:]) + decompressor.flush()).decode('utf-8')
+    return text if kind == b's' else json.loads(text)
+
+
+def compress_items(items, zdict=None):
+    """
+    Compress the bulky attributes of raw items in place.
+
+    Args:
+        items: Items about to be written (one tenant)
+        zdict: Dictionary to use; trained on the items when None
+
+    Returns:
+        dict | None: The codec_dict item to store with them, or None when
+        nothing got smaller (items are then left untouched)
+    """
+    if zdict is None:
+        zdict = train_dict(_texts(items))
+
+    changed = False
+    for item in items:
+        for name in COMPRESSED_ATTRIBUTES:
+            if name in item:
+                encoded = encode_value(item[name], zdict)
+                if encoded is not item[name]:
+                    item[name] = encoded
+                    changed = True
+    if not changed:
+        return None
+    return {'id': DICT_TYPE, 'type': DICT_TYPE, 'dict_id': dict_id(zdict), 'zdict': Binary(zdict)}
+
+
+def decode_items(items):
+    """
+    Decompress the attributes of scanned items in place.
+
+    A no-op unless the scan returned a codec_dict item.
+
+    Returns:
+        list: The same items
+    """
+    dicts = {int(item['dict_id']): bytes(_raw(item['zdict']))
+             for item in items if item.get('type') == DICT_TYPE}
+    if not dicts:
+        return items
+    for item in items:
+        for name in COMPRESSED_ATTRIBUTES:
+            if name in item:
+                item[name] = decode_value(item[name], dicts)
+    return items
+
+
+def item_size(item):
+    """
+    Approximate DynamoDB item size in bytes: attribute names plus values.
+
+    Strings and binaries count their length, numbers roughly a byte per two
+    digits, and lists/maps 3 bytes plus 1 per element.
+    """
+    return sum(len(name.encode('utf-8')) + _value_size(value) for name, value in item.items())
+
+
+def _value_size(value):
+    value = _raw(value)
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if value is None or isinstance(value, bool):
+        return 1
+    if isinstance(value, (list, tuple)):
+        return 3 + sum(1 + _value_size(v) for v in value)
+    if isinstance(value, dict):
+        return 3 + sum(1 + len(k.encode('utf-8')) + _value_size(v) for k, v in value.items())
+    return 1 + (len(str(value).lstrip('-').replace('.', '')) + 1) // 2
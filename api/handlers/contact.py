@@ -1,9 +1,11 @@
 """
 Shared contact form handler logic.
 """
+import logging
 import os
 import boto3
 from botocore.exceptions import ClientError
+from handlers import metrics, timing
 
 try:
     import httpx  # For FastAPI async
@@ -14,6 +16,12 @@ except ImportError:
     HTTPX_AVAILABLE = False
 
 
+logger = logging.getLogger(__name__)
+
+metrics.describe('contact_submissions_total', 'Contact form submissions by result')
+metrics.describe('recaptcha_verify_seconds', 'reCAPTCHA siteverify round-trip time')
+metrics.describe('ses_send_seconds', 'SES SendEmail latency')
+
 # Initialize SES client
 AWS_REGION = os.getenv('AWS_REGION', 'us-east-1')
 AWS_ENDPOINT_URL = os.getenv('AWS_ENDPOINT_URL')  # For LocalStack
@@ -53,12 +61,20 @@ async def submit_contact_async(name, email, message, recaptcha_token):
     recaptcha_secret = os.getenv('RECAPTCHA_SECRET_KEY', '')
     
     if recaptcha_secret:
-        is_valid = await _verify_recaptcha_async(recaptcha_token, recaptcha_secret)
+        with metrics.timer('recaptcha_verify_seconds'), timing.span('recaptcha'):
+            is_valid = await _verify_recaptcha_async(recaptcha_token, recaptcha_secret)
         if not is_valid:
+            metrics.inc('contact_submissions_total', result='recaptcha_failed')
             raise ValueError('reCAPTCHA verification failed')
     
     # Send email via SES
-    await _send_email_async(name, email, message)
+    try:
+        with metrics.timer('ses_send_seconds'), timing.span('ses.send'):
+            await _send_email_async(name, email, message)
+    except Exception:
+        metrics.inc('contact_submissions_total', result='send_failed')
+        raise
+    metrics.inc('contact_submissions_total', result='success')
     
     return {
         'status': 'success',
@@ -86,12 +102,20 @@ def submit_contact_sync(name, email, message, recaptcha_token):
     recaptcha_secret = os.getenv('RECAPTCHA_SECRET_KEY', '')
     
     if recaptcha_secret:
-        is_valid = _verify_recaptcha_sync(recaptcha_token, recaptcha_secret)
+        with metrics.timer('recaptcha_verify_seconds'), timing.span('recaptcha'):
+            is_valid = _verify_recaptcha_sync(recaptcha_token, recaptcha_secret)
         if not is_valid:
+            metrics.inc('contact_submissions_total', result='recaptcha_failed')
             raise ValueError('reCAPTCHA verification failed')
     
     # Send email via SES
-    _send_email_sync(name, email, message)
+    try:
+        with metrics.timer('ses_send_seconds'), timing.span('ses.send'):
+            _send_email_sync(name, email, message)
+    except Exception:
+        metrics.inc('contact_submissions_total', result='send_failed')
+        raise
+    metrics.inc('contact_submissions_total', result='success')
     
     return {
         'status': 'success',
@@ -157,9 +181,9 @@ Sent from robrose.info contact form
             },
             ReplyToAddresses=[sender_email]
         )
-        print(f"Email sent successfully. Message ID: {response['MessageId']}")
+        logger.info("Email sent successfully. Message ID: %s", response['MessageId'])
     except ClientError as e:
-        print(f"Error sending email: {e.response['Error']['Message']}")
+        logger.error("Error sending email: %s", e.response['Error']['Message'])
         raise Exception("Failed to send email")
 
 
@@ -221,9 +245,9 @@ Sent from robrose.info contact form
             },
             ReplyToAddresses=[sender_email]
         )
-        print(f"Email sent successfully. Message ID: {response['MessageId']}")
+        logger.info("Email sent successfully. Message ID: %s", response['MessageId'])
     except ClientError as e:
-        print(f"Error sending email: {e.response['Error']['Message']}")
+        logger.error("Error sending email: %s", e.response['Error']['Message'])
         raise Exception("Failed to send email")
 
 
@@ -260,5 +284,5 @@ def _verify_recaptcha_sync(token, secret):
             result = json.loads(response.read().decode('utf-8'))
             return result.get('success', False)
     except Exception as e:
-        print(f"reCAPTCHA verification error: {e}")
+        logger.warning("reCAPTCHA verification error: %s", e)
         return False
@@ -0,0 +1,17 @@
+"""
+CORS settings shared by the FastAPI app and the raw Lambda handler.
+"""
+ALLOWED_ORIGINS = ("https://robrose.info", "https://www.robrose.info", "http://localhost:8080")
+
+
+def cors_headers(origin):
+    """
+    Response headers for a simple (non-preflight) cross-origin request,
+    matching what CORSMiddleware adds for an allowed origin.
+
+    Returns:
+        dict: Empty when the origin is missing or not allowed
+    """
+    if origin not in ALLOWED_ORIGINS:
+        return {}
+    return {"Access-Control-Allow-Origin": origin, "Access-Control-Allow-Credentials": "true"}
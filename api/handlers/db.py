@@ -1,9 +1,18 @@
 """
 DynamoDB connection helper.
 Provides functions to get DynamoDB table and client for handlers.
+
+Scans and queries go through the DynamoDB circuit breaker (handlers/circuit.py),
+so an overloaded table fails fast instead of being retried by every request.
 """
 import os
+import time
 import boto3
+from handlers import circuit, metrics, timing
+
+metrics.describe('dynamodb_scan_seconds', 'Latency of a single DynamoDB Scan page')
+metrics.describe('dynamodb_scan_items_total', 'Items returned by DynamoDB scans')
+metrics.describe('dynamodb_query_seconds', 'Latency of a single DynamoDB Query page')
 
 
 def get_dynamodb_table():
@@ -61,3 +70,93 @@ def get_dynamodb_client():
             'dynamodb',
             region_name=os.getenv('AWS_REGION', 'us-east-1')
         )
+
+
+def scan_pages(table, **kwargs):
+    """
+    Scan a table page by page, following LastEvaluatedKey.
+
+    Each Scan call is timed into the dynamodb_scan_seconds histogram and
+    the request's dynamodb.scan Server-Timing span.
+
+    Raises:
+        circuit.CircuitOpenError: DynamoDB is failing; no call was made
+
+    Args:
+        table: boto3 Table resource
+        **kwargs: Extra Scan parameters
+
+    Yields:
+        list: Items from one Scan page
+    """
+    while True:
+        start = time.perf_counter()
+        response = circuit.dynamodb.call(table.scan, **kwargs)
+        elapsed = time.perf_counter() - start
+        metrics.observe('dynamodb_scan_seconds', elapsed)
+        timing.record('dynamodb.scan', elapsed)
+
+        items = response.get('Items', [])
+        metrics.inc('dynamodb_scan_items_total', len(items))
+        yield items
+
+        if 'LastEvaluatedKey' not in response:
+            break
+        kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def scan_all(table, **kwargs):
+    """
+    Scan every page of a table.
+
+    Returns:
+        list: All items
+    """
+    items = []
+    for page in scan_pages(table, **kwargs):
+        items.extend(page)
+    return items
+
+
+def query_pages(table, **kwargs):
+    """
+    Run a Query page by page, following LastEvaluatedKey.
+
+    Each Query call is timed into the dynamodb_query_seconds histogram and
+    the request's dynamodb.query Server-Timing span.
+
+    Raises:
+        circuit.CircuitOpenError: DynamoDB is failing; no call was made
+
+    Args:
+        table: boto3 Table resource
+        **kwargs: Query parameters
+
+    Yields:
+        list: Items from one Query page
+    """
+    while True:
+        start = time.perf_counter()
+        response = circuit.dynamodb.call(table.query, **kwargs)
+        elapsed = time.perf_counter() - start
+        metrics.observe('dynamodb_query_seconds', elapsed)
+        timing.record('dynamodb.query', elapsed)
+
+        yield response.get('Items', [])
+
+        if 'LastEvaluatedKey' not in response:
+            break
+        kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def query_all(table, **kwargs):
+    """
+    Run a Query and follow LastEvaluatedKey through every page.
+
+    Returns:
+        list: All items
+    """
+    items = []
+    for page in query_pages(table, **kwargs):
+        items.extend(page)
+    return items
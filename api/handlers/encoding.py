@@ -0,0 +1,77 @@
+"""
+JSON encoding for API payloads.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Both understand the typed records in handlers/records.py and
+any Decimals that remain.
+"""
+import json
+from decimal import Decimal
+from handlers import memprof
+from handlers.records import Record
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(value):
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def dumps(value):
+    """
+    Encode a value as compact JSON.
+
+    Returns:
+        bytes: UTF-8 JSON
+    """
+    if ORJSON_AVAILABLE:
+        # Records are dataclasses; route them through to_dict() for the API shape
+        return orjson.dumps(value, default=_default, option=orjson.OPT_PASSTHROUGH_DATACLASS)
+    return json.dumps(value, default=_default, separators=(',', ':'),
+                      ensure_ascii=False).encode('utf-8')
+
+
+def loads(data):
+    """
+    Decode JSON from bytes or a buffer (e.g. a memoryview of a mapped file).
+
+    Returns:
+        The decoded value
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+
+# Single-slot memo: the last dataset encoded and its bytes
+_last = (None, None)
+
+
+def dumps_cached(data):
+    """
+    Encode a dataset once and reuse the bytes while it is the same object.
+
+    The resume cache hands out the same dict until it is rebuilt, so this
+    turns per-request encoding into an identity check.
+    """
+    global _last
+    source, body = _last
+    if source is not data:
+        with memprof.phase('encode'):
+            body = dumps(data)
+        _last = (data, body)
+    return body
+
+
+def prime(data, body):
+    """Seed dumps_cached with bytes already encoded elsewhere (e.g. a shared snapshot)."""
+    global _last
+    _last = (data, body)
@@ -1,6 +1,7 @@
 """
 Shared health check handler logic.
 """
+from handlers import circuit
 from handlers.db import get_dynamodb_client
 
 def health_check():
@@ -23,4 +24,7 @@ def health_check():
         health_status["services"]["dynamodb"] = f"error: {str(e)}"
         health_status["status"] = "unhealthy"
 
+    # Breaker state for the data layer: "open" means /resume is serving stale data
+    health_status["circuit"] = {"dynamodb": circuit.dynamodb.state}
+
     return health_status
@@ -0,0 +1,307 @@
+"""
+Opt-in memory and allocation profiling (MEMPROF=1).
+
+Built on tracemalloc and gc stats. Named phases record, per call:
+
+    peak       Highest traced memory above the phase's starting point
+               (transient garbage included: scan pages, encode buffers)
+    retained   Traced memory still held when the phase ends
+               (the cache itself, module state, leaks)
+    gc         Garbage collections that ran during the phase
+
+Phases are the cache build (resume_all), serialization (encoding, pdf)
+and each route (middleware/memprof.py). Phases can nest: an outer phase's
+peak includes its inner phases'. Phases with sites=True also keep the top
+allocation sites of their last call when MEMPROF_SITES=1 (two snapshots
+per call, which takes seconds once the imports are traced). report() adds process-wide figures:
+traced bytes by package (boto3, botocore, fastapi, the app, ...), the top
+allocation sites and the max RSS, which is what memory_size has to cover.
+
+Served by GET /debug/memory (signed X-Debug-Profile token required, so
+PROFILE_SECRET must be set) and printed by benchmarks/bench_memory.py.
+
+tracemalloc only sees allocations made after start(), so main.py and
+lambda_handler.py start it before their other imports. Tracing slows
+allocation-heavy code down several times and the figures are process-wide
+(concurrent requests show up in each other's phases), so this is for
+debugging and right-sizing, not for production traffic. When tracing is off
+phase() is a shared no-op context manager.
+
+Environment:
+    MEMPROF         Set to 1 to trace (default off)
+    MEMPROF_FRAMES  Stack frames kept per allocation (default 1; more
+                    frames cost more memory and time)
+    MEMPROF_SITES   Set to 1 to keep top allocation sites per phase
+"""
+import gc
+import os
+import resource
+import sys
+import threading
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+ENABLED = os.getenv('MEMPROF', '') == '1'
+FRAMES = int(os.getenv('MEMPROF_FRAMES', '1'))
+SITES = os.getenv('MEMPROF_SITES', '') == '1'
+TOP_SITES = 10
+
+# Deployed on Lambda, dependencies sit next to the app code
+_APP_ROOT = Path(__file__).resolve().parent.parent
+_APP_PACKAGES = ('handlers', 'routers', 'middleware', 'main.py', 'lambda_handler.py',
+                 'logging_config.py', 'seed.py')
+# Grouped statistics from these files are dropped. (Snapshot.filter_traces
+# matches every trace in Python and takes seconds after the imports.)
+_IGNORED = (tracemalloc.__file__, __file__, '<unknown>')
+
+_NULL = nullcontext()
+_lock = threading.Lock()
+_active = False
+_stack = []
+_phases = {}
+_process_peak = 0
+
+
+class _Frame:
+    """An open phase."""
+
+    __slots__ = ('start', 'peak', 'collections', 'snapshot')
+
+    def __init__(self, start, collections, snapshot):
+        self.start = start
+        self.peak = start
+        self.collections = collections
+        self.snapshot = snapshot
+
+
+def enabled():
+    """Whether MEMPROF asked for tracing."""
+    return ENABLED
+
+
+def start(frames=None):
+    """Start tracing allocations (idempotent)."""
+    global _active
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames or FRAMES)
+    _active = True
+
+
+def stop():
+    """Stop tracing and forget all phases."""
+    global _active
+    _active = False
+    tracemalloc.stop()
+    reset()
+
+
+def reset():
+    """Forget recorded phases (tracing continues)."""
+    global _process_peak
+    with _lock:
+        _stack.clear()
+        _phases.clear()
+        _process_peak = 0
+
+
+def phase(name, sites=False):
+    """
+    Measure a block as a named phase.
+
+    Args:
+        name: Phase name, e.g. "cache.build"
+        sites: Also keep the top allocation sites, if MEMPROF_SITES is set
+    """
+    if not _active:
+        return _NULL
+    return _phase(name, sites)
+
+
+@contextmanager
+def _phase(name, sites):
+    frame = begin(sites)
+    try:
+        yield
+    finally:
+        end(frame, name)
+
+
+def begin(sites=False):
+    """
+    Open a phase whose name is only known at the end (see end()).
+
+    Returns:
+        _Frame or None: None when tracing is off
+    """
+    if not _active:
+        return None
+    with _lock:
+        _note_peak(tracemalloc.get_traced_memory()[1])
+        snapshot = _untraced(tracemalloc.take_snapshot) if sites and SITES else None
+        tracemalloc.reset_peak()
+        frame = _Frame(tracemalloc.get_traced_memory()[0], _collections(), snapshot)
+        _stack.append(frame)
+    return frame
+
+
+def end(frame, name):
+    """Close a phase opened with begin() and record it under name."""
+    if frame is None or not _active:
+        return
+    with _lock:
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(frame.peak, peak)
+        if frame in _stack:
+            _stack.remove(frame)
+        _note_peak(peak)
+        stats = _phases.setdefault(name, {
+            'calls': 0, 'peak_bytes': 0, 'last_peak_bytes': 0, 'retained_bytes': 0,
+            'retained_bytes_total': 0, 'gc_collections': 0, 'top_sites': [],
+        })
+        stats['calls'] += 1
+        stats['last_peak_bytes'] = peak - frame.start
+        stats['peak_bytes'] = max(stats['peak_bytes'], peak - frame.start)
+        stats['retained_bytes'] = current - frame.start
+        stats['retained_bytes_total'] += current - frame.start
+        stats['gc_collections'] += _collections() - frame.collections
+        if frame.snapshot is not None:
+            stats['top_sites'] = _untraced(_grown_sites, frame.snapshot)
+            frame.snapshot = None
+
+
+def _untraced(fn, *args):
+    # Caller holds _lock and has noted the peak. Snapshots allocate heavily:
+    # keep that out of the open phases' peaks and gc counts
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        return fn(*args)
+    finally:
+        if collecting:
+            gc.enable()
+        tracemalloc.reset_peak()
+
+
+def _grown_sites(before):
+    diff = _kept(tracemalloc.take_snapshot().compare_to(before, 'lineno'))
+    return [
+        {'site': _site(stat.traceback), 'size_bytes': stat.size_diff, 'count': stat.count_diff}
+        for stat in diff[:TOP_SITES] if stat.size_diff > 0
+    ]
+
+
+def _note_peak(peak):
+    # Caller holds _lock. The peak about to be reset still counts for every open phase
+    global _process_peak
+    _process_peak = max(_process_peak, peak)
+    for frame in _stack:
+        frame.peak = max(frame.peak, peak)
+
+
+def _kept(statistics):
+    return [stat for stat in statistics if stat.traceback[0].filename not in _IGNORED]
+
+
+def _collections():
+    return sum(generation['collections'] for generation in gc.get_stats())
+
+
+def _site(traceback):
+    frame = traceback[0]
+    return f"{_relative(frame.filename)}:{frame.lineno}"
+
+
+def _relative(filename):
+    path = Path(filename)
+    try:
+        return str(path.relative_to(_APP_ROOT))
+    except ValueError:
+        pass
+    parts = path.parts
+    if 'site-packages' in parts:
+        return str(Path(*parts[parts.index('site-packages') + 1:]))
+    return filename
+
+
+def package_of(filename):
+    """
+    Group an allocation's file into the package that owns it.
+
+    Returns:
+        str: "app" for the API's own code, a dependency's top-level package
+        (e.g. "botocore"), or "python" for the standard library
+    """
+    path = Path(_relative(filename))
+    if path.is_absolute() or filename.startswith('<'):
+        return 'python'
+    top = path.parts[0]
+    if top in _APP_PACKAGES:
+        return 'app'
+    return top.split('.', 1)[0]
+
+
+def phases():
+    """
+    Stats per phase, without the process-wide snapshot report() takes.
+
+    Returns:
+        dict: phase name -> calls, peak/retained bytes, gc collections, top sites
+    """
+    with _lock:
+        return {name: {**stats, 'top_sites': list(stats['top_sites'])}
+                for name, stats in _phases.items()}
+
+
+def max_rss_bytes():
+    """Peak resident set size of this process, the figure Lambda bills memory against."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def report(limit=TOP_SITES):
+    """
+    Everything recorded so far, for /debug/memory and the benchmarks.
+
+    Args:
+        limit: Number of packages and allocation sites to list
+
+    Returns:
+        dict: enabled, traced/peak/RSS bytes, gc stats, phases, by_package, top_sites
+    """
+    gc_stats = gc.get_stats()
+    result = {
+        'enabled': _active,
+        'max_rss_bytes': max_rss_bytes(),
+        'gc': {
+            'counts': list(gc.get_count()),
+            'collections': [generation['collections'] for generation in gc_stats],
+            'collected': [generation['collected'] for generation in gc_stats],
+            'uncollectable': [generation['uncollectable'] for generation in gc_stats],
+        },
+    }
+    if not _active:
+        return result
+
+    snapshot = tracemalloc.take_snapshot()
+    with _lock:
+        current, peak = tracemalloc.get_traced_memory()
+        result['traced_bytes'] = current
+        result['traced_peak_bytes'] = max(_process_peak, peak)
+
+    result['phases'] = phases()
+
+    packages = {}
+    for stat in _kept(snapshot.statistics('filename')):
+        package = package_of(stat.traceback[0].filename)
+        packages[package] = packages.get(package, 0) + stat.size
+    result['by_package'] = [
+        {'package': package, 'size_bytes': size}
+        for package, size in sorted(packages.items(), key=lambda kv: -kv[1])[:limit]
+    ]
+    result['top_sites'] = [
+        {'site': _site(stat.traceback), 'size_bytes': stat.size, 'count': stat.count}
+        for stat in _kept(snapshot.statistics('lineno'))[:limit]
+    ]
+    return result
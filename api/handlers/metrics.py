@@ -0,0 +1,236 @@
+"""
+In-process metrics registry.
+
+Counters and latency histograms are kept in plain dicts guarded by a lock.
+Under uvicorn they are exposed as Prometheus text on /metrics; under Lambda
+each request's observations are flushed as CloudWatch Embedded Metric
+Format (EMF) log lines, one per label set, so CloudWatch extracts them with
+no extra API calls.
+"""
+import json
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+IS_LAMBDA = os.getenv('AWS_LAMBDA_FUNCTION_NAME') is not None
+EMF_NAMESPACE = os.getenv('METRICS_NAMESPACE', 'AwsServerlessResume')
+
+# Latency buckets in seconds (Prometheus "le" bounds)
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# ---------------------------------------------------------------------------
+# Module-level registry — (name, sorted label items) → value
+# ---------------------------------------------------------------------------
+_lock = threading.Lock()
+_counters = {}
+_histograms = {}
+_help = {}
+
+# Per-request EMF buffer (Lambda only); None outside a request
+_emf_buffer = ContextVar('emf_buffer', default=None)
+
+
+def _key(name, labels):
+    return (name, tuple(sorted(labels.items())) if labels else ())
+
+
+def describe(name, text):
+    """Register the HELP text shown for a metric on /metrics."""
+    _help[name] = text
+
+
+def inc(name, value=1, **labels):
+    """
+    Increment a counter.
+
+    Args:
+        name: Metric name, e.g. "resume_cache_hits_total"
+        value: Amount to add
+        **labels: Prometheus labels / EMF dimensions
+    """
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+    if IS_LAMBDA:
+        _record_emf(name, value, 'Count', labels)
+
+
+def observe(name, value, **labels):
+    """
+    Record a latency observation (seconds) into a histogram.
+
+    Args:
+        name: Metric name, e.g. "dynamodb_scan_seconds"
+        value: Observed duration in seconds
+        **labels: Prometheus labels / EMF dimensions
+    """
+    key = _key(name, labels)
+    index = bisect_left(DEFAULT_BUCKETS, value)
+    with _lock:
+        hist = _histograms.get(key)
+        if hist is None:
+            # [per-bucket counts..., +Inf count], sum
+            hist = _histograms[key] = [[0] * (len(DEFAULT_BUCKETS) + 1), 0.0]
+        hist[0][index] += 1
+        hist[1] += value
+    if IS_LAMBDA:
+        _record_emf(name, value * 1000, 'Milliseconds', labels)
+
+
+@contextmanager
+def timer(name, **labels):
+    """Context manager that observes the elapsed time of its block."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, **labels)
+
+
+def render_prometheus():
+    """
+    Render the registry in Prometheus text exposition format.
+
+    Returns:
+        str: Exposition body for GET /metrics
+    """
+    with _lock:
+        counters = dict(_counters)
+        histograms = {k: ([*v[0]], v[1]) for k, v in _histograms.items()}
+
+    lines = []
+    seen = set()
+
+    def header(name, kind):
+        if name not in seen:
+            seen.add(name)
+            if name in _help:
+                lines.append(f"# HELP {name} {_help[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+    for (name, labels), value in sorted(counters.items()):
+        header(name, 'counter')
+        lines.append(f"{name}{_format_labels(labels)} {value}")
+
+    for (name, labels), (buckets, total) in sorted(histograms.items()):
+        header(name, 'histogram')
+        cumulative = 0
+        for bound, count in zip(DEFAULT_BUCKETS, buckets):
+            cumulative += count
+            le = _format_labels(labels + (('le', repr(bound)),))
+            lines.append(f"{name}_bucket{le} {cumulative}")
+        cumulative += buckets[-1]
+        le = _format_labels(labels + (('le', '+Inf'),))
+        lines.append(f"{name}_bucket{le} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {total}")
+        lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    body = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+    return "{" + body + "}"
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# ---------------------------------------------------------------------------
+# CloudWatch Embedded Metric Format (Lambda)
+# ---------------------------------------------------------------------------
+
+@contextmanager
+def emf_request(dimensions):
+    """
+    Collect every metric recorded inside the block and flush them when it
+    exits: one EMF log line per distinct label set, with the labels added
+    to the request dimensions. No-op outside Lambda.
+
+    Args:
+        dimensions: dict of EMF dimensions, read at flush time so callers
+            can fill it in once the route is known
+    """
+    if not IS_LAMBDA:
+        yield
+        return
+    buffer = []
+    token = _emf_buffer.set(buffer)
+    try:
+        yield
+    finally:
+        _emf_buffer.reset(token)
+        if buffer:
+            _flush_emf(buffer, dimensions)
+
+
+def _record_emf(name, value, unit, labels):
+    buffer = _emf_buffer.get()
+    if buffer is None:
+        # Recorded outside a request (e.g. a warm-up build) — flush now
+        _write_emf([(name, value, unit)], labels)
+    else:
+        buffer.append((name, value, unit, labels))
+
+
+def _flush_emf(buffer, dimensions):
+    # Labels are dimensions too: metrics with different labels (result=success
+    # vs result=send_failed) must not share a record
+    groups = {}
+    for name, value, unit, labels in buffer:
+        key = _key(name, labels)[1]
+        groups.setdefault(key, []).append((name, value, unit))
+    for labels, entries in groups.items():
+        _write_emf(entries, {**dimensions, **dict(labels)})
+
+
+def _write_emf(entries, dimensions):
+    sys.stdout.write(json.dumps(build_emf(entries, dimensions)) + "\n")
+
+
+def build_emf(entries, dimensions):
+    """
+    Build an EMF document from (name, value, unit) entries.
+
+    Repeated names are emitted as value arrays, which EMF supports natively.
+
+    Returns:
+        dict: JSON-serializable EMF record
+    """
+    values = {}
+    units = {}
+    for name, value, unit in entries:
+        values.setdefault(name, []).append(value)
+        units[name] = unit
+
+    record = {
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [{
+                "Namespace": EMF_NAMESPACE,
+                "Dimensions": [sorted(dimensions)] if dimensions else [[]],
+                "Metrics": [{"Name": n, "Unit": units[n]} for n in values],
+            }],
+        },
+    }
+    record.update({k: str(v) for k, v in dimensions.items()})
+    for name, vals in values.items():
+        record[name] = vals[0] if len(vals) == 1 else vals
+    return record
+
+
+def reset():
+    """Clear all recorded metrics (tests and benchmarks)."""
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
@@ -0,0 +1,90 @@
+"""
+Display order of resume sections, computed at ingest time.
+
+scripts/load_resume.py stores a per-type `rank` on every item (0 = shown
+first), so the read path in handlers/resume_all.py drops each record
+straight into its slot instead of sorting on every cache rebuild.
+sort_section() is the one definition of that order. It is used both to
+assign the ranks and as the read-path fallback for items loaded before
+ranks existed.
+
+Dates are normalized to ISO strings ("2021-03", "2016") when loading, so
+comparing them as strings orders them chronologically.
+"""
+from datetime import date, datetime
+
+# Sections whose items carry a rank (the profile is a single item)
+RANKED_SECTIONS = ("work_experience", "education", "skills")
+
+
+def _sort_order(item):
+    try:
+        return int(item.get('sort_order', 999))
+    except (TypeError, ValueError):
+        return 999
+
+
+def sort_section(section, items):
+    """
+    Items of one section in display order.
+
+    Works on raw items and on typed records alike (both support .get).
+
+    Args:
+        section: "work_experience", "education" or "skills"
+        items: Items of that section, in scan (or sheet) order
+
+    Returns:
+        list: A new list in display order
+    """
+    items = list(items)
+    if section == 'work_experience':
+        # Current jobs first, then by start date descending (two stable passes)
+        items.sort(key=lambda x: x.get('start_date') or '', reverse=True)
+        items.sort(key=lambda x: not x.get('is_current'))
+    elif section == 'education':
+        # Most recent first
+        items.sort(key=lambda x: x.get('start_date') or '', reverse=True)
+    elif section == 'skills':
+        # By sort_order, then category name
+        items.sort(key=lambda x: (_sort_order(x), x.get('category') or ''))
+    return items
+
+
+def assign_ranks(items):
+    """
+    Set `rank` on every ranked item: its position within its section.
+
+    Args:
+        items: Raw items of one tenant (any types, any order)
+
+    Returns:
+        list: The same items, updated in place
+    """
+    for section in RANKED_SECTIONS:
+        ordered = sort_section(section, (item for item in items if item.get('type') == section))
+        for rank, item in enumerate(ordered):
+            item['rank'] = rank
+    return items
+
+
+def iso_date(value):
+    """
+    Normalize a spreadsheet date cell to an ISO string.
+
+    Dates become "YYYY-MM", whole-number years become "YYYY", and
+    anything else is kept as trimmed text. Empty cells give None.
+    """
+    if value is None or value != value:  # NaN and pandas NaT
+        return None
+    if isinstance(value, (datetime, date)):
+        return value.strftime('%Y-%m')
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    text = str(value).strip()
+    if not text or text.lower() in ('nan', 'nat', 'none'):
+        return None
+    # "2021-03-01" or "2021-03-01 00:00:00" from a date-typed cell
+    if len(text) >= 10 and text[4] == '-' and text[7] == '-' and text[:4].isdigit():
+        return text[:7]
+    return text
@@ -0,0 +1,438 @@
+"""
+Downloadable resume PDF, rendered from the cached dataset.
+
+A small pure-Python PDF writer: the standard Helvetica fonts (no embedding,
+so no font files), Flate-compressed page streams, US Letter pages. The
+layout follows the site's sections: header, summary, experience (plus
+a compact "Additional Experience" list), education and skills.
+
+PDFs are content-addressed: the key is a hash of the encoded /resume payload
+(plus the renderer version), so each dataset is rendered once and the key
+doubles as the ETag. Rendered files are kept in memory and on local disk
+(PDF_CACHE_DIR, /tmp on Lambda), so other workers and warm Lambda instances
+reuse them. Concurrent misses for the same key render once. The disk tier
+keeps the PDF_DISK_ENTRIES most recently used files, like the memory LRU,
+so /tmp does not fill up with one file per dataset version.
+
+Environment:
+    PDF_CACHE_DIR     Disk cache directory (default <tempdir>/resume-pdf)
+    PDF_DISK_ENTRIES  PDFs kept on disk (default 8)
+"""
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+from itertools import repeat
+from handlers import encoding, memprof, metrics, timing
+
+logger = logging.getLogger(__name__)
+
+metrics.describe('pdf_renders_total', 'Resume PDFs rendered')
+metrics.describe('pdf_render_seconds', 'Time to render the resume PDF')
+metrics.describe('pdf_cache_hits_total', 'Resume PDFs served from cache, by tier')
+
+RENDERER_VERSION = b'1'
+CACHE_DIR = os.getenv('PDF_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'resume-pdf'))
+MEMORY_ENTRIES = 4
+DISK_ENTRIES = int(os.getenv('PDF_DISK_ENTRIES', '8'))
+
+_memory = OrderedDict()         # key → PDF bytes, most recent last
+_rendering = {}                 # key → lock held while that key renders
+_lock = threading.Lock()
+_last_key = (None, None)        # (dataset, key): hash once per dataset object
+
+# ---------------------------------------------------------------------------
+# Fonts: Helvetica / Helvetica-Bold advance widths (1/1000 em), ASCII 32–126
+# ---------------------------------------------------------------------------
+_REGULAR = 'F1'
+_BOLD = 'F2'
+
+_WIDTHS = {
+    _REGULAR: (
+        278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+        556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+        1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+        667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+        333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+        556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+    ),
+    _BOLD: (
+        278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+        556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+        975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+        667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+        333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+        611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+    ),
+}
+
+# Widths of the typographic characters WinAnsiEncoding (cp1252) adds to Latin-1
+_EXTRA_WIDTHS = {'•': 350, '–': 556, '—': 1000, '‘': 222, '’': 222, '“': 333, '”': 333, '…': 1000}
+_DEFAULT_WIDTH = 556
+
+# Per font: character → width, for a map() over the text
+_CHAR_WIDTHS = {
+    font: {**{chr(32 + i): w for i, w in enumerate(widths)}, **_EXTRA_WIDTHS}
+    for font, widths in _WIDTHS.items()
+}
+
+# Control characters (tabs, stray newlines) print as spaces
+_CONTROL = {code: ' ' for code in range(32)}
+
+
+def _encode(text):
+    """Text as WinAnsi bytes; characters the base fonts lack become '?'."""
+    return text.translate(_CONTROL).encode('cp1252', 'replace')
+
+
+def text_width(text, font, size):
+    """Width of a line of text in points."""
+    return sum(map(_CHAR_WIDTHS[font].get, text, repeat(_DEFAULT_WIDTH))) * size / 1000
+
+
+def wrap(text, font, size, width, first_width=None):
+    """
+    Greedy word wrap.
+
+    Args:
+        first_width: Width of the first line, when it has a prefix
+
+    Returns:
+        list[str]: Lines (a word longer than a line gets a line to itself)
+    """
+    lines, line, line_width = [], '', 0.0
+    limit = width if first_width is None else first_width
+    space = text_width(' ', font, size)
+    for word in str(text).split():
+        word_width = text_width(word, font, size)
+        if line and line_width + space + word_width > limit:
+            lines.append(line)
+            line, line_width, limit = word, word_width, width
+        elif line:
+            line, line_width = f"{line} {word}", line_width + space + word_width
+        else:
+            line, line_width = word, word_width
+    if line:
+        lines.append(line)
+    return lines
+
+
+# ---------------------------------------------------------------------------
+# Layout
+# ---------------------------------------------------------------------------
+PAGE_WIDTH, PAGE_HEIGHT = 612, 792      # US Letter
+MARGIN = 54
+CONTENT_WIDTH = PAGE_WIDTH - 2 * MARGIN
+_GREY = '0.35 g'
+
+
+def _escape(data):
+    return data.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+
+
+class _Document:
+    """Pages of content-stream operators, filled top to bottom."""
+
+    def __init__(self):
+        self.pages = []
+        self._new_page()
+
+    def _new_page(self):
+        self.ops = []
+        self.pages.append(self.ops)
+        self.y = PAGE_HEIGHT - MARGIN
+
+    def need(self, height):
+        """Start a new page unless `height` points still fit."""
+        if self.y - height < MARGIN:
+            self._new_page()
+
+    def text(self, text, font=_REGULAR, size=10, x=MARGIN, color=None):
+        if color:
+            self.ops.append(color.encode())
+        self.ops.append(b'BT /%s %g Tf %.2f %.2f Td (%s) Tj ET' % (
+            font.encode(), size, x, self.y, _escape(_encode(text))))
+        if color:
+            self.ops.append(b'0 g')
+
+    def right(self, text, font=_REGULAR, size=10, color=None):
+        self.text(text, font, size, PAGE_WIDTH - MARGIN - text_width(text, font, size), color)
+
+    def advance(self, points):
+        self.y -= points
+
+    def paragraph(self, text, size=10, indent=0, leading=1.35, bullet=None):
+        """Wrapped text; a bullet hangs in the indent."""
+        width = CONTENT_WIDTH - indent
+        for i, line in enumerate(wrap(text, _REGULAR, size, width)):
+            self.need(size * leading)
+            self.advance(size * leading)
+            if bullet and i == 0:
+                self.text(bullet, size=size, x=MARGIN + indent - 10)
+            self.text(line, size=size, x=MARGIN + indent)
+
+    def heading(self, title):
+        self.need(40)
+        self.advance(22)
+        self.text(title.upper(), _BOLD, 11)
+        self.advance(5)
+        self.ops.append(b'0.5 w %d %.2f m %d %.2f l S' % (MARGIN, self.y, PAGE_WIDTH - MARGIN, self.y))
+        self.advance(2)
+
+
+def _date_range(start, end, is_current=False):
+    end = 'Present' if is_current else end
+    if start and end:
+        return f"{start} – {end}"
+    return start or end or ''
+
+
+def _layout(data):
+    doc = _Document()
+    profile = data.get('profile') or {}
+
+    doc.advance(12)
+    doc.text(profile.get('name') or 'Resume', _BOLD, 22)
+    if profile.get('title'):
+        doc.advance(18)
+        doc.text(profile['title'], size=12, color=_GREY)
+    contact = [profile.get(k) for k in ('location', 'email', 'linkedin', 'github') if profile.get(k)]
+    for line in wrap(' • '.join(contact), _REGULAR, 9, CONTENT_WIDTH):
+        doc.advance(14)
+        doc.text(line, size=9, color=_GREY)
+
+    summary = profile.get('professional_summary') or profile.get('summary')
+    if summary:
+        doc.heading('Summary')
+        doc.paragraph(summary)
+
+    jobs = data.get('work_experience') or []
+    main = [job for job in jobs if not job.get('is_additional')]
+    additional = [job for job in jobs if job.get('is_additional')]
+    if main:
+        doc.heading('Experience')
+        for job in main:
+            doc.need(48)
+            doc.advance(16)
+            doc.text(job.get('job_title', ''), _BOLD, 11)
+            doc.right(_date_range(job.get('start_date'), job.get('end_date'), job.get('is_current')),
+                      size=9, color=_GREY)
+            doc.advance(13)
+            doc.text(job.get('company_name', ''), size=10, color=_GREY)
+            if job.get('description'):
+                doc.paragraph(job['description'])
+            for accomplishment in job.get('accomplishments') or ():
+                doc.paragraph(accomplishment, indent=14, bullet='•')
+    if additional:
+        doc.heading('Additional Experience')
+        for job in additional:
+            years = _date_range((job.get('start_date') or '')[:4], (job.get('end_date') or '')[:4],
+                                job.get('is_current'))
+            line = f"{job.get('job_title', '')}, {job.get('company_name', '')}"
+            doc.paragraph(f"{line} ({years})" if years else line, indent=14, bullet='•')
+
+    education = data.get('education') or []
+    if education:
+        doc.heading('Education')
+        for edu in education:
+            doc.need(32)
+            doc.advance(16)
+            doc.text(edu.get('degree', ''), _BOLD, 11)
+            doc.right(_date_range(edu.get('start_date'), edu.get('end_date')), size=9, color=_GREY)
+            doc.advance(13)
+            doc.text(edu.get('institution', ''), size=10, color=_GREY)
+            if edu.get('description'):
+                doc.paragraph(edu['description'])
+
+    skills = data.get('skills') or []
+    if skills:
+        doc.heading('Skills')
+        for category in skills:
+            label = f"{category.get('category', '')}: "
+            offset = text_width(label, _BOLD, 10)
+            lines = wrap(', '.join(category.get('skills') or ()), _REGULAR, 10,
+                         CONTENT_WIDTH, first_width=CONTENT_WIDTH - offset)
+            doc.need(14)
+            doc.advance(14)
+            doc.text(label, _BOLD, 10)
+            for i, line in enumerate(lines):
+                if i:
+                    doc.need(13.5)
+                    doc.advance(13.5)
+                doc.text(line, size=10, x=MARGIN + (offset if i == 0 else 0))
+    return doc.pages, profile.get('name')
+
+
+# ---------------------------------------------------------------------------
+# PDF file structure
+# ---------------------------------------------------------------------------
+
+def _serialize(pages, title=None):
+    """Assemble catalog, fonts, pages and the xref table into PDF bytes."""
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        None,  # Pages, once the page object numbers are known
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>',
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>',
+        b'<< /Producer (aws-serverless-resume)%s >>' % (
+            b' /Title (%s)' % _escape(_encode(title)) if title else b''),
+    ]
+    kids = []
+    for ops in pages:
+        stream = zlib.compress(b'\n'.join(ops), 6)
+        objects.append(b'<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream' % (len(stream), stream))
+        objects.append(b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] '
+                       b'/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents %d 0 R >>'
+                       % (PAGE_WIDTH, PAGE_HEIGHT, len(objects)))
+        kids.append(b'%d 0 R' % len(objects))
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (b' '.join(kids), len(kids))
+
+    out = bytearray(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    out += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    out += b'trailer\n<< /Size %d /Root 1 0 R /Info 5 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (
+        len(objects) + 1, xref)
+    return bytes(out)
+
+
+def render(data):
+    """
+    Render a resume dataset to PDF bytes. Deterministic: the same data
+    gives the same bytes.
+    """
+    pages, title = _layout(data)
+    return _serialize(pages, title)
+
+
+# ---------------------------------------------------------------------------
+# Content-addressed cache
+# ---------------------------------------------------------------------------
+
+def content_key(data):
+    """Hex key (and ETag) for a dataset: hash of its encoded /resume payload."""
+    global _last_key
+    source, key = _last_key
+    if source is not data:
+        key = hashlib.sha256(RENDERER_VERSION + b'\0' + encoding.dumps_cached(data)).hexdigest()[:32]
+        _last_key = (data, key)
+    return key
+
+
+def _disk_path(key):
+    return os.path.join(CACHE_DIR, f"{key}.pdf")
+
+
+def _read_disk(key):
+    path = _disk_path(key)
+    try:
+        with open(path, 'rb') as f:
+            body = f.read()
+    except OSError:
+        return None
+    try:
+        # Most recently used, for _prune_disk
+        os.utime(path)
+    except OSError:
+        pass
+    return body
+
+
+def _write_disk(key, body):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(body)
+        os.replace(tmp, _disk_path(key))
+    except OSError as e:
+        logger.warning("Could not write PDF cache %s: %s", key, e)
+        return
+    _prune_disk()
+
+
+def _prune_disk():
+    """Delete all but the DISK_ENTRIES most recently used PDFs."""
+    try:
+        with os.scandir(CACHE_DIR) as entries:
+            files = [(entry.stat().st_mtime, entry.path) for entry in entries
+                     if entry.name.endswith('.pdf')]
+    except OSError:
+        return
+    files.sort(reverse=True)
+    for _, path in files[DISK_ENTRIES:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # another worker pruned it first
+
+
+def _remember(key, body):
+    with _lock:
+        _memory[key] = body
+        _memory.move_to_end(key)
+        while len(_memory) > MEMORY_ENTRIES:
+            _memory.popitem(last=False)
+
+
+def get_pdf(data, key=None):
+    """
+    The PDF for a dataset, rendered at most once per content key.
+
+    Args:
+        data: Resume dataset (from get_all_resume_data)
+        key: content_key(data), if already computed
+
+    Returns:
+        bytes: PDF document
+    """
+    key = key or content_key(data)
+    with _lock:
+        body = _memory.get(key)
+        if body is not None:
+            _memory.move_to_end(key)
+            render_lock = None
+        else:
+            render_lock = _rendering.setdefault(key, threading.Lock())
+    if body is not None:
+        metrics.inc('pdf_cache_hits_total', tier='memory')
+        return body
+
+    try:
+        with render_lock:
+            # Whoever held the lock may have rendered it meanwhile
+            body = _memory.get(key)
+            if body is not None:
+                metrics.inc('pdf_cache_hits_total', tier='memory')
+                return body
+
+            body = _read_disk(key)
+            if body is not None:
+                metrics.inc('pdf_cache_hits_total', tier='disk')
+            else:
+                with metrics.timer('pdf_render_seconds'), timing.span('pdf.render'), \
+                        memprof.phase('pdf.render'):
+                    body = render(data)
+                metrics.inc('pdf_renders_total')
+                _write_disk(key, body)
+            _remember(key, body)
+    finally:
+        # Also when the render raised, or the next request would find a stale lock
+        with _lock:
+            _rendering.pop(key, None)
+    return body
+
+
+def clear_cache():
+    """Forget in-memory PDFs (tests); files on disk are left in place."""
+    global _last_key
+    with _lock:
+        _memory.clear()
+    _last_key = (None, None)
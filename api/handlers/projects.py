@@ -0,0 +1,130 @@
+"""
+Server-side cache of the GitHub repos feed for the Projects section.
+
+Browsers used to call api.github.com themselves: a cross-origin round trip
+per page view, GitHub's 60 requests/hour per-IP limit, and full repo
+objects for a handful of fields. The API now fetches the user's repos
+once per TTL, trims them to the fields the page renders, and afterwards
+revalidates with If-None-Match. A 304 doesn't count against GitHub's rate
+limit and carries no body.
+
+If GitHub is unreachable, the last fetched repos are served until it
+recovers.
+
+Environment:
+    GITHUB_USERNAME     Whose repos to list (default mr-flowjangles)
+    GITHUB_API_URL      Upstream base URL (default https://api.github.com);
+                        point it at a fixture server in tests
+    GITHUB_TOKEN        Optional token for the 5,000 requests/hour limit
+    PROJECTS_CACHE_TTL  Seconds before revalidating (default 600)
+"""
+import json
+import logging
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from handlers import metrics, timing
+
+logger = logging.getLogger(__name__)
+
+metrics.describe('github_requests_total', 'GitHub repo list requests by result')
+metrics.describe('github_request_seconds', 'GitHub repo list round-trip time')
+
+GITHUB_USERNAME = os.getenv('GITHUB_USERNAME', 'mr-flowjangles')
+GITHUB_API_URL = os.getenv('GITHUB_API_URL', 'https://api.github.com')
+TTL = float(os.getenv('PROJECTS_CACHE_TTL', '600'))
+TIMEOUT = 5
+
+# Fields loaders.js renders on a project card
+FIELDS = ('name', 'html_url', 'language', 'stargazers_count', 'updated_at')
+
+_cache = None          # {'repos': {name: trimmed repo}, 'etag': str, 'checked_at': monotonic}
+_lock = threading.Lock()
+
+
+def _trim(repo):
+    return {field: repo.get(field) for field in FIELDS}
+
+
+def _request(etag=None):
+    """
+    GET the user's repos, conditionally when an ETag is known.
+
+    Returns:
+        tuple: (status, etag, repos list or None on 304)
+    """
+    url = f"{GITHUB_API_URL.rstrip('/')}/users/{GITHUB_USERNAME}/repos?per_page=100"
+    headers = {'Accept': 'application/vnd.github+json', 'User-Agent': 'aws-serverless-resume'}
+    if etag:
+        headers['If-None-Match'] = etag
+    token = os.getenv('GITHUB_TOKEN')
+    if token:
+        headers['Authorization'] = f"Bearer {token}"
+
+    request = urllib.request.Request(url, headers=headers)
+    with metrics.timer('github_request_seconds'), timing.span('github'):
+        try:
+            with urllib.request.urlopen(request, timeout=TIMEOUT) as response:
+                return response.status, response.headers.get('ETag'), json.load(response)
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return 304, e.headers.get('ETag') or etag, None
+            raise
+
+
+def _refresh():
+    """Fetch or revalidate the feed; keeps serving the old copy if GitHub fails."""
+    global _cache
+    etag = _cache['etag'] if _cache else None
+    try:
+        status, new_etag, repos = _request(etag)
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        metrics.inc('github_requests_total', result='error')
+        if _cache is None:
+            raise
+        logger.warning("GitHub unavailable, serving cached repos: %s", e)
+        _cache['checked_at'] = time.monotonic()  # Don't retry on every request
+        return
+
+    metrics.inc('github_requests_total', result='not_modified' if status == 304 else 'ok')
+    if status == 304:
+        _cache['checked_at'] = time.monotonic()
+        _cache['etag'] = new_etag
+        return
+    _cache = {
+        'repos': {repo['name']: _trim(repo) for repo in repos if 'name' in repo},
+        'etag': new_etag,
+        'checked_at': time.monotonic(),
+    }
+
+
+def get_projects(names=None):
+    """
+    Trimmed repos for the Projects section, in the requested order.
+
+    Args:
+        names: Repo names to return (others are dropped); None for all
+
+    Returns:
+        list[dict]: One entry per repo that exists
+
+    Raises:
+        urllib.error.URLError: GitHub failed and nothing is cached yet
+    """
+    with _lock:
+        # One request refreshes the feed; concurrent callers wait for it
+        if _cache is None or time.monotonic() - _cache['checked_at'] >= TTL:
+            _refresh()
+        repos = _cache['repos']
+
+    if names is None:
+        return list(repos.values())
+    return [repos[name] for name in names if name in repos]
+
+
+def clear_cache():
+    """Forget the cached feed (tests)."""
+    global _cache
+    _cache = None
@@ -0,0 +1,163 @@
+"""
+Typed resume records.
+
+DynamoDB items arrive as dicts of Decimals. They are converted once, at
+cache-build time, into compact __slots__ dataclasses with plain Python
+numbers, so sorting and encoding never touch a Decimal again.
+
+Records keep a read-only mapping interface (get, [], in) so code written
+against the old dict items keeps working. Lists become tuples, attributes
+without a declared field are kept in `extra` (None when there are none), and
+`to_dict()` returns the original JSON shape. Declared fields the item did not
+have stay unset: get() falls back to its default and to_dict() omits them,
+exactly as for the dict, so sparse items keep their sparse shape.
+"""
+from dataclasses import dataclass, fields
+from decimal import Decimal
+
+# DynamoDB keys that are storage metadata, not resume content
+# (`rank` is the ingest-time display position, see handlers/ordering.py)
+_METADATA = frozenset({'id', 'type', 'tenant', 'rank'})
+
+# Default of every declared field: the item did not have the attribute
+_MISSING = object()
+
+
+def plain(value):
+    """Recursively convert Decimals to int/float, and lists to (smaller) tuples."""
+    if type(value) is str:
+        return value
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, dict):
+        return {k: plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return tuple(plain(v) for v in value)
+    return value
+
+
+class Record:
+    """Base class: mapping-style access shared by every record type."""
+
+    __slots__ = ()
+    TYPE = None
+    _FIELDS = ()
+
+    @classmethod
+    def from_item(cls, item):
+        """Build a record from a raw DynamoDB item."""
+        names = cls._FIELDS
+        values = {name: plain(item[name]) for name in names if name in item}
+        extra = {k: plain(v) for k, v in item.items() if k not in names and k not in _METADATA}
+        # Most items have no extra attributes: don't keep an empty dict per record
+        return cls(**values, extra=extra or None)
+
+    def get(self, key, default=None):
+        if key in self._FIELDS:
+            value = getattr(self, key)
+            return default if value is _MISSING else value
+        return self.extra.get(key, default) if self.extra else default
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def to_dict(self):
+        """The item as the JSON object the API has always returned."""
+        result = {}
+        for name in self._FIELDS:
+            value = getattr(self, name)
+            if value is not _MISSING:
+                result[name] = value
+        if self.TYPE:
+            result['type'] = self.TYPE
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+
+def _declare(cls):
+    """Record the dataclass field names (minus `extra`) on the class."""
+    cls._FIELDS = tuple(f.name for f in fields(cls) if f.name != 'extra')
+    return cls
+
+
+@_declare
+@dataclass(slots=True)
+class Profile(Record):
+    """
+    The profile sheet is free-form field/value pairs: the known fields are
+    typed and anything else lands in `extra`.
+    """
+    name: str = _MISSING
+    title: str = _MISSING
+    summary: str = _MISSING
+    professional_summary: str = _MISSING
+    location: str = _MISSING
+    email: str = _MISSING
+    photo: str = _MISSING
+    resume_pdf: str = _MISSING
+    linkedin: str = _MISSING
+    github: str = _MISSING
+    extra: dict = None
+
+
+@_declare
+@dataclass(slots=True)
+class WorkExperience(Record):
+    TYPE = 'work_experience'
+    id: str = _MISSING
+    job_title: str = _MISSING
+    company_name: str = _MISSING
+    start_date: str = _MISSING
+    end_date: str = _MISSING
+    is_current: bool = _MISSING
+    is_additional: bool = _MISSING
+    description: str = _MISSING
+    accomplishments: tuple = _MISSING
+    extra: dict = None
+
+
+@_declare
+@dataclass(slots=True)
+class Education(Record):
+    TYPE = 'education'
+    id: str = _MISSING
+    degree: str = _MISSING
+    institution: str = _MISSING
+    start_date: str = _MISSING
+    end_date: str = _MISSING
+    description: str = _MISSING
+    extra: dict = None
+
+
+@_declare
+@dataclass(slots=True)
+class SkillCategory(Record):
+    TYPE = 'skills'
+    id: str = _MISSING
+    category: str = _MISSING
+    skills: tuple = _MISSING
+    sort_order: int = _MISSING
+    extra: dict = None
+
+    def __post_init__(self):
+        if self.sort_order is _MISSING:
+            return
+        try:
+            self.sort_order = int(self.sort_order)
+        except (TypeError, ValueError):
+            self.sort_order = 999
+
+
+RECORD_TYPES = {
+    'profile': Profile,
+    'work_experience': WorkExperience,
+    'education': Education,
+    'skills': SkillCategory,
+}
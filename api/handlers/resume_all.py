@@ -4,79 +4,183 @@ Consolidated resume handler.
 Fetches ALL resume data from DynamoDB in a single scan, partitions by type,
 and caches the result at module level for warm Lambda reuse.
 
-Cache is cleared on Lambda cold start (i.e., redeployment).
+Cache is cleared on Lambda cold start (i.e., redeployment). With several
+worker processes (RESUME_SHARED_CACHE set), workers load the dataset from a
+shared snapshot (handlers/shared_cache.py) so only one of them scans.
+
+Every successful build is also saved to local disk. While DynamoDB is
+failing (see handlers/circuit.py), that last good dataset is served and
+marked stale rather than failing every request.
 """
-from handlers.db import get_dynamodb_table
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+from handlers import circuit, codec, encoding, memprof, metrics, ordering, shared_cache, timing
+from handlers.records import RECORD_TYPES, Profile
+from handlers.db import get_dynamodb_table, query_pages, scan_pages
+
+metrics.describe('resume_cache_hits_total', 'get_all_resume_data calls served from cache')
+metrics.describe('resume_cache_misses_total', 'get_all_resume_data calls that rebuilt the cache')
+metrics.describe('resume_cache_build_seconds', 'Time to scan, partition and sort the resume')
+metrics.describe('resume_stale_served_total', 'Resume loads answered from the last good snapshot')
+
+logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Module-level cache — persists across warm Lambda invocations
 # ---------------------------------------------------------------------------
 _cached_resume = None
+_shared_snapshot = None     # shared_cache.Snapshot the cached dataset came from
+
+# Callbacks run with the fresh dataset after every rebuild (e.g. indexes)
+_rebuild_hooks = []
+
+# Order sections are streamed in — profile first so the hero renders early
+SECTIONS = ("profile", "work_experience", "education", "skills")
+
+# Items without a tenant attribute (single-resume tables) belong to this tenant
+DEFAULT_TENANT = os.getenv('DEFAULT_TENANT', 'default')
+
+# GSI on the tenant attribute (terraform/dynamodb.tf)
+TENANT_INDEX = 'TenantIndex'
+
+# ---------------------------------------------------------------------------
+# Versions and change history — survive clear_cache(), reset on cold start
+# ---------------------------------------------------------------------------
+HISTORY_SIZE = int(os.getenv('RESUME_HISTORY_SIZE', '32'))
+
+_version = 0
+_items = {}                                 # "type:id" → item, as of _version
+_history = deque(maxlen=HISTORY_SIZE)       # (previous version, version, diff)
+_version_lock = threading.Lock()
+
+# ---------------------------------------------------------------------------
+# Last known good dataset — served, marked stale, while DynamoDB is failing
+# ---------------------------------------------------------------------------
+LAST_GOOD_PATH = os.getenv('RESUME_LAST_GOOD_PATH',
+                           os.path.join(tempfile.gettempdir(), 'resume-last-good.json'))
+
+_last_good = None   # (dataset, version, saved at epoch seconds)
+
+# Age in seconds of the stale dataset served to the current request, if any
+_stale_age = ContextVar('resume_stale_age', default=None)
 
 
 def _build_cache():
     """
-    Single DynamoDB scan → partition + sort → cache.
+    Default tenant's items → typed records in display order → cache.
     
     Returns:
         dict with keys: profile, work_experience, education, skills
     """
-    table = get_dynamodb_table()
-    response = table.scan()
-    items = response.get('Items', [])
+    items = []
+    for page in default_tenant_pages(get_dynamodb_table()):
+        items.extend(page)
+
+    with timing.span('partition'):
+        return _partition(items)
 
-    result = {
-        "profile": None,
-        "work_experience": [],
-        "education": [],
-        "skills": []
+
+def default_tenant_filter():
+    """Scan parameters selecting only the default tenant's items."""
+    return {
+        'FilterExpression': Attr('tenant').not_exists() | Attr('tenant').eq(DEFAULT_TENANT)
     }
 
+
+def default_tenant_pages(table):
+    """
+    Pages of the default tenant's items.
+
+    load_resume.py tags every item it writes, so the TenantIndex Query reads
+    only this tenant's items. Tables without the index (ValidationException),
+    or holding only untagged items from older loads (an empty Query), fall
+    back to the filtered Scan, which reads every tenant's items.
+
+    Yields:
+        list: Items from one Query or Scan page
+    """
+    found = False
+    try:
+        for page in query_pages(table, IndexName=TENANT_INDEX,
+                                KeyConditionExpression=Key('tenant').eq(DEFAULT_TENANT)):
+            found = found or bool(page)
+            yield page
+    except ClientError as e:
+        if found or e.response.get('Error', {}).get('Code') != 'ValidationException':
+            raise
+    if not found:
+        yield from scan_pages(table, **default_tenant_filter())
+
+
+def _partition(items, presorted=False):
+    """
+    Bucket raw DynamoDB items by type, converting each to a typed record
+    (see handlers/records.py) so Decimals are normalized exactly once.
+    Compressed attributes (handlers/codec.py) are decoded here too.
+
+    Items carry their display position as `rank` (set by
+    scripts/load_resume.py), so each record goes straight into its slot
+    in one linear pass. Sections with missing or inconsistent ranks
+    (loaded before ranks existed) fall back to ordering.sort_section().
+
+    Args:
+        items: Raw items, in any order
+        presorted: Items are already in display order (a decoded payload)
+
+    Returns:
+        dict with keys: profile, work_experience, education, skills
+    """
+    result = {"profile": None}
+    buckets = {section: [] for section in ordering.RANKED_SECTIONS}
+    codec.decode_items(items)
+
     for item in items:
         item_type = item.get('type')
+        record_type = RECORD_TYPES.get(item_type)
+        if record_type is None:
+            continue
 
         if item_type == 'profile':
-            # Strip DynamoDB metadata
-            item.pop('id', None)
-            item.pop('type', None)
-            result["profile"] = item
-
-        elif item_type == 'work_experience':
-            result["work_experience"].append(item)
-
-        elif item_type == 'education':
-            result["education"].append(item)
-
-        elif item_type == 'skills':
-            result["skills"].append(item)
-
-    # --- Sorting ---
-    # Work experience: current jobs first, then by start date descending
-    result["work_experience"].sort(
-        key=lambda x: x.get('start_date', ''),
-        reverse=True
-    )
-    result["work_experience"].sort(
-        key=lambda x: not x.get('is_current', False)
-    )
-
-    # Education: most recent first
-    result["education"].sort(
-        key=lambda x: x.get('start_date', ''),
-        reverse=True
-    )
-
-    # Skills: by sort_order, then category name
-    result["skills"].sort(
-        key=lambda x: (
-            int(x.get('sort_order', 999)),
-            x.get('category', '')
-        )
-    )
+            result["profile"] = record_type.from_item(item)
+        else:
+            buckets[item_type].append((item.get('rank'), record_type.from_item(item)))
+
+    for section, entries in buckets.items():
+        slots = None if presorted else _place(entries)
+        if slots is None:
+            records = [record for _, record in entries]
+            slots = records if presorted else ordering.sort_section(section, records)
+        result[section] = slots
 
     return result
 
 
+def _place(entries):
+    """
+    Records indexed by rank, or None unless the ranks are exactly 0..n-1.
+
+    Args:
+        entries: (rank, record) pairs of one section
+    """
+    slots = [None] * len(entries)
+    for rank, record in entries:
+        if rank is None:
+            return None
+        rank = int(rank)
+        if not 0 <= rank < len(slots) or slots[rank] is not None:
+            return None
+        slots[rank] = record
+    return slots
+
+
 def get_all_resume_data():
     """
     Return the full resume dataset, cached after first call.
@@ -84,15 +188,350 @@ def get_all_resume_data():
     Returns:
         dict: { profile, work_experience, education, skills }
     """
-    global _cached_resume
+    global _cached_resume, _shared_snapshot
+    _stale_age.set(None)
+    if _shared_snapshot is not None and not shared_cache.is_current(_shared_snapshot):
+        # Another worker published a newer snapshot, or this one expired
+        _cached_resume = _shared_snapshot = None
+
     if _cached_resume is None:
-        _cached_resume = _build_cache()
+        metrics.inc('resume_cache_misses_total')
+        try:
+            with metrics.timer('resume_cache_build_seconds'), timing.span('cache', desc='miss'), \
+                    memprof.phase('cache.build', sites=True):
+                if shared_cache.enabled():
+                    result, version = _load_shared()
+                else:
+                    result, version = _build_cache(), None
+        except Exception as e:
+            return _serve_last_good(e)
+        _store(result, version)
+    else:
+        metrics.inc('resume_cache_hits_total')
+        timing.record('cache', 0.0, desc='hit')
     return _cached_resume
 
 
+def iter_resume_sections():
+    """
+    Yield the resume one section at a time, in SECTIONS order.
+
+    Warm, or sharing a snapshot across workers: straight from
+    get_all_resume_data(). Cold: the profile is yielded as soon as
+    the Scan page containing it arrives; the remaining sections follow once
+    the scan completes (they are placed by rank), and the cache is populated
+    exactly as get_all_resume_data() would.
+
+    Yields:
+        tuple: (section name, section data)
+    """
+    if _cached_resume is not None or shared_cache.enabled():
+        # Warm, or another worker may already have built the shared snapshot
+        data = get_all_resume_data()
+        for section in SECTIONS:
+            yield section, data[section]
+        return
+
+    metrics.inc('resume_cache_misses_total')
+    _stale_age.set(None)
+    start = time.perf_counter()
+    items = []
+    profile_sent = False
+    try:
+        for page in default_tenant_pages(get_dynamodb_table()):
+            items.extend(page)
+            if not profile_sent:
+                profile = next((item for item in page if item.get('type') == 'profile'), None)
+                if profile is not None:
+                    profile_sent = True
+                    yield 'profile', Profile.from_item(profile)
+    except Exception as e:
+        if profile_sent:
+            raise
+        data = _serve_last_good(e)
+        for section in SECTIONS:
+            yield section, data[section]
+        return
+
+    with memprof.phase('cache.build', sites=True):
+        result = _partition(items)
+    metrics.observe('resume_cache_build_seconds', time.perf_counter() - start)
+    _store(result)
+
+    for section in SECTIONS:
+        if section == 'profile' and profile_sent:
+            continue
+        yield section, result[section]
+
+
+def _build_snapshot():
+    """
+    Build the dataset for the shared snapshot: (encoded payload, version).
+
+    The version is the payload's content_version(), so a TTL rebuild of
+    unchanged data keeps the version every worker already reports.
+    """
+    payload = encoding.dumps(_build_cache())
+    return payload, content_version(payload)
+
+
+def _decode(payload):
+    """Rebuild a dataset of typed records from an encoded /resume payload."""
+    data = encoding.loads(payload)
+    items = []
+    if data.get('profile') is not None:
+        items.append({**data['profile'], 'type': 'profile'})
+    for section in SECTIONS[1:]:
+        items.extend(data.get(section, []))
+    # The payload was encoded in display order
+    return _partition(items, presorted=True)
+
+
+def _load_shared():
+    """
+    Dataset from the cross-worker snapshot, built by whichever worker
+    missed first.
+
+    Returns:
+        tuple: (dataset, snapshot version)
+    """
+    global _shared_snapshot
+    snapshot = shared_cache.get_or_build(_build_snapshot)
+    result = _decode(snapshot.payload)
+
+    # The payload is already encoded: don't encode it again in this worker
+    encoding.prime(result, bytes(snapshot.payload))
+    _shared_snapshot = snapshot
+    return result, snapshot.version
+
+
+def _store(result, version=None):
+    """Install a freshly built dataset and run the rebuild hooks."""
+    global _cached_resume
+    with _version_lock:
+        _record_version(result, version)
+        _cached_resume = result
+    for hook in _rebuild_hooks:
+        with memprof.phase(f"rebuild {hook.__module__}.{hook.__qualname__}"):
+            hook(result)
+    _save_last_good(result)
+
+
+# ---------------------------------------------------------------------------
+# Last known good snapshot
+# ---------------------------------------------------------------------------
+
+def _save_last_good(result):
+    """
+    Persist a freshly built dataset: a JSON header line ({version, saved_at})
+    followed by the /resume payload. Written atomically; failures are logged,
+    never raised.
+    """
+    global _last_good
+    saved_at = time.time()
+    _last_good = (result, _version, saved_at)
+    header = encoding.dumps({'version': _version, 'saved_at': saved_at})
+    try:
+        directory = os.path.dirname(LAST_GOOD_PATH) or '.'
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix='.resume-last-good-')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header + b"\n" + encoding.dumps_cached(result))
+        os.replace(tmp, LAST_GOOD_PATH)
+    except OSError as e:
+        logger.warning("Could not save last good resume to %s: %s", LAST_GOOD_PATH, e)
+
+
+def _read_last_good():
+    """
+    Load the snapshot saved by an earlier process (e.g. before a restart).
+
+    Returns:
+        tuple | None: (dataset, version, saved at), or None if there is none
+    """
+    global _last_good, _version, _items
+    try:
+        with open(LAST_GOOD_PATH, 'rb') as f:
+            header, _, payload = f.read().partition(b"\n")
+        meta = encoding.loads(header)
+        result = _decode(payload)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning("No usable last good resume at %s: %s", LAST_GOOD_PATH, e)
+        return None
+
+    with _version_lock:
+        if not _version:
+            # Diff the next successful build against the snapshot
+            _version, _items = meta['version'], _flatten(result)
+    _last_good = (result, meta['version'], meta['saved_at'])
+    return _last_good
+
+
+def _serve_last_good(error):
+    """
+    Answer a failed load with the last good dataset, marked stale.
+
+    Only DynamoDB outages (an open circuit, throttling, connection errors)
+    fall back; anything else, or having no snapshot, re-raises `error`.
+    """
+    if not (isinstance(error, circuit.CircuitOpenError) or circuit.is_failure(error)):
+        raise error
+    last_good = _last_good or _read_last_good()
+    if last_good is None:
+        raise error
+
+    data, _, saved_at = last_good
+    metrics.inc('resume_stale_served_total')
+    _stale_age.set(max(time.time() - saved_at, 0.0))
+    logger.warning("Serving last good resume after DynamoDB failure: %s", error)
+    return data
+
+
+def stale_age():
+    """
+    Seconds since the dataset served to the current request was built, if
+    it came from the last good snapshot; None when it is fresh.
+    """
+    return _stale_age.get()
+
+
+def _item_key(section, item):
+    return section if section == 'profile' else f"{section}:{item.get('id')}"
+
+
+def _flatten(result):
+    """Map every item in a dataset to its "type:id" key."""
+    items = {}
+    if result.get('profile') is not None:
+        items['profile'] = result['profile']
+    for section in SECTIONS[1:]:
+        for item in result.get(section, []):
+            items[_item_key(section, item)] = item
+    return items
+
+
+def content_version(payload):
+    """
+    Version of an encoded /resume payload: the first 48 bits of its SHA-256.
+
+    Derived from content, so every Lambda instance and worker that loads the
+    same data reports the same version, and a `since` handed out by one is
+    understood by the others. 48 bits stay exact as a JavaScript number.
+    """
+    return int.from_bytes(hashlib.sha256(payload).digest()[:6], 'big')
+
+
+def _record_version(result, version=None):
+    """
+    Diff a rebuilt dataset against the previous one and move to its version.
+
+    The version is content_version() of the encoded dataset (a shared
+    snapshot passes the one it was built with, which is the same hash). A
+    rebuild that changes nothing keeps the current version and adds no
+    history entry.
+    """
+    global _version, _items
+    items = _flatten(result)
+    diff = {
+        'added': [k for k in items if k not in _items],
+        'changed': [k for k in items if k in _items and items[k] != _items[k]],
+        'removed': [k for k in _items if k not in items],
+    }
+    if _version and not any(diff.values()):
+        return
+    if version is None:
+        # Encoded once per rebuild anyway; the on_rebuild hook reuses these bytes
+        version = content_version(encoding.dumps_cached(result))
+    if version == _version:
+        return
+    previous = _version
+    _version = version
+    if previous:
+        _history.append((previous, _version, diff))
+    _items = items
+
+
+def get_version():
+    """Version of the cached dataset (0 before the first build)."""
+    return _version
+
+
+def _entry(key, item=None):
+    section, _, item_id = key.partition(':')
+    entry = {'type': section, 'id': item_id or section}
+    if item is not None:
+        entry['item'] = item
+    return entry
+
+
+def get_changes(since):
+    """
+    Items added, changed and removed since a version.
+
+    Args:
+        since: A version from an earlier /resume or /resume/changes response
+
+    Returns:
+        dict: {version, full: False, added, changed, removed} when the
+        history still reaches back to `since`; otherwise a full snapshot,
+        {version, full: True, data}.
+    """
+    data = get_all_resume_data()
+    with _version_lock:
+        # Read together so the version always matches the items and data
+        data = _cached_resume or data
+        version, items, history = _version, _items, list(_history)
+
+    if since == version:
+        return {'version': version, 'full': False, 'added': [], 'changed': [], 'removed': []}
+
+    if since not in {previous for previous, _, _ in history}:
+        # Never served here, or evicted from the history
+        return {'version': version, 'full': True, 'data': data}
+
+    # Versions are hashes, not ordered: replay from the last time `since` was current
+    start = max(i for i, (previous, _, _) in enumerate(history) if previous == since)
+    ops = {}  # key → 'added' | 'changed' | 'removed', net of every diff after `since`
+    for _, _, diff in history[start:]:
+        for key in diff['added']:
+            ops[key] = 'changed' if ops.get(key) == 'removed' else 'added'
+        for key in diff['changed']:
+            ops.setdefault(key, 'changed')
+        for key in diff['removed']:
+            if ops.get(key) == 'added':
+                del ops[key]
+            else:
+                ops[key] = 'removed'
+
+    changes = {'version': version, 'full': False, 'added': [], 'changed': [], 'removed': []}
+    for key, op in sorted(ops.items()):
+        changes[op].append(_entry(key, items.get(key) if op != 'removed' else None))
+    return changes
+
+
+def on_rebuild(callback):
+    """
+    Register a callback to derive data (e.g. search indexes) once per
+    cache rebuild instead of once per request.
+
+    Args:
+        callback: Called with the new resume dataset
+    """
+    if callback not in _rebuild_hooks:
+        _rebuild_hooks.append(callback)
+
+
+# Encode the /resume payload once per rebuild rather than on the first request
+on_rebuild(encoding.dumps_cached)
+
+
 def clear_cache():
     """
     Manually bust the cache if needed (e.g., from a future admin endpoint).
+    Also removes the shared snapshot, so every worker rebuilds.
     """
-    global _cached_resume
-    _cached_resume = None
+    global _cached_resume, _shared_snapshot
+    _cached_resume = _shared_snapshot = None
+    if shared_cache.enabled():
+        shared_cache.invalidate()
@@ -0,0 +1,269 @@
+"""
+Full-text and faceted search over the cached resume.
+
+At cache-build time (via resume_all.on_rebuild) every item is indexed into:
+- an inverted index: term → {document: term frequency}
+- a sorted vocabulary, so prefix queries are a bisect range, not a scan
+- a skill facet map: skill → work-experience documents that mention it
+
+A query therefore costs O(terms + matches) and never walks every item.
+"""
+import html
+import logging
+import re
+import sys
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from handlers import metrics, resume_all, timing
+from handlers.text import tokenize
+
+logger = logging.getLogger(__name__)
+
+metrics.describe('search_index_build_seconds', 'Time to build the resume search index')
+
+# Searchable fields per section, in display order
+FIELDS = {
+    'profile': ('name', 'title', 'summary', 'professional_summary', 'location'),
+    'work_experience': ('job_title', 'company_name', 'description', 'accomplishments'),
+    'education': ('degree', 'institution', 'description'),
+    'skills': ('category', 'skills'),
+}
+SECTIONS = tuple(FIELDS)
+
+
+def _field_texts(item, field):
+    value = item.get(field)
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(v) for v in value]
+    return [str(value)]
+
+
+class SearchIndex:
+    """Inverted index, prefix vocabulary and skill facets for one dataset."""
+
+    def __init__(self, data):
+        start = time.perf_counter()
+        self.documents = []                  # [(section, item)]
+        self.fields = []                     # doc index → [(field, text, term set)]
+        self.postings = defaultdict(dict)    # term → {doc index: tf}
+
+        if data.get('profile'):
+            self._add('profile', data['profile'])
+        for section in ('work_experience', 'education', 'skills'):
+            for item in data.get(section, []):
+                self._add(section, item)
+
+        self.vocabulary = sorted(self.postings)
+        self.skill_facets = self._build_skill_facets(data)
+        self.doc_skills = defaultdict(list)  # doc index → skills (for facet counts)
+        for skill, docs in self.skill_facets.items():
+            for doc in docs:
+                self.doc_skills[doc].append(skill)
+        self.build_seconds = time.perf_counter() - start
+        self.memory_bytes = _deep_sizeof(
+            (self.postings, self.vocabulary, self.fields, self.skill_facets)
+        )
+
+    def _add(self, section, item):
+        index = len(self.documents)
+        self.documents.append((section, item))
+        terms = Counter()
+        fields = []
+        for field in FIELDS[section]:
+            for text in _field_texts(item, field):
+                tokens = tokenize(text)
+                terms.update(tokens)
+                fields.append((field, text, frozenset(tokens)))
+        self.fields.append(fields)
+        for term, count in terms.items():
+            self.postings[term][index] = count
+
+    def _build_skill_facets(self, data):
+        """Map each listed skill to the jobs whose text mentions it."""
+        jobs = [
+            (index, tokenize(" ".join(
+                t for f in FIELDS['work_experience'] for t in _field_texts(item, f)
+            ), keep_stopwords=True))
+            for index, (section, item) in enumerate(self.documents)
+            if section == 'work_experience'
+        ]
+        facets = {}
+        for category in data.get('skills', []):
+            for skill in category.get('skills', []):
+                skill_terms = tokenize(skill, keep_stopwords=True)
+                if not skill_terms:
+                    continue
+                matches = [index for index, words in jobs if _contains(words, skill_terms)]
+                if matches:
+                    facets[skill] = matches
+        return facets
+
+    def expand(self, term, prefix):
+        """Vocabulary terms matching a query term (prefix range via bisect)."""
+        if not prefix:
+            return [term] if term in self.postings else []
+        start = bisect_left(self.vocabulary, term)
+        end = bisect_left(self.vocabulary, term + '\uffff', start)
+        return self.vocabulary[start:end]
+
+    def search(self, query='', section=None, skill=None, prefix=True, limit=20):
+        """
+        Run a query.
+
+        Args:
+            query: Free text; every term must match (AND)
+            section: Restrict to one section (e.g. "work_experience")
+            skill: Only work experience that mentions this skill
+            prefix: Match query terms as prefixes ("terra" → "terraform")
+            limit: Max results
+
+        Returns:
+            dict: {total, results, facets}
+        """
+        candidates = None
+        if skill is not None:
+            key = next((s for s in self.skill_facets if s.lower() == skill.lower()), None)
+            candidates = dict.fromkeys(self.skill_facets.get(key, []), 0)
+
+        matched_terms = set()
+        for term in dict.fromkeys(tokenize(query)):
+            scores = {}
+            for expanded in self.expand(term, prefix):
+                matched_terms.add(expanded)
+                for doc, tf in self.postings[expanded].items():
+                    scores[doc] = scores.get(doc, 0) + tf
+            if candidates is None:
+                candidates = scores
+            else:
+                candidates = {d: s + scores[d] for d, s in candidates.items() if d in scores}
+            if not candidates:
+                break
+
+        if candidates is None:
+            candidates = {}
+        if section:
+            candidates = {d: s for d, s in candidates.items() if self.documents[d][0] == section}
+
+        ranked = sorted(candidates.items(), key=lambda kv: (-kv[1], kv[0]))
+        facets = Counter()
+        for doc in candidates:
+            facets.update(self.doc_skills.get(doc, ()))
+
+        pattern = _highlighter(matched_terms) if matched_terms else None
+        return {
+            "total": len(ranked),
+            "results": [
+                self._result(doc, score, matched_terms, pattern) for doc, score in ranked[:limit]
+            ],
+            "facets": {"skills": dict(facets.most_common())},
+        }
+
+    def _result(self, doc, score, matched_terms, pattern):
+        section, item = self.documents[doc]
+        highlights = {}
+        for field, text, terms in self.fields[doc]:
+            if not terms.isdisjoint(matched_terms):
+                highlights.setdefault(field, []).append(_highlight(text, pattern))
+        return {
+            "type": section,
+            "id": item.get('id', section),
+            "score": score,
+            "item": item,
+            "highlights": highlights,
+        }
+
+    def stats(self):
+        """Build time and size of the index."""
+        return {
+            "documents": len(self.documents),
+            "terms": len(self.vocabulary),
+            "postings": sum(len(docs) for docs in self.postings.values()),
+            "skills": len(self.skill_facets),
+            "build_ms": round(self.build_seconds * 1000, 3),
+            "memory_bytes": self.memory_bytes,
+        }
+
+
+def _contains(words, phrase):
+    """Whether the phrase appears as a contiguous run of words."""
+    width = len(phrase)
+    first = phrase[0]
+    for i, word in enumerate(words):
+        if word == first and words[i:i + width] == phrase:
+            return True
+    return False
+
+
+def _highlighter(terms):
+    """
+    Compile one pattern matching any of the terms as a whole token.
+
+    The lookarounds mirror the tokenizer: "node" must not match inside
+    "node.js", and "aws" must not match inside "x/aws".
+    """
+    alternation = "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True))
+    return re.compile(
+        rf"(?<![a-z0-9+#])(?<![a-z0-9+#][./-])({alternation})(?![a-z0-9+#]|[./-][a-z0-9+#])",
+        re.IGNORECASE
+    )
+
+
+def _highlight(text, pattern):
+    """HTML-escape text and wrap matched terms in <mark>."""
+    parts = pattern.split(text)
+    # split() with one group alternates: text, match, text, match, ..., text
+    return "".join(
+        f"<mark>{html.escape(part)}</mark>" if i % 2 else html.escape(part)
+        for i, part in enumerate(parts)
+    )
+
+
+def _deep_sizeof(obj, seen=None):
+    """Approximate retained size of nested containers, in bytes."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_sizeof(k, seen) + _deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_sizeof(v, seen) for v in obj)
+    return size
+
+
+# ---------------------------------------------------------------------------
+# Module-level index — rebuilt with the resume cache
+# ---------------------------------------------------------------------------
+_index = None
+_index_source = None
+
+
+def _rebuild_index(data):
+    global _index, _index_source
+    index = SearchIndex(data)
+    metrics.observe('search_index_build_seconds', index.build_seconds)
+    logger.info("Search index built", extra={'index': index.stats()})
+    _index, _index_source = index, data
+
+
+resume_all.on_rebuild(_rebuild_index)
+
+
+def get_index():
+    """Return the index for the current resume dataset."""
+    data = resume_all.get_all_resume_data()
+    if _index_source is not data:
+        # Cache was built before this module registered its hook
+        _rebuild_index(data)
+    return _index
+
+
+def search(query='', section=None, skill=None, prefix=True, limit=20):
+    """Search the cached resume. See SearchIndex.search."""
+    index = get_index()
+    with timing.span('search'):
+        return index.search(query, section=section, skill=skill, prefix=prefix, limit=limit)
@@ -0,0 +1,199 @@
+"""
+Shared resume snapshot for multi-worker deployments.
+
+With `uvicorn --workers N` every worker process would otherwise keep its
+own cache and run its own DynamoDB scan. Instead, one worker builds the
+encoded resume and writes it to a snapshot file (on /dev/shm, so it lives
+in RAM). Every worker memory-maps that file, so the payload sits once in
+the page cache. It does not get a private copy per process.
+
+File layout: a fixed header (magic, version, build time, payload length)
+followed by the JSON payload. Snapshots are written to a temp file and
+swapped in with os.replace, so readers only ever see a complete file.
+Builds are serialized with an fcntl lock, so concurrent misses across
+workers cost one scan.
+
+Environment:
+    RESUME_SHARED_CACHE      Snapshot path; unset disables sharing (Lambda, dev)
+    RESUME_SHARED_CACHE_TTL  Seconds before a snapshot is rebuilt (default 300)
+"""
+import mmap
+import os
+import struct
+import tempfile
+import time
+from contextlib import contextmanager, suppress
+from handlers import metrics
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+metrics.describe('shared_cache_builds_total', 'Resume snapshots built by this worker')
+metrics.describe('shared_cache_maps_total', 'Resume snapshots memory-mapped by this worker')
+
+PATH = os.getenv('RESUME_SHARED_CACHE', '')
+TTL = float(os.getenv('RESUME_SHARED_CACHE_TTL', '300'))
+
+# How often a worker stats the file to notice a snapshot built elsewhere
+CHECK_INTERVAL = 1.0
+
+_HEADER = struct.Struct('<8sQdQ')   # magic, version, built at (epoch s), payload length
+_MAGIC = b'RESUME01'
+
+
+def enabled():
+    """Whether workers share a snapshot file."""
+    return bool(PATH)
+
+
+class Snapshot:
+    """
+    A memory-mapped snapshot.
+
+    Attributes:
+        version: Resume version the snapshot was built as
+        built_at: Epoch seconds when it was written
+        payload: memoryview of the encoded JSON (no copy)
+    """
+
+    __slots__ = ('version', 'built_at', 'payload', 'key', '_map')
+
+    def __init__(self, version, built_at, payload, key, mapping):
+        self.version = version
+        self.built_at = built_at
+        self.payload = payload
+        self.key = key
+        self._map = mapping
+
+    def expired(self):
+        return time.time() - self.built_at >= TTL
+
+
+_current = None     # Last Snapshot this process mapped
+_next_check = 0.0
+
+
+def _file_key(path):
+    stat = os.stat(path)
+    return (path, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def read(path=None):
+    """
+    Map the snapshot file.
+
+    The mapping is reused while the file is unchanged. A replaced file gets
+    a new mapping; the old one stays valid until nothing references it.
+
+    Returns:
+        Snapshot | None: None if the file is missing or not a valid snapshot
+    """
+    global _current
+    path = path or PATH
+    try:
+        key = _file_key(path)
+    except FileNotFoundError:
+        return None
+    if _current is not None and _current.key == key:
+        return _current
+
+    try:
+        with open(path, 'rb') as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):
+        return None  # Replaced between stat and open, or empty
+    if len(mapping) < _HEADER.size:
+        return None
+    magic, version, built_at, length = _HEADER.unpack_from(mapping)
+    if magic != _MAGIC or _HEADER.size + length != len(mapping):
+        return None
+
+    metrics.inc('shared_cache_maps_total')
+    _current = Snapshot(version, built_at, memoryview(mapping)[_HEADER.size:], key, mapping)
+    return _current
+
+
+def write(payload, version, path=None):
+    """Atomically replace the snapshot file with a new payload."""
+    path = path or PATH
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix='.resume-snapshot-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, version, time.time(), len(payload)))
+            f.write(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+
+
+@contextmanager
+def _build_lock(path):
+    """Exclusive lock across worker processes (no-op where fcntl is missing)."""
+    with open(f"{path}.lock", 'a') as f:
+        if FCNTL_AVAILABLE:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def get_or_build(build, path=None):
+    """
+    Return a fresh snapshot, building it if no worker has.
+
+    Args:
+        build: Called when a new snapshot is needed; returns
+            (payload bytes, version)
+
+    Returns:
+        Snapshot
+    """
+    path = path or PATH
+    snapshot = read(path)
+    if snapshot is not None and not snapshot.expired():
+        return snapshot
+
+    with _build_lock(path):
+        # Another worker may have built it while we waited for the lock
+        snapshot = read(path)
+        if snapshot is None or snapshot.expired():
+            payload, version = build()
+            write(payload, version, path)
+            metrics.inc('shared_cache_builds_total')
+            snapshot = read(path)
+    return snapshot
+
+
+def is_current(snapshot, path=None):
+    """
+    Whether a snapshot is still the live, unexpired one.
+
+    Stats the file at most once per CHECK_INTERVAL, so calling this on
+    every request is cheap.
+    """
+    global _next_check
+    now = time.monotonic()
+    if now < _next_check:
+        return True
+    _next_check = now + CHECK_INTERVAL
+    if snapshot.expired():
+        return False
+    try:
+        return _file_key(path or PATH) == snapshot.key
+    except FileNotFoundError:
+        return False
+
+
+def invalidate(path=None):
+    """Remove the snapshot so the next miss in any worker rebuilds it."""
+    global _next_check
+    _next_check = 0.0
+    with suppress(FileNotFoundError):
+        os.unlink(path or PATH)
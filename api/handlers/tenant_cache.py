@@ -0,0 +1,205 @@
+"""
+Per-tenant resume cache for multi-tenant hosting.
+
+Each tenant's resume is cached as encoded JSON bytes in an LRU bounded by
+total size in bytes (not entry count), so memory stays predictable however
+uneven the resumes are. Entries expire after a per-tenant TTL, and
+concurrent misses for the same tenant share one DynamoDB read.
+
+Environment:
+    TENANT_CACHE_MAX_BYTES  Total size of cached payloads (default 64 MiB)
+    TENANT_CACHE_TTL        Default seconds before a tenant is reloaded (default 300)
+    TENANT_TTLS             Per-tenant overrides, e.g. "acme=60,globex=3600"
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+from handlers import encoding, metrics, resume_all
+from handlers.db import get_dynamodb_table, query_all, scan_all
+
+metrics.describe('tenant_cache_hits_total', 'Tenant resumes served from cache')
+metrics.describe('tenant_cache_misses_total', 'Tenant resumes loaded from DynamoDB')
+metrics.describe('tenant_cache_coalesced_total', 'Tenant cache misses that waited on an in-flight load')
+metrics.describe('tenant_cache_evictions_total', 'Tenant resumes evicted to stay within the byte budget')
+
+TENANT_INDEX = resume_all.TENANT_INDEX
+
+# Tenant names: lowercase slug. Names used by other /resume/... routes are reserved.
+TENANT_PATTERN = r'^[a-z0-9][a-z0-9-]{0,62}$'
+RESERVED_TENANTS = frozenset({'search', 'changes'})
+
+# Cost charged for a cached "no such tenant", so misses for unknown names
+# are bounded too
+_MISSING_SIZE = 64
+
+
+def _parse_ttls(value):
+    ttls = {}
+    for part in filter(None, (p.strip() for p in value.split(','))):
+        name, _, seconds = part.partition('=')
+        if name and seconds:
+            ttls[name.strip()] = float(seconds)
+    return ttls
+
+
+class TenantCache:
+    """
+    Byte-bounded LRU with per-key TTL and single-flight loading.
+
+    Args:
+        loader: Called with a key on a miss; returns bytes, or None if absent
+        max_bytes: Budget for the sum of cached payload sizes
+        ttl: Default seconds an entry stays fresh
+        ttls: {key: seconds} overrides
+        clock: Monotonic time source (injectable for tests)
+    """
+
+    def __init__(self, loader, max_bytes, ttl, ttls=None, clock=time.monotonic):
+        self.loader = loader
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.clock = clock
+        self.bytes = 0
+        self._entries = OrderedDict()  # key → (value, size, expires at)
+        # key → [threading.Event, exception or None] for the load in flight.
+        # Waiters keep their own reference, so a failed load's exception is
+        # gone once its last waiter has raised it
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value for key, loading it on a miss."""
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[2] > self.clock():
+                    self._entries.move_to_end(key)
+                    metrics.inc('tenant_cache_hits_total')
+                    return entry[0]
+                flight = self._inflight.get(key)
+                if flight is None:
+                    flight = self._inflight[key] = [threading.Event(), None]
+                    break
+
+            # Another request is already loading this key: wait for it
+            metrics.inc('tenant_cache_coalesced_total')
+            flight[0].wait()
+            if flight[1] is not None:
+                raise flight[1]
+
+        metrics.inc('tenant_cache_misses_total')
+        try:
+            value = self.loader(key)
+        except Exception as e:
+            flight[1] = e
+            with self._lock:
+                del self._inflight[key]
+            flight[0].set()
+            raise
+
+        with self._lock:
+            self._store(key, value)
+            del self._inflight[key]
+        flight[0].set()
+        return value
+
+    def _store(self, key, value):
+        size = _MISSING_SIZE if value is None else len(value)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        if size > self.max_bytes:
+            return  # Larger than the whole budget: serve it, don't cache it
+
+        expires = self.clock() + self.ttls.get(key, self.ttl)
+        self._entries[key] = (value, size, expires)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self.bytes -= evicted_size
+            metrics.inc('tenant_cache_evictions_total')
+
+    def invalidate(self, key=None):
+        """Drop one key, or everything."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self.bytes = 0
+            elif key in self._entries:
+                self.bytes -= self._entries.pop(key)[1]
+
+    def stats(self):
+        """Entry count and bytes in use."""
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self.bytes, "max_bytes": self.max_bytes}
+
+
+# ---------------------------------------------------------------------------
+# Loading a tenant's resume
+# ---------------------------------------------------------------------------
+
+def load_tenant_items(tenant):
+    """
+    All raw items for one tenant, with the tenant prefix stripped from ids.
+
+    Uses the TenantIndex GSI; tables created before it existed fall back to
+    a filtered scan.
+    """
+    table = get_dynamodb_table()
+    if tenant == resume_all.DEFAULT_TENANT:
+        # Also picks up untagged items from single-resume tables
+        items = [item for page in resume_all.default_tenant_pages(table) for item in page]
+    else:
+        try:
+            items = query_all(table, IndexName=TENANT_INDEX,
+                              KeyConditionExpression=Key('tenant').eq(tenant))
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') != 'ValidationException':
+                raise
+            items = scan_all(table, FilterExpression=Attr('tenant').eq(tenant))
+
+    prefix = f"{tenant}#"
+    for item in items:
+        if str(item.get('id', '')).startswith(prefix):
+            item['id'] = item['id'][len(prefix):]
+    return items
+
+
+def load_tenant_resume(tenant):
+    """
+    Build one tenant's resume as encoded JSON.
+
+    Returns:
+        bytes | None: JSON payload, or None if the tenant has no items
+    """
+    items = load_tenant_items(tenant)
+    if not items:
+        return None
+    return encoding.dumps(resume_all._partition(items))
+
+
+_cache = TenantCache(
+    load_tenant_resume,
+    max_bytes=int(os.getenv('TENANT_CACHE_MAX_BYTES', str(64 * 1024 * 1024))),
+    ttl=float(os.getenv('TENANT_CACHE_TTL', '300')),
+    ttls=_parse_ttls(os.getenv('TENANT_TTLS', ''))
+)
+
+
+def get_tenant_resume(tenant):
+    """
+    Cached JSON payload for a tenant's resume.
+
+    Returns:
+        bytes | None: None if the tenant does not exist
+    """
+    return _cache.get(tenant)
+
+
+def clear_cache(tenant=None):
+    """Drop one tenant's cached resume, or every tenant's."""
+    _cache.invalidate(tenant)
@@ -0,0 +1,33 @@
+"""
+Text helpers shared by the chat retrieval and search indexes.
+"""
+import re
+
+# Keeps tech tokens like "c++", "c#", "node.js" and "ci/cd" intact
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#./-]*[a-z0-9+#]|[a-z0-9]")
+
+STOPWORDS = frozenset("""
+a about an and are as at be been but by can did do does for from had has have he
+her his how i in into is it its me my of on or our s she so than that the
+their them then there these they this to tell was we were what when where which
+who whom why will with you your
+""".split())
+
+
+def tokenize(text, keep_stopwords=False):
+    """
+    Lowercase and split text into index terms.
+
+    Args:
+        text: Any string (None is treated as empty)
+        keep_stopwords: Keep common words (used for highlighting)
+
+    Returns:
+        list[str]: Terms in document order
+    """
+    if not text:
+        return []
+    tokens = _TOKEN_RE.findall(str(text).lower())
+    if keep_stopwords:
+        return tokens
+    return [t for t in tokens if t not in STOPWORDS]
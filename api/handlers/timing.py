@@ -0,0 +1,88 @@
+"""
+Per-request timing spans for the Server-Timing response header.
+
+A request-scoped span list lives in a ContextVar, so routers and handlers
+record spans without threading anything through their signatures. FastAPI
+copies the context into the threadpool for sync endpoints, so spans
+recorded there land in the same list. When the request is not sampled the
+list is None and span() is a cheap no-op.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_spans = ContextVar('server_timing_spans', default=None)
+
+
+def start():
+    """
+    Begin collecting spans for the current request.
+
+    Returns:
+        tuple: (spans list, token for stop())
+    """
+    spans = []
+    return spans, _spans.set(spans)
+
+
+def stop(token):
+    """Stop collecting spans for the current request."""
+    _spans.reset(token)
+
+
+def enabled():
+    """Whether the current request is being timed."""
+    return _spans.get() is not None
+
+
+@contextmanager
+def span(name, desc=None):
+    """
+    Time a block as a named span.
+
+    Args:
+        name: Server-Timing metric name, e.g. "dynamodb.scan"
+        desc: Optional human-readable description (e.g. "hit")
+    """
+    spans = _spans.get()
+    if spans is None:
+        yield
+        return
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        spans.append((name, time.perf_counter() - start_time, desc))
+
+
+def record(name, seconds, desc=None):
+    """Record an already-measured duration as a span."""
+    spans = _spans.get()
+    if spans is not None:
+        spans.append((name, seconds, desc))
+
+
+def header_value(spans):
+    """
+    Format spans as a Server-Timing header value.
+
+    Spans with the same name (e.g. several scan pages) are summed so the
+    header lists each phase once, in first-seen order.
+
+    Returns:
+        str: e.g. 'cache;desc="miss";dur=41.2, dynamodb.scan;dur=38.9'
+    """
+    totals = {}
+    descs = {}
+    for name, seconds, desc in spans:
+        totals[name] = totals.get(name, 0.0) + seconds
+        if desc and name not in descs:
+            descs[name] = desc
+
+    parts = []
+    for name, seconds in totals.items():
+        part = name
+        if name in descs:
+            part += f';desc="{descs[name]}"'
+        parts.append(f"{part};dur={seconds * 1000:.2f}")
+    return ", ".join(parts)
@@ -0,0 +1,141 @@
+"""
+Scheduled warm-up for Lambda execution environments.
+
+An EventBridge rule (terraform/warmer.tf) invokes the function every few
+minutes with {"warmer": true}. The event is handled without going through
+routing or middleware. It primes the boto3 clients and builds the resume
+cache and its encoded /resume bytes. The first invocation then fans out
+WARM_CONCURRENCY - 1 concurrent self-invocations, so that many execution
+environments are warm, not just one. The fan-out size is configuration
+only: whatever an event says, it cannot make the function invoke itself
+more often.
+
+Fan-out targets hold for WARMER_HOLD_MS so the invocations overlap.
+Otherwise Lambda could serve them all from the same environment.
+
+Environment:
+    WARM_CONCURRENCY  Environments to keep warm (terraform var.warm_concurrency,
+                      default 1, capped at MAX_CONCURRENCY)
+    WARMER_HOLD_MS    How long a fan-out target stays busy (default 75)
+"""
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import boto3
+from handlers import encoding, metrics, resume_all
+from handlers.db import get_dynamodb_client, get_dynamodb_table
+
+logger = logging.getLogger(__name__)
+
+metrics.describe('warmer_invocations_total', 'Warm-up events handled')
+
+HOLD_SECONDS = int(os.getenv('WARMER_HOLD_MS', '75')) / 1000
+
+# Upper bound on the fan-out, whatever WARM_CONCURRENCY says
+MAX_CONCURRENCY = 50
+
+
+def _parse_concurrency(value):
+    try:
+        return max(1, min(int(value), MAX_CONCURRENCY))
+    except (TypeError, ValueError):
+        logger.warning("Ignoring invalid WARM_CONCURRENCY %r", value)
+        return 1
+
+
+CONCURRENCY = _parse_concurrency(os.getenv('WARM_CONCURRENCY', '1'))
+
+# False once this execution environment has handled any invocation
+_cold = True
+
+
+def is_warm_event(event):
+    """Whether a Lambda event is a warm-up ping rather than an HTTP request."""
+    if not isinstance(event, dict):
+        return False
+    if event.get('warmer') is True:
+        return True
+    # Bare EventBridge schedule (rule target without a constant input)
+    return event.get('source') == 'aws.events' and event.get('detail-type') == 'Scheduled Event'
+
+
+def mark_warm():
+    """Record that this environment has served an invocation."""
+    global _cold
+    _cold = False
+
+
+def prime():
+    """
+    Do the work a first request would otherwise pay for: load the boto3
+    service models and build the resume cache and its encoded bytes.
+    """
+    get_dynamodb_table()
+    get_dynamodb_client()
+    encoding.dumps_cached(resume_all.get_all_resume_data())
+
+
+def _invoke_target(client, function_name):
+    payload = json.dumps({'warmer': True, 'fanout': False}).encode()
+    response = client.invoke(FunctionName=function_name, InvocationType='RequestResponse',
+                             Payload=payload)
+    return 'FunctionError' not in response
+
+
+def fan_out(function_name, count, client=None):
+    """
+    Invoke this function `count` times concurrently.
+
+    Returns:
+        int: Invocations that succeeded
+    """
+    if count <= 0 or not function_name:
+        return 0
+    client = client or boto3.client('lambda', region_name=os.getenv('AWS_REGION', 'us-east-1'))
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        results = list(pool.map(lambda _: _invoke_target(client, function_name), range(count)))
+    return sum(results)
+
+
+def warm(event, context=None, client=None):
+    """
+    Handle a warm-up event.
+
+    Args:
+        event: {"warmer": true, "fanout": bool}; any "concurrency" is ignored
+        context: Lambda context (for the function name)
+        client: Lambda client for the fan-out (injectable for tests)
+
+    Returns:
+        dict: {warmed, cold, invoked, duration_ms}
+    """
+    start = time.perf_counter()
+    cold = _cold
+    mark_warm()
+    metrics.inc('warmer_invocations_total', cold=str(cold).lower())
+
+    try:
+        prime()
+    except Exception as e:
+        # A warmer must never fail loudly; the next real request will retry
+        logger.warning("Warm-up could not build the resume cache: %s", e)
+
+    invoked = 0
+    if event.get('fanout', True):
+        function_name = getattr(context, 'function_name', None) or os.getenv('AWS_LAMBDA_FUNCTION_NAME')
+        try:
+            invoked = fan_out(function_name, CONCURRENCY - 1, client)
+        except Exception as e:
+            logger.warning("Warm-up fan-out failed: %s", e)
+    else:
+        # Stay busy briefly so concurrent targets land on separate environments
+        time.sleep(HOLD_SECONDS)
+
+    return {
+        'warmed': True,
+        'cold': cold,
+        'invoked': invoked,
+        'duration_ms': round((time.perf_counter() - start) * 1000, 1),
+    }
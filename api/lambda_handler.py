@@ -1,9 +1,165 @@
 """
 Lambda handler for FastAPI using Mangum.
 This allows the entire FastAPI app to run in a single Lambda function.
+
+Scheduled warm-up events (see handlers/warmer.py) are answered here
+directly, without routing them through Mangum and the ASGI middleware.
+
+raw_handler is a lighter entry point for API Gateway / Function URL
+(buffered) deployments. GET /api/resume and GET /api/health are answered
+straight from the handlers as pre-encoded proxy responses, without
+importing FastAPI, Starlette, Pydantic or Mangum. Load failures and stale
+fallbacks are answered here too, with the same status and headers as
+routers/resume.py, so a failing request costs one DynamoDB attempt rather
+than a second one in FastAPI. Every other request (and /resume streaming)
+goes to the FastAPI app, imported on first use. Compare with benchmarks/bench_lambda.py.
 """
-from mangum import Mangum
-from main import app
+import os
+from handlers import memprof
+
+# Opt-in allocation tracing (MEMPROF=1), started before the imports it attributes
+if memprof.enabled():
+    memprof.start()
+
+import math
+import time
+import uuid
+import logging_config
+from handlers import cache_policy, encoding, health, metrics, resume_all, warmer
+from handlers.circuit import CircuitOpenError
+from handlers.cors import cors_headers
+
+# Mangum-wrapped FastAPI app, created on first use
+_asgi = None
+
+# Routes carry the /api prefix on Lambda, as in main.py
+PREFIX = "/api" if os.getenv('AWS_LAMBDA_FUNCTION_NAME') is not None else ""
+RESUME_PATH = f"{PREFIX}/resume"
+HEALTH_PATH = f"{PREFIX}/health"
+
+# (dataset, version, body str) — the /resume body decoded once per rebuild
+_resume_body = (None, None, None)
+
+
+def _get_asgi():
+    global _asgi
+    if _asgi is None:
+        from mangum import Mangum
+        from main import app
+        _asgi = Mangum(app)
+    return _asgi
+
+
+def handler(event, context):
+    """Lambda entry point: warm-up events directly, everything else via FastAPI."""
+    if warmer.is_warm_event(event):
+        if _asgi is None:
+            # Cold: pay the FastAPI import here, so the next real request doesn't.
+            # Later pings skip it and return as soon as warm() does
+            _get_asgi()
+        return warmer.warm(event, context)
+    warmer.mark_warm()
+    return _get_asgi()(event, context)
+
+
+# ---------------------------------------------------------------------------
+# Raw fast path
+# ---------------------------------------------------------------------------
+
+def _request_line(event):
+    """(method, path, lowercased headers) for REST (v1) or HTTP API / Function URL (v2) events."""
+    headers = {k.lower(): v for k, v in (event.get('headers') or {}).items()}
+    if 'httpMethod' in event:
+        return event['httpMethod'], event.get('path', ''), headers
+    http = event.get('requestContext', {}).get('http', {})
+    return http.get('method', ''), event.get('rawPath', ''), headers
+
+
+def _proxy_response(status, body, headers):
+    return {'statusCode': status, 'headers': headers, 'body': body, 'isBase64Encoded': False}
+
+
+def _load_error(e):
+    """500, or 503 with Retry-After while the DynamoDB circuit is open (as routers/resume.py)."""
+    headers = {"Content-Type": "application/json", "Vary": "Origin"}
+    if isinstance(e, CircuitOpenError):
+        headers["Retry-After"] = str(max(math.ceil(e.retry_after), 1))
+        detail = "Resume data temporarily unavailable"
+        return 503, encoding.dumps({"detail": detail}).decode('utf-8'), headers
+    detail = f"Error loading resume data: {str(e)}"
+    return 500, encoding.dumps({"detail": detail}).decode('utf-8'), headers
+
+
+def _resume_response():
+    """Pre-encoded /resume body, or the error/stale response FastAPI would give."""
+    global _resume_body
+    try:
+        data = resume_all.get_all_resume_data()
+    except Exception as e:
+        return _load_error(e)
+
+    version = resume_all.get_version()
+    cached_data, cached_version, body = _resume_body
+    if cached_data is not data or cached_version != version:
+        body = encoding.dumps_cached(data).decode('utf-8')
+        _resume_body = (data, version, body)
+    headers = {"Content-Type": "application/json", "Vary": "Accept, Origin",
+               "X-Resume-Version": str(version)}
+    age = resume_all.stale_age()
+    if age is None:
+        headers.update(cache_policy.cache_headers('/resume', version=version))
+    else:
+        # Last good snapshot: never cached downstream (routers/resume.py _stale_headers)
+        headers.update(cache_policy.cache_headers('/resume', version=version, cache_control=False))
+        headers.update({"Warning": '110 - "Response is Stale"',
+                        "X-Resume-Stale-Seconds": str(int(age)),
+                        "Cache-Control": "no-store"})
+    return 200, body, headers
+
+
+def _health_response():
+    result = health.health_check()
+    if result["status"] == "unhealthy":
+        return 503, encoding.dumps({"detail": result}).decode('utf-8'), {
+            "Content-Type": "application/json", "Vary": "Origin"}
+    headers = {"Content-Type": "application/json", "Vary": "Origin"}
+    headers.update(cache_policy.cache_headers('/health'))
+    return 200, encoding.dumps(result).decode('utf-8'), headers
+
+
+def raw_handler(event, context):
+    """
+    Lambda entry point that serves GET /resume and GET /health without the
+    ASGI stack. Everything else is handed to the FastAPI app.
+    """
+    # Same JSON logging as the FastAPI app (a no-op after the first call)
+    logging_config.configure_logging()
+    if warmer.is_warm_event(event):
+        # Warm the fast path only; FastAPI stays unimported until needed
+        return warmer.warm(event, context)
+    warmer.mark_warm()
+
+    method, path, headers = _request_line(event)
+    if method != 'GET' or path not in (RESUME_PATH, HEALTH_PATH) or \
+            (path == RESUME_PATH and 'application/x-ndjson' in headers.get('accept', '')):
+        return _get_asgi()(event, context)
+
+    start = time.perf_counter()
+    request_id = (headers.get('x-request-id') or headers.get('x-amzn-trace-id') or
+                  uuid.uuid4().hex)[:128]
+    token = logging_config.set_request_id(request_id)
+    dimensions = {}
+    try:
+        with metrics.emf_request(dimensions):
+            response = _resume_response() if path == RESUME_PATH else _health_response()
+            dimensions.update(route=path, method=method)
+            metrics.inc('http_requests_total', route=path, method=method, status=response[0])
+            metrics.observe('http_request_duration_seconds', time.perf_counter() - start,
+                            route=path, method=method)
+    finally:
+        logging_config.reset_request_id(token)
 
-# Mangum wraps the FastAPI app for Lambda
-handler = Mangum(app)
\ No newline at end of file
+    status, body, response_headers = response
+    response_headers.update(cors_headers(headers.get('origin')))
+    response_headers["X-Request-ID"] = request_id
+    return _proxy_response(status, body, response_headers)
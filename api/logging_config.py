@@ -0,0 +1,216 @@
+"""
+Non-blocking structured logging.
+
+Log calls on the request path only enqueue a record; a QueueListener thread
+formats it as JSON and does the blocking write to stdout (which CloudWatch
+collects on Lambda). Records are tagged with the current request id.
+
+On Lambda the execution environment is frozen between invocations, which
+can strand records still queued for the listener, so there the handler
+writes directly instead. The write is a small stdout line; it is the
+queue's formatting and I/O isolation that matter under uvicorn.
+
+Environment:
+    LOG_LEVEL       Root level (default INFO)
+    LOG_LEVELS      Per-logger levels, e.g. "handlers.contact=DEBUG,uvicorn.access=WARNING"
+    LOG_SAMPLING    Per-logger sample rates for records below WARNING,
+                    e.g. "uvicorn.access=0.1"
+    LOG_FORMAT      "json" (default) or "text"
+    LOG_QUEUE_SIZE  Max queued records before new ones are dropped (default 10000)
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import time
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+
+_request_id = ContextVar('request_id', default=None)
+
+_listener = None
+_saved = None       # Handlers replaced by configure_logging(), restored on stop
+_dropped = 0
+
+_UVICORN_LOGGERS = ('uvicorn', 'uvicorn.error', 'uvicorn.access')
+
+# Attributes every LogRecord has; anything else was passed via extra=
+_RESERVED = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'request_id'}
+
+
+def set_request_id(request_id):
+    """Bind a request id to the current context. Returns a reset token."""
+    return _request_id.set(request_id)
+
+
+def reset_request_id(token):
+    _request_id.reset(token)
+
+
+def get_request_id():
+    """The request id bound to the current context, if any."""
+    return _request_id.get()
+
+
+class RequestContextFilter(logging.Filter):
+    """Stamp records with the request id while still on the request thread."""
+
+    def filter(self, record):
+        record.request_id = _request_id.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep a fraction of records below WARNING for selected loggers.
+
+    Args:
+        rates: {logger name prefix: keep probability}
+    """
+
+    def __init__(self, rates):
+        super().__init__()
+        # Longest prefix first so "a.b" wins over "a"
+        self.rates = sorted(rates.items(), key=lambda kv: -len(kv[0]))
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        for prefix, rate in self.rates:
+            if record.name == prefix or record.name.startswith(prefix + '.'):
+                return random.random() < rate
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line."""
+
+    def format(self, record):
+        entry = {
+            "ts": time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created))
+                  + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        request_id = getattr(record, 'request_id', None)
+        if request_id:
+            entry["request_id"] = request_id
+        for key, value in vars(record).items():
+            if key not in _RESERVED and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+
+    The stock prepare() copies the record and runs the full formatter
+    (including tracebacks) on the calling thread; here only the %-args are
+    merged in place so later mutation of the arguments cannot change the
+    message. The queue is a C-level SimpleQueue with an approximate bound.
+    """
+
+    def __init__(self, log_queue, max_size):
+        super().__init__(log_queue)
+        self.max_size = max_size
+
+    def prepare(self, record):
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        global _dropped
+        if self.queue.qsize() >= self.max_size:
+            # Never block the request path on a backed-up log sink
+            _dropped += 1
+            return
+        self.queue.put_nowait(record)
+
+
+def dropped_records():
+    """Number of records dropped because the queue was full."""
+    return _dropped
+
+
+def _parse_pairs(value, cast):
+    pairs = {}
+    for part in filter(None, (p.strip() for p in value.split(','))):
+        name, _, setting = part.partition('=')
+        if name and setting:
+            pairs[name.strip()] = cast(setting.strip())
+    return pairs
+
+
+def configure_logging(stream=None, queued=None):
+    """
+    Route all logging through a queue to a background writer thread
+    (or straight to the stream on Lambda).
+
+    Safe to call more than once; later calls are no-ops until stop_logging().
+
+    Args:
+        stream: Output stream (default sys.stdout)
+        queued: Write from a listener thread (default: everywhere but Lambda)
+    """
+    global _listener, _saved
+    if _saved is not None:
+        return
+    if queued is None:
+        queued = os.getenv('AWS_LAMBDA_FUNCTION_NAME') is None
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    if os.getenv('LOG_FORMAT', 'json') == 'text':
+        output.setFormatter(logging.Formatter(
+            "%(asctime)s %(levelname)s %(name)s [%(request_id)s] — %(message)s"
+        ))
+    else:
+        output.setFormatter(JsonFormatter())
+
+    if queued:
+        log_queue = queue.SimpleQueue()
+        handler = _DeferredQueueHandler(log_queue, int(os.getenv('LOG_QUEUE_SIZE', '10000')))
+    else:
+        handler = output
+    handler.addFilter(RequestContextFilter())
+    handler.addFilter(SamplingFilter(_parse_pairs(os.getenv('LOG_SAMPLING', ''), float)))
+
+    root = logging.getLogger()
+    loggers = [root] + [logging.getLogger(name) for name in _UVICORN_LOGGERS]
+    _saved = [(logger, logger.handlers[:], logger.propagate) for logger in loggers]
+    root.handlers = [handler]
+    root.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+
+    for name, level in _parse_pairs(os.getenv('LOG_LEVELS', ''), str.upper).items():
+        logging.getLogger(name).setLevel(level)
+
+    # uvicorn installs its own blocking stream handlers; send them through the queue
+    for name in _UVICORN_LOGGERS:
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers = []
+        uvicorn_logger.propagate = True
+
+    if queued:
+        _listener = QueueListener(log_queue, output, respect_handler_level=True)
+        _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    """Flush queued records, stop the writer thread and restore the original handlers."""
+    global _listener, _saved
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _saved is not None:
+        for logger, handlers, propagate in _saved:
+            logger.handlers = handlers
+            logger.propagate = propagate
+        _saved = None
@@ -7,18 +7,36 @@ education, skills, and contact form. Auto-seeds database from Excel on startup.
 This module manages the routers that are exposed as endpoints under /api.
 """
 import os
+from handlers import memprof
+
+# Opt-in allocation tracing (MEMPROF=1). Started before the other imports
+# so /debug/memory can attribute their memory to each package.
+if memprof.enabled():
+    memprof.start()
+
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from routers.health import router as health_router
 from routers.contact import router as contact_router
 from routers.resume import router as resume_router
+from routers.metrics import router as metrics_router
+from routers.chat import router as chat_router
+from routers.projects import router as projects_router
+from routers.warmer import router as warmer_router
+from routers.memory import router as memory_router
 from fastapi.middleware.cors import CORSMiddleware
-import logging
+from handlers.cors import ALLOWED_ORIGINS
+from middleware.cache_control import CacheControlMiddleware
+from middleware.events import LambdaEventsMiddleware
+from middleware.memprof import MemoryProfilingMiddleware
+from middleware.metrics import MetricsMiddleware
+from middleware.timing import ServerTimingMiddleware
+from middleware.profiling import ProfilingMiddleware, profiling_enabled
+from middleware.request_id import RequestIdMiddleware
+from logging_config import configure_logging, stop_logging
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s %(name)s — %(message)s"
-)
+# Structured JSON logs, written off the request path by a queue listener
+configure_logging()
 
 
 @asynccontextmanager
@@ -32,7 +50,8 @@ async def lifespan(app):
         from seed import seed_database
         seed_database()
     yield
-    # Shutdown: cleanup code here if needed
+    # Shutdown: flush queued log records
+    stop_logging()
 
 
 # Initialize FastAPI app with lifespan and API prefix
@@ -44,12 +63,33 @@ app = FastAPI(
 # CORS configuration
 app.add_middleware(
     CORSMiddleware,
-allow_origins=["https://robrose.info", "https://www.robrose.info", "http://localhost:8080"],
+    allow_origins=list(ALLOWED_ORIGINS),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Per-route Cache-Control and surrogate keys for CloudFront (handlers/cache_policy.py)
+app.add_middleware(CacheControlMiddleware)
+
+# Opt-in request profiler (PROFILE_SAMPLE_RATE / PROFILE_SECRET).
+# Not installed at all when disabled, so it costs nothing per request.
+if profiling_enabled():
+    app.add_middleware(ProfilingMiddleware)
+
+# Peak/retained memory per route (MEMPROF=1), not installed otherwise
+if memprof.enabled():
+    app.add_middleware(MemoryProfilingMiddleware)
+
+# Server-Timing breakdown header (sampled via SERVER_TIMING_SAMPLE_RATE)
+app.add_middleware(ServerTimingMiddleware)
+
+# Per-route request counts and latency histograms
+app.add_middleware(MetricsMiddleware)
+
+# Request id for log correlation (outermost, so every log line is tagged)
+app.add_middleware(RequestIdMiddleware)
+
 # Detect if running in Lambda (adds /api prefix only in Lambda)
 # Locally, Nginx already adds /api, so we don't need the prefix
 is_lambda = os.getenv('AWS_LAMBDA_FUNCTION_NAME') is not None
@@ -58,4 +98,20 @@ prefix = "/api" if is_lambda else ""
 # Include routers
 app.include_router(health_router, prefix=prefix)
 app.include_router(resume_router, prefix=prefix)
-app.include_router(contact_router, prefix=prefix)
\ No newline at end of file
+app.include_router(contact_router, prefix=prefix)
+app.include_router(chat_router, prefix=prefix)
+app.include_router(projects_router, prefix=prefix)
+
+# Memory report for right-sizing the Lambda (MEMPROF=1 only)
+if memprof.enabled():
+    app.include_router(memory_router, prefix=prefix)
+
+# Prometheus scrape endpoint under uvicorn; Lambda emits EMF log lines instead
+if not is_lambda:
+    app.include_router(metrics_router)
+else:
+    # Warm-up events passed through by the Lambda Web Adapter, served by a
+    # bare app in front of the middleware stack (middleware/events.py)
+    events_app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
+    events_app.include_router(warmer_router)
+    app.add_middleware(LambdaEventsMiddleware, events_app=events_app)
@@ -0,0 +1,76 @@
+"""
+ASGI middleware adding CDN Cache-Control and surrogate-key headers.
+
+Successful GET/HEAD responses (and 304 revalidations) from routes in
+handlers/cache_policy.py get that route's Cache-Control and its tags.
+A route that set its own Cache-Control keeps it: stale fallbacks
+(no-store), NDJSON streams (no-cache) and /projects. Errors and other methods are left uncacheable.
+
+Requests carrying X-Debug-Profile are profiled (middleware/profiling.py),
+so their responses get no-store instead: a profiled response is never
+cached. The header is also in CloudFront's cache key (terraform/cloudfront.tf),
+so such requests always reach the origin rather than a cached copy.
+"""
+from urllib.parse import parse_qs
+from handlers import cache_policy
+from middleware.profiling import DEBUG_HEADER
+
+_CACHE_CONTROL = b'cache-control'
+_NO_STORE = {"Cache-Control": "no-store"}
+_VERSION = b'x-resume-version'
+_PREFIX = '/api'
+
+
+class CacheControlMiddleware:
+    """Apply the per-route caching policy to successful reads."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] not in ('GET', 'HEAD'):
+            await self.app(scope, receive, send)
+            return
+
+        debug = any(key == DEBUG_HEADER for key, _ in scope.get('headers', ()))
+
+        async def send_wrapper(message):
+            if message['type'] == 'http.response.start' and message['status'] in (200, 304):
+                headers = list(message.get('headers', []))
+                if debug:
+                    headers = [(k, v) for k, v in headers if k != _CACHE_CONTROL]
+                    extra = _NO_STORE
+                else:
+                    extra = _cache_headers(scope, headers)
+                if extra:
+                    headers.extend((k.lower().encode('latin-1'), v.encode('latin-1'))
+                                   for k, v in extra.items())
+                    message = {**message, 'headers': headers}
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _cache_headers(scope, headers):
+    route = scope.get('route')
+    if route is None:
+        return {}
+    template = getattr(route, 'path', '')
+    if template.startswith(_PREFIX + '/'):
+        template = template[len(_PREFIX):]
+
+    version = None
+    has_cache_control = False
+    for key, value in headers:
+        if key == _CACHE_CONTROL:
+            has_cache_control = True
+        elif key == _VERSION:
+            version = value.decode('latin-1')
+
+    section = None
+    if template == '/resume/search':
+        section = parse_qs(scope.get('query_string', b'').decode('latin-1')).get('section', [None])[0]
+    return cache_policy.cache_headers(
+        template, scope.get('path_params'), section=section, version=version,
+        cache_control=not has_cache_control
+    )
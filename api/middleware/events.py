@@ -0,0 +1,26 @@
+"""
+ASGI dispatcher keeping Lambda pass-through events out of the middleware stack.
+
+Under the web adapter (run.sh) non-HTTP events, such as the EventBridge
+warm-up schedule, arrive through uvicorn as POST /events. They are not
+visitor requests: request ids, metrics, Server-Timing, Cache-Control and
+CORS mean nothing for them, and a warm ping should return as fast as the
+warm-up itself allows. main.py installs this outermost on Lambda, so
+/events goes straight to a bare app holding routers/warmer.py.
+"""
+
+EVENTS_PATH = '/events'
+
+
+class LambdaEventsMiddleware:
+    """Send /events to events_app, everything else down the normal stack."""
+
+    def __init__(self, app, events_app):
+        self.app = app
+        self.events_app = events_app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http' and scope['path'] == EVENTS_PATH:
+            await self.events_app(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
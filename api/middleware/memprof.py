@@ -0,0 +1,40 @@
+"""
+ASGI middleware recording each route as a memory phase (handlers/memprof.py).
+
+Phases are named "<METHOD> <route template>", without the Lambda /api
+prefix, e.g. "GET /resume/{tenant}". They cover the whole request, so the
+cache build and encoding it triggers are included in its peak.
+
+main.py only installs the middleware when MEMPROF=1.
+"""
+from handlers import memprof
+
+_PREFIX = '/api'
+
+
+class MemoryProfilingMiddleware:
+    """Measure peak and retained memory per route."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        frame = memprof.begin()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            memprof.end(frame, f"{scope['method']} {_route(scope)}")
+
+
+def _route(scope):
+    route = scope.get('route')
+    if route is None:
+        return 'unmatched'
+    template = getattr(route, 'path', '')
+    if template.startswith(_PREFIX + '/'):
+        template = template[len(_PREFIX):]
+    return template
@@ -0,0 +1,177 @@
+"""
+Opt-in request profiler.
+
+Profiles a sampled fraction of requests (PROFILE_SAMPLE_RATE) and any
+request carrying a valid signed X-Debug-Profile header (PROFILE_SECRET).
+A background thread samples Python stacks every PROFILE_INTERVAL_MS and
+writes them as collapsed stacks ("a;b;c 12" per line, openable in
+speedscope or flamegraph.pl) to PROFILE_DIR, rotating old dumps to stay
+under PROFILE_MAX_FILES / PROFILE_MAX_BYTES.
+
+Merge dumps into a ranked report with scripts/profile_report.py.
+
+main.py only installs the middleware when profiling_enabled() is true,
+so a disabled profiler adds no per-request work at all.
+"""
+import hashlib
+import hmac
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from starlette.concurrency import run_in_threadpool
+
+SAMPLE_RATE = float(os.getenv('PROFILE_SAMPLE_RATE', '0'))
+SECRET = os.getenv('PROFILE_SECRET', '')
+PROFILE_DIR = os.getenv('PROFILE_DIR', '/tmp/profiles')
+INTERVAL = float(os.getenv('PROFILE_INTERVAL_MS', '1')) / 1000
+MAX_FILES = int(os.getenv('PROFILE_MAX_FILES', '50'))
+MAX_BYTES = int(os.getenv('PROFILE_MAX_BYTES', str(20 * 1024 * 1024)))
+
+DEBUG_HEADER = b'x-debug-profile'
+
+# Frames from these directories mark a thread as doing request work.
+# (On Lambda dependencies live next to the app code, so the app root
+# itself is too broad.)
+_APP_ROOT = Path(__file__).resolve().parent.parent
+_APP_DIRS = tuple(str(_APP_ROOT / name) for name in ('handlers', 'routers'))
+
+
+def profiling_enabled():
+    """Whether any request could be profiled with the current config."""
+    return SAMPLE_RATE > 0 or bool(SECRET)
+
+
+def sign_debug_token(secret, ttl=300):
+    """
+    Create an X-Debug-Profile header value valid for ttl seconds.
+
+    Format: "<unix expiry>.<hex HMAC-SHA256(secret, expiry)>"
+    """
+    expires = str(int(time.time()) + ttl)
+    digest = hmac.new(secret.encode(), expires.encode(), hashlib.sha256).hexdigest()
+    return f"{expires}.{digest}"
+
+
+def verify_debug_token(token, secret):
+    """Check an X-Debug-Profile header value against the secret."""
+    if not secret or '.' not in token:
+        return False
+    expires, digest = token.split('.', 1)
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    expected = hmac.new(secret.encode(), expires.encode(), hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, digest)
+
+
+class StackSampler:
+    """
+    Wall-clock stack sampler.
+
+    Samples the thread that started it plus any thread currently executing
+    app code (FastAPI runs sync endpoints in a threadpool). Samples are
+    process-wide, so concurrent requests can appear in each other's dumps.
+    """
+
+    def __init__(self, interval=INTERVAL):
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._owner = None
+
+    def start(self):
+        self._owner = threading.get_ident()
+        self._thread = threading.Thread(target=self._run, name='profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == me:
+                    continue
+                stack = _collapse(frame)
+                if thread_id == self._owner or any(d in stack for d in _APP_DIRS):
+                    self.stacks[stack] += 1
+                    self.samples += 1
+
+    def dump(self):
+        """Render samples in collapsed-stack format."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def _collapse(frame):
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+        frame = frame.f_back
+    names.reverse()
+    return ";".join(names)
+
+
+def write_dump(directory, name, body):
+    """
+    Write a dump and rotate the directory to stay within the caps.
+
+    Returns:
+        Path: The written file
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_text(body)
+
+    dumps = sorted(directory.glob('*.collapsed'), key=lambda p: p.stat().st_mtime)
+    total = sum(p.stat().st_size for p in dumps)
+    while dumps and (len(dumps) > MAX_FILES or total > MAX_BYTES):
+        oldest = dumps.pop(0)
+        total -= oldest.stat().st_size
+        oldest.unlink(missing_ok=True)
+    return path
+
+
+class ProfilingMiddleware:
+    """Profile sampled or explicitly requested HTTP requests."""
+
+    def __init__(self, app, sample_rate=None, secret=None, directory=None):
+        self.app = app
+        self.sample_rate = SAMPLE_RATE if sample_rate is None else sample_rate
+        self.secret = SECRET if secret is None else secret
+        self.directory = directory or PROFILE_DIR
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        sampler = StackSampler()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            sampler.stop()
+            if sampler.samples:
+                name = f"{int(time.time() * 1000)}-{scope['method']}-{_slug(scope['path'])}.collapsed"
+                await run_in_threadpool(write_dump, self.directory, name, sampler.dump())
+
+    def _should_profile(self, scope):
+        if self.secret:
+            for key, value in scope.get('headers', []):
+                if key == DEBUG_HEADER:
+                    return verify_debug_token(value.decode('latin-1'), self.secret)
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+
+def _slug(path):
+    return re.sub(r'[^A-Za-z0-9]+', '_', path).strip('_') or 'root'
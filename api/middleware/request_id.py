@@ -0,0 +1,49 @@
+"""
+ASGI middleware that binds a request id for log correlation.
+
+Reuses an incoming X-Request-ID header, falls back to the AWS trace id,
+and otherwise generates one. The id is echoed back as X-Request-ID.
+"""
+import uuid
+import logging_config
+
+_REQUEST_ID = b'x-request-id'
+_TRACE_ID = b'x-amzn-trace-id'
+
+
+class RequestIdMiddleware:
+    """Bind a request id to the context for the lifetime of the request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _incoming_id(scope.get('headers', [])) or uuid.uuid4().hex
+        encoded = request_id.encode('latin-1')
+
+        async def send_wrapper(message):
+            if message['type'] == 'http.response.start':
+                headers = list(message.get('headers', []))
+                headers.append((_REQUEST_ID, encoded))
+                message = {**message, 'headers': headers}
+            await send(message)
+
+        token = logging_config.set_request_id(request_id)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            logging_config.reset_request_id(token)
+
+
+def _incoming_id(headers):
+    trace_id = None
+    for key, value in headers:
+        if key == _REQUEST_ID:
+            return value.decode('latin-1')[:128]
+        if key == _TRACE_ID:
+            trace_id = value.decode('latin-1')[:128]
+    return trace_id
@@ -0,0 +1,46 @@
+"""
+ASGI middleware that attaches a Server-Timing header to API responses.
+
+Sampling is controlled by SERVER_TIMING_SAMPLE_RATE (0.0–1.0, default 1.0).
+Unsampled requests skip span collection entirely.
+"""
+import os
+import random
+import time
+from handlers import timing
+
+SAMPLE_RATE = float(os.getenv('SERVER_TIMING_SAMPLE_RATE', '1.0'))
+
+
+class ServerTimingMiddleware:
+    """Collect handler spans and emit them with a total app span."""
+
+    def __init__(self, app, sample_rate=None):
+        self.app = app
+        self.sample_rate = SAMPLE_RATE if sample_rate is None else sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or not self._sampled():
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        spans, token = timing.start()
+
+        async def send_wrapper(message):
+            if message['type'] == 'http.response.start':
+                spans.append(('app', time.perf_counter() - start, None))
+                headers = list(message.get('headers', []))
+                headers.append((b'server-timing', timing.header_value(spans).encode('latin-1')))
+                message = {**message, 'headers': headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            timing.stop(token)
+
+    def _sampled(self):
+        if self.sample_rate >= 1.0:
+            return True
+        return self.sample_rate > 0.0 and random.random() < self.sample_rate
@@ -0,0 +1,47 @@
+"""
+FastAPI router for the resume chat endpoint.
+
+Streams the answer as Server-Sent Events in the format the chat widget
+reads: `data: {"token": ...}` chunks, a `sources` event, then `[DONE]`.
+"""
+import json
+from typing import Optional
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from handlers import chat
+
+router = APIRouter()
+
+
+class ChatRequest(BaseModel):
+    message: str = Field(min_length=1, max_length=500)
+    bot_id: Optional[str] = None
+
+
+def _sse(chunks, sources):
+    try:
+        for chunk in chunks:
+            yield f"data: {json.dumps({'token': chunk})}\n\n"
+        yield f"data: {json.dumps({'sources': sources})}\n\n"
+    except Exception:
+        yield f"data: {json.dumps({'error': 'Failed to generate answer'})}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+@router.post("/chat")
+def chat_endpoint(request: ChatRequest):
+    """Answer a question about the resume, streamed token by token."""
+    try:
+        chunks, sources = chat.answer_question(request.message)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error loading resume data: {str(e)}"
+        )
+
+    return StreamingResponse(
+        _sse(chunks, sources),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,33 @@
+"""
+FastAPI router for the memory profiling report (handlers/memprof.py).
+Only mounted when MEMPROF=1. Every request needs a signed X-Debug-Profile
+header, as for the request profiler; without PROFILE_SECRET the endpoint
+always answers 403, since each report takes a full tracemalloc snapshot
+and lists file paths.
+"""
+from fastapi import APIRouter, Header, HTTPException, Query
+from handlers import memprof
+from middleware import profiling
+
+router = APIRouter()
+
+
+@router.get("/debug/memory", include_in_schema=False)
+def memory_report(
+    limit: int = Query(memprof.TOP_SITES, ge=1, le=100),
+    reset: bool = False,
+    x_debug_profile: str = Header(default=''),
+):
+    """
+    Per-phase peak/retained bytes, traced bytes by package and top allocation sites.
+
+    Args:
+        limit: Number of packages and allocation sites to list
+        reset: Forget the recorded phases after reporting them
+    """
+    if not profiling.SECRET or not profiling.verify_debug_token(x_debug_profile, profiling.SECRET):
+        raise HTTPException(status_code=403, detail="Invalid debug token")
+    body = memprof.report(limit)
+    if reset:
+        memprof.reset()
+    return body
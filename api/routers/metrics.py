@@ -0,0 +1,18 @@
+"""
+FastAPI router for the Prometheus metrics endpoint.
+Only mounted when running under uvicorn; Lambda emits EMF log lines instead.
+"""
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from handlers import metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics_endpoint():
+    """Expose request and data-layer metrics in Prometheus text format."""
+    return PlainTextResponse(
+        metrics.render_prometheus(),
+        media_type="text/plain; version=0.0.4"
+    )
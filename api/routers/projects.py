@@ -0,0 +1,37 @@
+"""
+FastAPI router for the Projects section's GitHub feed.
+Uses handler logic from handlers — see handlers/projects.py.
+"""
+import re
+from typing import Optional
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
+from handlers import encoding, projects
+
+router = APIRouter()
+
+REPO_NAME = re.compile(r'^[A-Za-z0-9._-]{1,100}$')
+MAX_REPOS = 30
+
+
+@router.get("/projects")
+def get_projects(repos: Optional[str] = None):
+    """
+    GitHub repos for the Projects section, trimmed to the rendered fields.
+
+    `?repos=a,b,c` limits (and orders) the result to the repos listed in
+    app/scripts/projects.config.js.
+    """
+    names = None
+    if repos is not None:
+        names = [name.strip() for name in repos.split(',') if name.strip()]
+        if len(names) > MAX_REPOS or not all(REPO_NAME.match(name) for name in names):
+            raise HTTPException(status_code=400, detail="repos must be up to 30 GitHub repo names")
+
+    try:
+        body = encoding.dumps({"repos": projects.get_projects(names)})
+    except Exception:
+        raise HTTPException(status_code=502, detail="Failed to load GitHub repos")
+    # Browsers and CloudFront may reuse it briefly; the server-side cache does the rest
+    return Response(content=body, media_type="application/json",
+                    headers={"Cache-Control": "public, max-age=300"})
@@ -1,26 +1,212 @@
 """
 FastAPI router for resume endpoint.
 
-Single endpoint returns all resume data in one payload.
+Single endpoint returns all resume data in one payload, or one section per
+line with `Accept: application/x-ndjson`.
 Data is cached at the handler level — see handlers/resume_all.py.
+While DynamoDB is failing, /resume serves the last good snapshot with a
+`Warning: 110` header, or a 503 with Retry-After when there is none.
+/resume.pdf renders the same dataset as a PDF (see handlers/pdf.py).
 """
-from fastapi import APIRouter, HTTPException
-from handlers.resume_all import get_all_resume_data
+import math
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Path, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from handlers import encoding, pdf, search, tenant_cache, timing
+from handlers.circuit import CircuitOpenError
+from handlers.resume_all import (
+    get_all_resume_data, get_changes, get_version, iter_resume_sections, stale_age
+)
+
+NDJSON = "application/x-ndjson"
 
 router = APIRouter()
 
 
+def _json(body, **headers):
+    return Response(content=body, media_type="application/json", headers=headers or None)
+
+
+def _load_error(e):
+    """HTTPException for a failed data load: 503 while the DynamoDB circuit is open."""
+    if isinstance(e, CircuitOpenError):
+        return HTTPException(
+            status_code=503,
+            detail="Resume data temporarily unavailable",
+            headers={"Retry-After": str(max(math.ceil(e.retry_after), 1))}
+        )
+    return HTTPException(
+        status_code=500,
+        detail=f"Error loading resume data: {str(e)}"
+    )
+
+
+def _stale_headers():
+    """Staleness headers when the request was served the last good snapshot."""
+    age = stale_age()
+    if age is None:
+        return {}
+    return {
+        "Warning": '110 - "Response is Stale"',
+        "X-Resume-Stale-Seconds": str(int(age)),
+        "Cache-Control": "no-store",
+    }
+
+
+def _ndjson_line(section, data):
+    return encoding.dumps({"section": section, "data": data}) + b"\n"
+
+
+def _ndjson(first, sections):
+    yield _ndjson_line(*first)
+    try:
+        for section, data in sections:
+            yield _ndjson_line(section, data)
+    except Exception:
+        # Headers are already sent; report the failure in-band
+        yield encoding.dumps({"error": "Error loading resume data"}) + b"\n"
+
+
+def _stream_resume():
+    sections = iter_resume_sections()
+    try:
+        # Pull the first section before committing to a 200
+        first = next(sections)
+    except Exception as e:
+        raise _load_error(e)
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "Vary": "Accept"}
+    headers.update(_stale_headers())
+    return StreamingResponse(_ndjson(first, sections), media_type=NDJSON, headers=headers)
+
+
 @router.get("/resume")
-def get_resume():
+def get_resume(request: Request):
     """
     Return complete resume data: profile, work experience, education, skills.
     
     Single DynamoDB scan on first call, cached for subsequent requests.
+
+    With `Accept: application/x-ndjson` the response streams one
+    `{"section": ..., "data": ...}` line per section, profile first.
+    """
+    if NDJSON in request.headers.get("accept", ""):
+        return _stream_resume()
+
+    try:
+        data = get_all_resume_data()
+    except Exception as e:
+        raise _load_error(e)
+
+    with timing.span('encode'):
+        # Encoded once per cache rebuild; later requests reuse the bytes
+        body = encoding.dumps_cached(data)
+    return _json(body, Vary="Accept", **{"X-Resume-Version": str(get_version())}, **_stale_headers())
+
+
+def _etag_matches(if_none_match, etag):
+    """Whether an If-None-Match header lists the ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+@router.get("/resume.pdf")
+def get_resume_pdf(request: Request):
+    """
+    Download the resume as a PDF, rendered from the live data.
+
+    Rendered once per data change and cached (memory and disk). The ETag is
+    the content hash, so `If-None-Match` revalidation gets a 304.
     """
     try:
-        return get_all_resume_data()
+        data = get_all_resume_data()
     except Exception as e:
+        raise _load_error(e)
+
+    # A sync endpoint: FastAPI runs it in the threadpool, so rendering never
+    # blocks the event loop
+    key = pdf.content_key(data)
+    headers = {"ETag": f'"{key}"', "X-Resume-Version": str(get_version()), **_stale_headers()}
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    with timing.span('pdf'):
+        body = pdf.get_pdf(data, key)
+    headers["Content-Disposition"] = 'inline; filename="resume.pdf"'
+    return Response(content=body, media_type="application/pdf", headers=headers)
+
+
+@router.get("/resume/changes")
+def get_resume_changes(since: int = Query(..., ge=0)):
+    """
+    Items added, changed and removed since a version.
+
+    Start from the X-Resume-Version header of /resume (or the `version` of a
+    previous call). Falls back to the full resume (`"full": true`) when that
+    version is unknown or no longer in the history.
+    """
+    try:
+        changes = get_changes(since)
+    except Exception as e:
+        raise _load_error(e)
+
+    with timing.span('encode'):
+        return _json(encoding.dumps(changes), **_stale_headers())
+
+
+@router.get("/resume/search")
+def search_resume(
+    q: str = "",
+    section: Optional[str] = None,
+    skill: Optional[str] = None,
+    prefix: bool = True,
+    limit: int = Query(20, ge=1, le=100)
+):
+    """
+    Full-text search over the resume with skill facets and highlighting.
+
+    Examples: ?q=serverless, ?skill=Terraform&section=work_experience, ?q=terra
+    """
+    if not q.strip() and not skill:
+        raise HTTPException(status_code=400, detail="Provide a query (q) or a skill")
+    if section is not None and section not in search.SECTIONS:
         raise HTTPException(
-            status_code=500,
-            detail=f"Error loading resume data: {str(e)}"
+            status_code=400,
+            detail=f"section must be one of: {', '.join(search.SECTIONS)}"
         )
+
+    try:
+        return _json(encoding.dumps(
+            search.search(q, section=section, skill=skill, prefix=prefix, limit=limit)
+        ), **_stale_headers())
+    except Exception as e:
+        raise _load_error(e)
+
+
+@router.get("/resume/search/stats")
+def search_stats():
+    """Search index size and build time for the current resume dataset."""
+    try:
+        return _json(encoding.dumps(search.get_index().stats()), **_stale_headers())
+    except Exception as e:
+        raise _load_error(e)
+
+
+# Declared last: /resume/search and /resume/changes must match before this
+@router.get("/resume/{tenant}")
+def get_tenant_resume(tenant: str = Path(pattern=tenant_cache.TENANT_PATTERN)):
+    """
+    Return one tenant's resume (multi-tenant hosting).
+
+    Served from a byte-bounded per-tenant LRU; see handlers/tenant_cache.py.
+    """
+    if tenant in tenant_cache.RESERVED_TENANTS:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    try:
+        body = tenant_cache.get_tenant_resume(tenant)
+    except Exception as e:
+        raise _load_error(e)
+    if body is None:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    return _json(body)
@@ -0,0 +1,31 @@
+"""
+FastAPI router for warm-up events delivered by the Lambda Web Adapter.
+
+Under the web adapter (run.sh), non-HTTP events such as the EventBridge
+warm-up schedule are POSTed to /events. Mounted on Lambda only, without
+the /api prefix, on a bare app that middleware/events.py dispatches to
+ahead of the middleware stack. The Mangum entry point (lambda_handler.py) handles the
+same events before they reach FastAPI.
+
+The route is reachable from the public Function URL too, so only genuine
+pass-through events are accepted. The adapter adds x-amzn-request-context
+to every request it converts from an HTTP event (Function URL, API
+Gateway), and Mangum puts the HTTP event in the scope; pass-through events
+have neither. Either way the fan-out size comes from WARM_CONCURRENCY.
+"""
+from fastapi import APIRouter, Body, HTTPException, Request
+from handlers import warmer
+
+router = APIRouter()
+
+# Set by the Lambda Web Adapter on requests converted from HTTP events
+_HTTP_CONTEXT_HEADER = 'x-amzn-request-context'
+
+
+@router.post("/events", include_in_schema=False)
+def lambda_event(request: Request, event: dict = Body(...)):
+    """Handle a warm-up event; any other pass-through event is not ours."""
+    if _HTTP_CONTEXT_HEADER in request.headers or 'aws.event' in request.scope \
+            or not warmer.is_warm_event(event):
+        raise HTTPException(status_code=404, detail="Unsupported event")
+    return warmer.warm(event, request.scope.get("aws.context"))
@@ -1,10 +1,13 @@
 import boto3
+import logging
 import os
 import time
 import subprocess
 import sys
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 def seed_database():
     """Seed DynamoDB with initial data if table is empty"""
     dynamodb = boto3.resource(
@@ -18,33 +21,32 @@ def seed_database():
     table = dynamodb.Table('ResumeData')
     
     # Wait for table to exist (retry up to 10 times)
-    print("Waiting for DynamoDB table...")
+    logger.info("Waiting for DynamoDB table...")
     for i in range(10):
         try:
             response = table.scan(Limit=1)
             break
         except Exception as e:
             if i < 9:
-                print(f"  Table not ready yet, retrying... ({i+1}/10)")
+                logger.info("Table not ready yet, retrying... (%d/10)", i + 1)
                 time.sleep(2)
             else:
-                print("  Table not available after 10 retries, skipping seed")
+                logger.warning("Table not available after 10 retries, skipping seed")
                 return
     
     # Check if table has data
     if response['Count'] > 0:
-        print("Database already seeded, skipping...")
+        logger.info("Database already seeded, skipping...")
         return
     
     # Load data from Excel template
     template_path = Path("/app/scripts/resume-data-template.xlsx")
     
     if not template_path.exists():
-        print(f"⚠️  Template file not found at {template_path}")
-        print("  Skipping database seed")
+        logger.warning("Template file not found at %s, skipping database seed", template_path)
         return
     
-    print(f"📊 Loading resume data from template...")
+    logger.info("Loading resume data from template...")
     
     # Run load_resume.py script
     try:
@@ -54,11 +56,9 @@ def seed_database():
             text=True,
             check=True
         )
-        print(result.stdout)
-        print("✅ Database seeding complete")
+        logger.info("%s", result.stdout)
+        logger.info("Database seeding complete")
     except subprocess.CalledProcessError as e:
-        print(f"❌ Error loading resume data:")
-        print(e.stderr)
-        print("  Database seed failed")
+        logger.error("Error loading resume data, database seed failed:\n%s", e.stderr)
     except Exception as e:
-        print(f"❌ Unexpected error during seed: {e}")
+        logger.exception("Unexpected error during seed: %s", e)
@@ -1,8 +1,22 @@
 #!/bin/bash
 # API Container Startup Script
+#
+# Usage: startup.sh [dev|workers]   (default: $API_MODE, else dev)
+#   dev      Single process with --reload (docker compose)
+#   workers  $WEB_CONCURRENCY worker processes (default: one per CPU) sharing
+#            one resume snapshot in $RESUME_SHARED_CACHE
+
+MODE="${1:-${API_MODE:-dev}}"
 
 echo "🚀 Starting API container..."
 
+if [ "$MODE" = "workers" ]; then
+    export RESUME_SHARED_CACHE="${RESUME_SHARED_CACHE:-/dev/shm/resume.snapshot}"
+    WORKERS="${WEB_CONCURRENCY:-$(nproc)}"
+    echo "🌐 Starting FastAPI server with ${WORKERS} workers..."
+    exec uvicorn main:app --host 0.0.0.0 --port 8000 --workers "$WORKERS"
+fi
+
 # Start the API server
 echo "🌐 Starting FastAPI server..."
 exec uvicorn main:app --host 0.0.0.0 --port 8000 --reload
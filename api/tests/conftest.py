@@ -6,3 +6,62 @@ import os
 
 # Add the parent directory to Python path so we can import shared
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+import pytest
+
+
+def make_items():
+    """Raw DynamoDB items (as boto3 returns them) for a small resume."""
+    return [
+        {'id': 'profile', 'type': 'profile', 'name': 'Test Person', 'title': 'Cloud Engineer',
+         'summary': 'Builds serverless systems on AWS.', 'location': 'Nashville, TN'},
+        {'id': 'work_001', 'type': 'work_experience', 'job_title': 'Senior Engineer',
+         'company_name': 'Acme', 'start_date': '2021-01', 'end_date': None, 'is_current': True,
+         'is_additional': False, 'description': 'Leads the platform team.',
+         'accomplishments': ['Migrated services to AWS Lambda with Terraform',
+                             'Cut DynamoDB costs by 40%']},
+        {'id': 'work_002', 'type': 'work_experience', 'job_title': 'Engineer',
+         'company_name': 'Globex', 'start_date': '2017-06', 'end_date': '2020-12',
+         'is_current': False, 'is_additional': False, 'description': 'Built internal APIs in Python.',
+         'accomplishments': ['Shipped a FastAPI billing service']},
+        {'id': 'work_003', 'type': 'work_experience', 'job_title': 'Intern',
+         'company_name': 'Initech', 'start_date': '2016-05', 'end_date': '2016-08',
+         'is_current': False, 'is_additional': True, 'description': '', 'accomplishments': []},
+        {'id': 'edu_001', 'type': 'education', 'degree': 'BS Computer Science',
+         'institution': 'State University', 'start_date': '2012', 'end_date': '2016',
+         'description': ''},
+        {'id': 'skills_001', 'type': 'skills', 'category': 'Cloud',
+         'skills': ['AWS', 'Terraform', 'Lambda'], 'sort_order': Decimal('1')},
+        {'id': 'skills_002', 'type': 'skills', 'category': 'Languages',
+         'skills': ['Python', 'JavaScript'], 'sort_order': Decimal('2')},
+    ]
+
+
+@pytest.fixture
+def fake_table(monkeypatch):
+    """Serve make_items() from a mocked DynamoDB table with an empty cache."""
+    from handlers import circuit, resume_all
+
+    circuit.dynamodb.reset()
+    table = MagicMock()
+    # Untagged items, as in a single-resume table: the TenantIndex Query is
+    # empty and the default tenant falls back to the filtered scan
+    table.query.side_effect = lambda **kwargs: {'Items': []}
+    table.scan.side_effect = lambda **kwargs: {'Items': make_items()}
+    monkeypatch.setattr(resume_all, 'get_dynamodb_table', lambda: table)
+    resume_all.clear_cache()
+    yield table
+    resume_all.clear_cache()
+
+
+@pytest.fixture(autouse=True)
+def last_good_path(tmp_path, monkeypatch):
+    """Keep each test's last good resume snapshot out of the real temp dir."""
+    from handlers import resume_all
+
+    path = str(tmp_path / 'resume-last-good.json')
+    monkeypatch.setattr(resume_all, 'LAST_GOOD_PATH', path)
+    monkeypatch.setattr(resume_all, '_last_good', None)
+    return path
@@ -0,0 +1,68 @@
+"""
+Tests for the CDN caching policy middleware.
+"""
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from handlers import cache_policy, resume_all
+from middleware.cache_control import CacheControlMiddleware
+from routers.health import router as health_router
+from routers.resume import router as resume_router
+
+
+def _client():
+    app = FastAPI()
+    app.add_middleware(CacheControlMiddleware)
+    app.include_router(health_router)
+    app.include_router(resume_router)
+    return TestClient(app)
+
+
+def test_resume_gets_cdn_policy_and_tags(fake_table):
+    """Test /resume carries s-maxage/stale directives and version and section tags."""
+    response = _client().get('/resume')
+
+    assert response.headers['Cache-Control'] == cache_policy.POLICIES['/resume']
+    assert 's-maxage=' in response.headers['Cache-Control']
+    assert 'stale-if-error=' in response.headers['Cache-Control']
+    tags = response.headers['Surrogate-Key'].split()
+    assert tags[:2] == ['resume', f"resume-v{response.headers['X-Resume-Version']}"]
+    assert 'section-skills' in tags
+    assert response.headers['Cache-Tag'] == ','.join(tags)
+
+
+def test_search_and_tenant_tags(fake_table):
+    """Test a section-limited search is tagged with that section only."""
+    client = _client()
+    tags = client.get('/resume/search', params={'q': 'aws', 'section': 'skills'}).headers['Surrogate-Key']
+    assert tags == 'resume section-skills'
+
+    assert cache_policy.tags_for('/resume/{tenant}', {'tenant': 'jane-doe'}) == ['tenant-jane-doe']
+
+
+def test_route_cache_control_and_errors_left_alone(fake_table, monkeypatch):
+    """Test stale responses keep no-store, and errors and POSTs stay uncacheable."""
+    client = _client()
+    client.get('/resume')
+
+    # Stale fallback: the router's no-store wins, tags are still added
+    monkeypatch.setattr('routers.resume.stale_age', lambda: 42)
+    response = client.get('/resume')
+    assert response.headers['Cache-Control'] == 'no-store'
+    assert response.headers['Surrogate-Key'].startswith('resume ')
+
+    resume_all.clear_cache()
+    fake_table.scan.side_effect = RuntimeError('boom')
+    monkeypatch.setattr(resume_all, '_last_good', None)
+    response = client.get('/resume')
+    assert response.status_code == 500
+    assert 'Cache-Control' not in response.headers
+    assert 'Surrogate-Key' not in response.headers
+
+
+def test_debug_profile_requests_are_not_cached(fake_table):
+    """Test a request carrying X-Debug-Profile gets no-store instead of the CDN policy."""
+    response = _client().get('/resume', headers={'X-Debug-Profile': 'token'})
+
+    assert response.status_code == 200
+    assert response.headers.get_list('Cache-Control') == ['no-store']
+    assert 'Surrogate-Key' not in response.headers
@@ -0,0 +1,59 @@
+"""
+Tests for the resume chat retrieval index and /chat endpoint.
+"""
+import json
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from handlers import chat
+from routers.chat import router
+
+
+def test_index_built_once_per_rebuild(fake_table):
+    """Test repeated questions reuse the index built with the cache."""
+    first = chat.get_index()
+    chat.retrieve("terraform")
+    second = chat.get_index()
+
+    assert first is second
+    assert fake_table.scan.call_count == 1
+
+
+def test_retrieve_ranks_relevant_passages(fake_table):
+    """Test BM25 returns only passages that mention the query terms."""
+    hits = chat.retrieve("Which services did Test move to Lambda?")
+
+    score, passage = hits[0]
+    assert score > 0
+    assert passage['text'] == 'Migrated services to AWS Lambda with Terraform'
+    assert passage['source'] == 'Senior Engineer, Acme'
+    assert all('Lambda' in p['text'] or 'services' in p['text'] for _, p in hits)
+
+
+def test_unknown_question_has_no_hits(fake_table):
+    """Test questions with no indexed terms return nothing."""
+    assert chat.retrieve("quantum basket weaving") == []
+
+
+def test_chat_endpoint_streams_sse(fake_table):
+    """Test /chat streams tokens, sources and [DONE] like the widget expects."""
+    app = FastAPI()
+    app.include_router(router)
+
+    response = TestClient(app).post("/chat", json={"bot_id": "RobbAI", "message": "Python"})
+
+    events = [line[6:] for line in response.text.split("\n\n") if line.startswith("data: ")]
+    assert response.headers['content-type'].startswith('text/event-stream')
+    assert events[-1] == '[DONE]'
+    payloads = [json.loads(e) for e in events[:-1]]
+    answer = "".join(p['token'] for p in payloads if 'token' in p)
+    assert answer.startswith("Here's what Test's resume says:")
+    assert 'Python' in answer
+    assert any('sources' in p for p in payloads)
+
+
+def test_local_backend_is_deterministic(fake_table):
+    """Test the default backend gives identical answers for the same question."""
+    first, _ = chat.answer_question("AWS Lambda")
+    second, _ = chat.answer_question("AWS Lambda")
+
+    assert "".join(first) == "".join(second)
@@ -0,0 +1,126 @@
+"""
+Tests for the DynamoDB circuit breaker and last-good resume fallback.
+"""
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from handlers import circuit, resume_all
+from handlers.circuit import CircuitBreaker, CircuitOpenError
+from routers.resume import router
+from tests.conftest import make_items
+
+
+def _throttled(*args, **kwargs):
+    raise ClientError({'Error': {'Code': 'ProvisionedThroughputExceededException'},
+                       'ResponseMetadata': {'HTTPStatusCode': 400}}, 'Scan')
+
+
+def _client():
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app, raise_server_exceptions=False)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_breaker_opens_then_probes_once():
+    """Test consecutive failures open the circuit and one probe closes it."""
+    clock = FakeClock()
+    breaker = CircuitBreaker('test', failure_threshold=2, reset_timeout=10, clock=clock)
+
+    for _ in range(2):
+        with pytest.raises(ClientError):
+            breaker.call(_throttled)
+    assert breaker.state == circuit.OPEN
+
+    calls = []
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.call(calls.append, 1)
+    assert calls == [] and error.value.retry_after == 10
+
+    clock.now = 10
+    assert breaker.call(lambda: 'ok') == 'ok'
+    assert breaker.state == circuit.CLOSED
+
+
+def test_failed_probe_reopens():
+    """Test a failing half-open probe keeps the circuit open for another period."""
+    clock = FakeClock()
+    breaker = CircuitBreaker('test', failure_threshold=1, reset_timeout=5, clock=clock)
+    with pytest.raises(ClientError):
+        breaker.call(_throttled)
+
+    clock.now = 5
+    with pytest.raises(ClientError):
+        breaker.call(_throttled)
+    assert breaker.state == circuit.OPEN
+    assert breaker.retry_after() == 5
+
+
+def test_client_errors_do_not_trip():
+    """Test bad requests are not counted as DynamoDB failures."""
+    validation = ClientError({'Error': {'Code': 'ValidationException'},
+                              'ResponseMetadata': {'HTTPStatusCode': 400}}, 'Query')
+    assert not circuit.is_failure(validation)
+    assert not circuit.is_failure(KeyError('id'))
+    assert circuit.is_failure(EndpointConnectionError(endpoint_url='http://x'))
+
+
+def test_outage_serves_last_good_snapshot(fake_table):
+    """Test /resume falls back to the saved snapshot with a Warning header."""
+    client = _client()
+    fresh = client.get('/resume')
+    assert 'Warning' not in fresh.headers
+
+    # Cold restart during an outage: only the file on disk survives
+    resume_all._cached_resume = resume_all._last_good = None
+    fake_table.scan.side_effect = _throttled
+    stale = client.get('/resume')
+
+    assert stale.status_code == 200
+    assert stale.headers['Warning'] == '110 - "Response is Stale"'
+    assert 'X-Resume-Stale-Seconds' in stale.headers
+    assert stale.json() == fresh.json()
+
+    fake_table.scan.side_effect = lambda **kwargs: {'Items': make_items()}
+    assert 'Warning' not in client.get('/resume').headers
+
+
+@pytest.mark.parametrize('path', [
+    '/resume/changes?since=0', '/resume/search?q=aws', '/resume/search/stats',
+])
+def test_derived_routes_mark_stale_fallbacks(fake_table, path):
+    """Test routes built from the last good snapshot carry the staleness headers too."""
+    client = _client()
+    assert 'Warning' not in client.get(path).headers
+
+    resume_all._cached_resume = resume_all._last_good = None
+    fake_table.query.side_effect = fake_table.scan.side_effect = _throttled
+    stale = client.get(path)
+
+    assert stale.status_code == 200
+    assert stale.headers['Warning'] == '110 - "Response is Stale"'
+    assert stale.headers['Cache-Control'] == 'no-store'
+
+
+def test_open_circuit_without_snapshot_is_503(fake_table):
+    """Test an outage with nothing saved fails fast with Retry-After."""
+    fake_table.query.side_effect = fake_table.scan.side_effect = _throttled
+    client = _client()
+
+    for _ in range(circuit.dynamodb.failure_threshold):
+        assert client.get('/resume').status_code == 500
+    calls = fake_table.query.call_count + fake_table.scan.call_count
+
+    response = client.get('/resume')
+    assert response.status_code == 503
+    assert int(response.headers['Retry-After']) >= 1
+    assert fake_table.query.call_count + fake_table.scan.call_count == calls
+    circuit.dynamodb.reset()
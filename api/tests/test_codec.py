@@ -0,0 +1,57 @@
+"""
+Tests for compressed resume attributes.
+"""
+import copy
+import pytest
+from boto3.dynamodb.types import Binary
+from handlers import codec, encoding, resume_all
+from tests.conftest import make_items
+
+LONG = ("Designed and shipped serverless APIs on AWS Lambda and DynamoDB with Terraform, "
+        "cutting infrastructure cost and improving reliability for the platform team. ")
+
+
+def _bulky_items():
+    items = make_items()
+    for item in items:
+        if item['type'] == 'work_experience':
+            item['description'] = LONG * 3
+            item['accomplishments'] = [LONG, LONG + 'Mentored engineers.']
+    return items
+
+
+def test_round_trip_and_smaller_items():
+    """Test compressed items shrink and decode back to the original values."""
+    items = _bulky_items()
+    original = copy.deepcopy(items)
+
+    codec_dict = codec.compress_items(items)
+
+    work = [i for i in items if i['type'] == 'work_experience' and i['accomplishments']]
+    assert all(isinstance(i['description'], Binary) for i in work)
+    assert sum(map(codec.item_size, items + [codec_dict])) < sum(map(codec.item_size, original))
+
+    codec.decode_items(items + [codec_dict])
+    assert items == original
+
+
+def test_resume_payload_unchanged_by_compression(fake_table):
+    """Test the API output is identical whether the table holds compressed items or not."""
+    items = _bulky_items()
+    expected = encoding.dumps(resume_all._partition(copy.deepcopy(items)))
+
+    codec_dict = codec.compress_items(items)
+    fake_table.scan.side_effect = lambda **kwargs: {'Items': copy.deepcopy(items + [codec_dict])}
+
+    assert encoding.dumps(resume_all.get_all_resume_data()) == expected
+
+
+def test_short_values_and_missing_dictionary():
+    """Test short text stays plain, and a missing dictionary is reported clearly."""
+    assert codec.compress_items(make_items()) is None
+
+    items = _bulky_items()
+    codec.compress_items(items)
+    work = next(i for i in items if isinstance(i.get('description'), Binary))
+    with pytest.raises(ValueError):
+        codec.decode_value(work['description'], {})
@@ -0,0 +1,110 @@
+"""
+Tests for the raw Lambda entry point (lambda_handler.raw_handler).
+"""
+import json
+import logging
+from unittest.mock import MagicMock
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import lambda_handler
+import logging_config
+from handlers import cache_policy, resume_all
+from handlers.circuit import CircuitOpenError
+from routers.resume import router
+
+
+def _v2_event(path, method='GET', headers=None):
+    """HTTP API / Function URL (payload format 2.0) event."""
+    return {'version': '2.0', 'rawPath': path, 'headers': headers or {},
+            'requestContext': {'http': {'method': method, 'path': path}}}
+
+
+def _v1_event(path, method='GET', headers=None):
+    """REST API proxy event."""
+    return {'httpMethod': method, 'path': path, 'headers': headers}
+
+
+@pytest.fixture
+def asgi(monkeypatch):
+    """Stand-in for the Mangum app, so FastAPI is never imported here."""
+    app = MagicMock(return_value={'statusCode': 404})
+    monkeypatch.setattr(lambda_handler, '_asgi', app)
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    yield app
+    # raw_handler configures logging; leave the root logger as we found it
+    logging_config.stop_logging()
+    root.handlers, root.level = saved_handlers, saved_level
+
+
+def test_resume_matches_fastapi_body(fake_table, asgi):
+    """Test the fast path returns the same body and headers as the router."""
+    response = lambda_handler.raw_handler(_v2_event(lambda_handler.RESUME_PATH), None)
+
+    app = FastAPI()
+    app.include_router(router)
+    expected = TestClient(app).get('/resume')
+
+    asgi.assert_not_called()
+    assert response['statusCode'] == 200
+    assert json.loads(response['body']) == expected.json()
+    assert response['headers']['X-Resume-Version'] == expected.headers['X-Resume-Version']
+    assert response['headers']['Content-Type'] == 'application/json'
+    assert response['headers']['Cache-Control'] == cache_policy.POLICIES['/resume']
+    assert fake_table.scan.call_count == 1
+
+
+def test_rest_api_event_and_cors(fake_table, asgi):
+    """Test v1 events with an allowed Origin get the CORS headers."""
+    event = _v1_event(lambda_handler.RESUME_PATH, headers={'Origin': 'https://robrose.info',
+                                                           'X-Request-ID': 'abc'})
+    headers = lambda_handler.raw_handler(event, None)['headers']
+
+    assert headers['Access-Control-Allow-Origin'] == 'https://robrose.info'
+    assert headers['X-Request-ID'] == 'abc'
+
+    event['headers']['Origin'] = 'https://evil.example'
+    assert 'Access-Control-Allow-Origin' not in lambda_handler.raw_handler(event, None)['headers']
+
+
+@pytest.mark.parametrize('event', [
+    _v2_event('/contact', method='POST'),
+    _v2_event(lambda_handler.RESUME_PATH, method='OPTIONS'),
+    _v2_event(lambda_handler.RESUME_PATH, headers={'accept': 'application/x-ndjson'}),
+    _v2_event(lambda_handler.RESUME_PATH + '/search'),
+])
+def test_other_requests_go_to_fastapi(event, asgi):
+    """Test anything but a plain GET /resume or /health is delegated."""
+    assert lambda_handler.raw_handler(event, None) == {'statusCode': 404}
+    asgi.assert_called_once_with(event, None)
+
+
+def test_load_failure_is_answered_without_fastapi(fake_table, asgi):
+    """Test a failed load is one DynamoDB attempt and the router's 500, not a retry in FastAPI."""
+    fake_table.scan.side_effect = RuntimeError('boom')
+    response = lambda_handler.raw_handler(_v2_event(lambda_handler.RESUME_PATH), None)
+
+    asgi.assert_not_called()
+    assert fake_table.scan.call_count == 1
+    assert response['statusCode'] == 500
+    assert json.loads(response['body']) == {'detail': 'Error loading resume data: boom'}
+    assert 'Cache-Control' not in response['headers']
+
+
+def test_open_circuit_and_stale_fallback(fake_table, asgi, monkeypatch):
+    """Test the 503 Retry-After and the stale snapshot's headers come from the fast path."""
+    event = _v2_event(lambda_handler.RESUME_PATH)
+    monkeypatch.setattr(resume_all, 'get_all_resume_data',
+                        MagicMock(side_effect=CircuitOpenError('dynamodb', 2.5)))
+    response = lambda_handler.raw_handler(event, None)
+    assert response['statusCode'] == 503
+    assert response['headers']['Retry-After'] == '3'
+
+    monkeypatch.setattr(resume_all, 'get_all_resume_data', MagicMock(return_value={'profile': {}}))
+    monkeypatch.setattr(resume_all, 'stale_age', lambda: 42.7)
+    headers = lambda_handler.raw_handler(event, None)['headers']
+    assert headers['Cache-Control'] == 'no-store'
+    assert headers['X-Resume-Stale-Seconds'] == '42'
+    assert headers['Warning'] == '110 - "Response is Stale"'
+    asgi.assert_not_called()
@@ -0,0 +1,87 @@
+"""
+Tests for the queue-based structured logging pipeline.
+"""
+import io
+import json
+import logging
+import pytest
+import logging_config
+
+
+@pytest.fixture
+def log_stream():
+    """Run the pipeline into a StringIO and restore the root logger after."""
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    stream = io.StringIO()
+    logging_config.configure_logging(stream=stream)
+    yield stream
+    logging_config.stop_logging()
+    root.handlers, root.level = saved_handlers, saved_level
+
+
+def _lines(stream):
+    logging_config.stop_logging()
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_json_lines_carry_request_id(log_stream):
+    """Test records are JSON and tagged with the bound request id."""
+    token = logging_config.set_request_id('req-123')
+    try:
+        logging.getLogger('handlers.test').info("hello %s", "world", extra={'route': '/resume'})
+    finally:
+        logging_config.reset_request_id(token)
+    logging.getLogger('handlers.test').info("outside")
+
+    first, second = _lines(log_stream)
+    assert first['msg'] == 'hello world'
+    assert first['level'] == 'INFO'
+    assert first['logger'] == 'handlers.test'
+    assert first['request_id'] == 'req-123'
+    assert first['route'] == '/resume'
+    assert 'request_id' not in second
+
+
+def test_exceptions_are_formatted_off_thread(log_stream):
+    """Test tracebacks survive the queue and are rendered by the listener."""
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        logging.getLogger('handlers.test').exception("failed")
+
+    (line,) = _lines(log_stream)
+    assert line['level'] == 'ERROR'
+    assert 'RuntimeError: boom' in line['exc']
+
+
+def test_sampling_filter_keeps_warnings():
+    """Test sampling drops low-level records but never warnings."""
+    sampler = logging_config.SamplingFilter({'uvicorn.access': 0.0})
+
+    def record(name, level):
+        return logging.LogRecord(name, level, __file__, 1, "msg", None, None)
+
+    assert not sampler.filter(record('uvicorn.access', logging.INFO))
+    assert sampler.filter(record('uvicorn.access', logging.WARNING))
+    assert sampler.filter(record('handlers.contact', logging.INFO))
+
+
+def test_direct_mode_and_stop_restores_handlers():
+    """Test Lambda mode writes synchronously and stop_logging() puts the old handlers back."""
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    sentinel = logging.NullHandler()
+    root.handlers = [sentinel]
+    stream = io.StringIO()
+    try:
+        logging_config.configure_logging(stream=stream, queued=False)
+        logging.getLogger('handlers.test').warning("written now")
+        # No listener thread: the line is already there
+        assert json.loads(stream.getvalue())['msg'] == 'written now'
+
+        logging_config.stop_logging()
+        assert root.handlers == [sentinel]
+    finally:
+        logging_config.stop_logging()
+        root.handlers, root.level = saved_handlers, saved_level
@@ -0,0 +1,93 @@
+"""
+Tests for the opt-in memory profiler and /debug/memory.
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from handlers import memprof
+from middleware import profiling
+from middleware.memprof import MemoryProfilingMiddleware
+from middleware.profiling import sign_debug_token
+from routers.memory import router as memory_router
+from routers.resume import router as resume_router
+
+
+@pytest.fixture
+def tracing():
+    """Trace allocations for one test."""
+    memprof.start()
+    yield
+    memprof.stop()
+
+
+SECRET = 's3cret'
+
+
+def _client():
+    app = FastAPI()
+    app.add_middleware(MemoryProfilingMiddleware)
+    app.include_router(resume_router)
+    app.include_router(memory_router)
+    return TestClient(app)
+
+
+def test_phases_separate_peak_from_retained(tracing, monkeypatch):
+    """Test transient garbage shows in peak only, and nested peaks reach the outer phase."""
+    monkeypatch.setattr(memprof, 'SITES', True)
+    kept = []
+    with memprof.phase('outer'):
+        with memprof.phase('inner', sites=True):
+            garbage = bytearray(2_000_000)
+            del garbage
+            kept.append(bytearray(500_000))
+
+    phases = memprof.phases()
+    inner, outer = phases['inner'], phases['outer']
+    assert inner['calls'] == 1
+    assert inner['peak_bytes'] >= 2_000_000
+    assert 500_000 <= inner['retained_bytes'] < 1_000_000
+    assert outer['peak_bytes'] >= inner['peak_bytes']
+    assert any(site['site'].startswith('tests/test_memprof.py:') for site in inner['top_sites'])
+
+
+def test_disabled_is_a_no_op():
+    """Test phases record nothing and the report has no tracing data when off."""
+    with memprof.phase('ignored'):
+        bytearray(1000)
+
+    assert memprof.begin() is None
+    report = memprof.report()
+    assert report['enabled'] is False
+    assert 'phases' not in report
+    assert report['max_rss_bytes'] > 0
+
+
+def test_debug_endpoint_reports_routes_build_and_encode(fake_table, tracing, monkeypatch):
+    """Test a /resume request records its route, cache build and encode phases."""
+    monkeypatch.setattr(profiling, 'SECRET', SECRET)
+    client = _client()
+    client.headers['X-Debug-Profile'] = sign_debug_token(SECRET)
+    assert client.get('/resume').status_code == 200
+
+    report = client.get('/debug/memory', params={'reset': 'true'}).json()
+    assert {'GET /resume', 'cache.build', 'encode'} <= set(report['phases'])
+    assert report['phases']['cache.build']['retained_bytes'] > 0
+    assert report['phases']['GET /resume']['peak_bytes'] >= report['phases']['cache.build']['peak_bytes']
+    assert any(entry['package'] == 'app' for entry in report['by_package'])
+    assert report['top_sites']
+
+    # reset=true cleared the phases; only the report request itself remains
+    assert set(client.get('/debug/memory').json()['phases']) == {'GET /debug/memory'}
+
+
+def test_debug_endpoint_requires_token(tracing, monkeypatch):
+    """Test the report needs a signed X-Debug-Profile header, and is closed without PROFILE_SECRET."""
+    monkeypatch.setattr(profiling, 'SECRET', SECRET)
+    client = _client()
+
+    assert client.get('/debug/memory').status_code == 403
+    response = client.get('/debug/memory', headers={'X-Debug-Profile': sign_debug_token(SECRET)})
+    assert response.status_code == 200
+
+    monkeypatch.setattr(profiling, 'SECRET', '')
+    assert client.get('/debug/memory', headers={'X-Debug-Profile': 'anything'}).status_code == 403
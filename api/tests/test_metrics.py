@@ -0,0 +1,85 @@
+"""
+Tests for the metrics registry and ASGI middleware.
+"""
+import json
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from handlers import metrics
+from middleware.metrics import MetricsMiddleware
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    """Start each test with an empty registry."""
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_counter_and_histogram_render():
+    """Test counters and histograms appear in Prometheus text format."""
+    metrics.inc('widgets_total', route='/a')
+    metrics.inc('widgets_total', route='/a')
+    metrics.observe('op_seconds', 0.003)
+
+    body = metrics.render_prometheus()
+
+    assert '# TYPE widgets_total counter' in body
+    assert 'widgets_total{route="/a"} 2' in body
+    assert '# TYPE op_seconds histogram' in body
+    assert 'op_seconds_bucket{le="0.005"} 1' in body
+    assert 'op_seconds_bucket{le="0.0025"} 0' in body
+    assert 'op_seconds_count 1' in body
+
+
+def test_build_emf():
+    """Test EMF records declare metrics and carry dimension values."""
+    record = metrics.build_emf(
+        [('latency', 4.0, 'Milliseconds'), ('latency', 6.0, 'Milliseconds')],
+        {'route': '/resume'}
+    )
+
+    directive = record['_aws']['CloudWatchMetrics'][0]
+    assert directive['Dimensions'] == [['route']]
+    assert directive['Metrics'] == [{'Name': 'latency', 'Unit': 'Milliseconds'}]
+    assert record['route'] == '/resume'
+    assert record['latency'] == [4.0, 6.0]
+
+
+def test_emf_request_keeps_labels(monkeypatch, capsys):
+    """Test buffered metrics flush one record per label set, labels merged into the dimensions."""
+    monkeypatch.setattr(metrics, 'IS_LAMBDA', True)
+    with metrics.emf_request({'route': '/contact'}):
+        metrics.inc('contact_submissions_total', result='success')
+        metrics.inc('contact_submissions_total', result='send_failed')
+        metrics.observe('op_seconds', 0.002)
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    by_result = {record.get('result'): record for record in records}
+    assert set(by_result) == {'success', 'send_failed', None}
+    assert by_result['success']['_aws']['CloudWatchMetrics'][0]['Dimensions'] == [['result', 'route']]
+    assert by_result['send_failed']['contact_submissions_total'] == 1
+    assert by_result[None]['route'] == '/contact'
+    assert by_result[None]['op_seconds'] == 2.0
+
+
+def test_middleware_labels_route_template():
+    """Test the middleware records the route template, not the raw path."""
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: str):
+        return {"id": item_id}
+
+    app.add_middleware(MetricsMiddleware)
+    client = TestClient(app)
+
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/missing")
+
+    body = metrics.render_prometheus()
+    assert 'http_requests_total{method="GET",route="/items/{item_id}",status="200"} 2' in body
+    assert 'route="unmatched",status="404"' in body
+    assert 'http_request_duration_seconds_count{method="GET",route="/items/{item_id}"} 2' in body
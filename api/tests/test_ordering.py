@@ -0,0 +1,76 @@
+"""
+Tests for ingest-time ranks and the sort-free read path.
+"""
+import random
+from datetime import datetime
+from decimal import Decimal
+from handlers import encoding, ordering, resume_all
+from tests.conftest import make_items
+
+
+def _legacy_sorted(items):
+    """The read path before ranks: partition, then the old three-pass sort."""
+    result = resume_all._partition(items, presorted=True)
+    result["work_experience"].sort(key=lambda x: x.get('start_date', ''), reverse=True)
+    result["work_experience"].sort(key=lambda x: not x.get('is_current', False))
+    result["education"].sort(key=lambda x: x.get('start_date', ''), reverse=True)
+    result["skills"].sort(key=lambda x: (x.get('sort_order', 999), x.get('category', '')))
+    return result
+
+
+def _items():
+    items = make_items()
+    items += [
+        {'id': 'work_004', 'type': 'work_experience', 'job_title': 'Contractor',
+         'company_name': 'Hooli', 'start_date': '2020-02', 'end_date': None, 'is_current': True},
+        {'id': 'edu_002', 'type': 'education', 'degree': 'MS', 'institution': 'Tech',
+         'start_date': '2018', 'end_date': '2020'},
+        {'id': 'skills_003', 'type': 'skills', 'category': 'Data', 'skills': ['SQL'],
+         'sort_order': Decimal('1')},
+        {'id': 'skills_004', 'type': 'skills', 'category': 'Other', 'skills': ['Vim']},
+    ]
+    return items
+
+
+def test_ranked_order_matches_legacy_sort():
+    """Test placing records by stored rank gives exactly the old sorted output."""
+    rng = random.Random(3)
+    for _ in range(20):
+        items = _items()
+        rng.shuffle(items)
+        expected = encoding.dumps(_legacy_sorted(items))
+
+        ranked = ordering.assign_ranks(items)
+        rng.shuffle(ranked)  # scan order is arbitrary
+        assert encoding.dumps(resume_all._partition(ranked)) == expected
+
+
+def test_missing_or_bad_ranks_fall_back_to_sorting():
+    """Test tables loaded before ranks existed, or with clashing ranks, still come out sorted."""
+    items = _items()
+    random.Random(5).shuffle(items)
+    expected = encoding.dumps(_legacy_sorted(items))
+
+    assert encoding.dumps(resume_all._partition(items)) == expected
+
+    ranked = ordering.assign_ranks(items)
+    next(item for item in ranked if item['type'] == 'skills')['rank'] = Decimal('7')
+    assert encoding.dumps(resume_all._partition(ranked)) == expected
+
+
+def test_rank_is_not_part_of_the_payload():
+    """Test the stored rank stays storage metadata."""
+    data = resume_all._partition(ordering.assign_ranks(make_items()))
+    assert 'rank' not in data['skills'][0].to_dict()
+    assert data['skills'][0].get('rank') is None
+
+
+def test_iso_date():
+    """Test spreadsheet date cells are normalized for display and ordering."""
+    assert ordering.iso_date(datetime(2021, 3, 1)) == '2021-03'
+    assert ordering.iso_date('2021-03-01 00:00:00') == '2021-03'
+    assert ordering.iso_date(2016.0) == '2016'
+    assert ordering.iso_date(' 2019-06 ') == '2019-06'
+    assert ordering.iso_date(float('nan')) is None
+    assert ordering.iso_date('nan') is None
+    assert ordering.iso_date('Summer 2015') == 'Summer 2015'
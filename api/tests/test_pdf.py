@@ -0,0 +1,107 @@
+"""
+Tests for the rendered resume PDF and /resume.pdf.
+"""
+import re
+import zlib
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from handlers import pdf, resume_all
+from routers.resume import router
+from tests.conftest import make_items
+
+
+@pytest.fixture
+def pdf_cache(tmp_path, monkeypatch):
+    """Empty memory cache and a per-test disk cache."""
+    monkeypatch.setattr(pdf, 'CACHE_DIR', str(tmp_path / 'pdf'))
+    pdf.clear_cache()
+    yield tmp_path / 'pdf'
+    pdf.clear_cache()
+
+
+def _client():
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_render_is_a_well_formed_deterministic_pdf():
+    """Test the xref offsets point at their objects and the text is in the page stream."""
+    data = resume_all._partition(make_items())
+    body = pdf.render(data)
+
+    assert body.startswith(b'%PDF-1.4') and body.endswith(b'%%EOF\n')
+    assert body == pdf.render(resume_all._partition(make_items()))
+
+    xref = int(re.search(rb'startxref\n(\d+)', body).group(1))
+    assert body[xref:].startswith(b'xref')
+    offsets = re.findall(rb'(\d{10}) 00000 n ', body[xref:])
+    for number, offset in enumerate(offsets, start=1):
+        assert body[int(offset):].startswith(b'%d 0 obj' % number)
+
+    stream = re.search(rb'stream\n(.*?)\nendstream', body, re.S).group(1)
+    text = zlib.decompress(stream)
+    assert b'(Test Person) Tj' in text
+    assert b'(Migrated services to AWS Lambda with Terraform) Tj' in text
+
+
+def test_wrap_and_long_resume_paginates():
+    """Test lines fit the content width and long resumes flow onto more pages."""
+    lines = pdf.wrap('word ' * 200, pdf._REGULAR, 10, pdf.CONTENT_WIDTH)
+    assert len(lines) > 1
+    assert all(pdf.text_width(line, pdf._REGULAR, 10) <= pdf.CONTENT_WIDTH for line in lines)
+
+    data = resume_all._partition(make_items())
+    data['work_experience'] = data['work_experience'] * 20
+    assert pdf.render(data).count(b'/Type /Page ') > 1
+
+
+def test_route_renders_once_and_revalidates(fake_table, pdf_cache, monkeypatch):
+    """Test one render per dataset, ETag/304, and a new ETag when the data changes."""
+    renders = []
+    original = pdf.render
+    monkeypatch.setattr(pdf, 'render', lambda data: renders.append(1) or original(data))
+    client = _client()
+
+    first = client.get('/resume.pdf')
+    assert first.status_code == 200
+    assert first.headers['content-type'] == 'application/pdf'
+    assert first.content.startswith(b'%PDF')
+    etag = first.headers['ETag']
+
+    assert client.get('/resume.pdf').content == first.content
+    revalidated = client.get('/resume.pdf', headers={'If-None-Match': etag})
+    assert revalidated.status_code == 304
+    assert len(renders) == 1
+
+    # Another worker (empty memory cache) reuses the file on disk
+    pdf.clear_cache()
+    assert client.get('/resume.pdf').content == first.content
+    assert len(renders) == 1
+    assert (pdf_cache / f"{etag.strip(chr(34))}.pdf").exists()
+
+    items = make_items()
+    items[0]['name'] = 'Renamed Person'
+    fake_table.scan.side_effect = lambda **kwargs: {'Items': items}
+    resume_all.clear_cache()
+    assert client.get('/resume.pdf').headers['ETag'] != etag
+    assert len(renders) == 2
+
+
+def test_failed_render_releases_its_lock(pdf_cache, monkeypatch):
+    """Test a render that raises leaves nothing behind in _rendering."""
+    monkeypatch.setattr(pdf, 'render', lambda data: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        pdf.get_pdf({}, key='broken')
+    assert 'broken' not in pdf._rendering
+
+
+def test_disk_cache_keeps_most_recent_entries(pdf_cache, monkeypatch):
+    """Test the disk tier is capped at DISK_ENTRIES, dropping the least recently used."""
+    monkeypatch.setattr(pdf, 'DISK_ENTRIES', 2)
+    monkeypatch.setattr(pdf, 'render', lambda data: b'%PDF-' + data['name'].encode())
+    for name in ('a', 'b', 'c'):
+        pdf.get_pdf({'name': name}, key=name)
+
+    assert sorted(path.name for path in pdf_cache.iterdir()) == ['b.pdf', 'c.pdf']
@@ -0,0 +1,68 @@
+"""
+Tests for the opt-in request profiler.
+"""
+import time
+from pathlib import Path
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from middleware import profiling
+from middleware.profiling import ProfilingMiddleware, sign_debug_token, verify_debug_token
+
+
+def _app(tmp_path, **kwargs):
+    app = FastAPI()
+
+    @app.get("/slow")
+    def slow():
+        time.sleep(0.05)
+        return {"ok": True}
+
+    app.add_middleware(ProfilingMiddleware, directory=str(tmp_path), **kwargs)
+    return TestClient(app)
+
+
+def test_debug_token_roundtrip():
+    """Test signed tokens verify only with the right secret."""
+    token = sign_debug_token('s3cret', ttl=60)
+
+    assert verify_debug_token(token, 's3cret')
+    assert not verify_debug_token(token, 'wrong')
+    assert not verify_debug_token(sign_debug_token('s3cret', ttl=-10), 's3cret')
+    assert not verify_debug_token('garbage', 's3cret')
+
+
+def test_signed_header_writes_collapsed_dump(tmp_path, monkeypatch):
+    """Test a request with a valid debug header is profiled to disk."""
+    # The endpoint lives in tests/, so treat it as app code
+    monkeypatch.setattr(profiling, '_APP_DIRS', (str(Path(__file__).parent),))
+    client = _app(tmp_path, sample_rate=0.0, secret='s3cret')
+
+    client.get("/slow", headers={"X-Debug-Profile": sign_debug_token('s3cret')})
+
+    dumps = list(tmp_path.glob('*.collapsed'))
+    assert len(dumps) == 1
+    body = dumps[0].read_text()
+    assert 'slow (' in body
+    assert body.splitlines()[0].rsplit(' ', 1)[1].isdigit()
+
+
+def test_unsigned_requests_are_not_profiled(tmp_path):
+    """Test requests without a valid header are skipped at rate 0."""
+    client = _app(tmp_path, sample_rate=0.0, secret='s3cret')
+
+    client.get("/slow")
+    client.get("/slow", headers={"X-Debug-Profile": "123.bad"})
+
+    assert list(tmp_path.glob('*.collapsed')) == []
+
+
+def test_rotation_caps_file_count(tmp_path, monkeypatch):
+    """Test old dumps are rotated out beyond PROFILE_MAX_FILES."""
+    monkeypatch.setattr(profiling, 'MAX_FILES', 3)
+
+    for i in range(5):
+        profiling.write_dump(tmp_path, f"{i}.collapsed", "a;b 1\n")
+        time.sleep(0.01)
+
+    names = sorted(p.name for p in tmp_path.glob('*.collapsed'))
+    assert names == ['2.collapsed', '3.collapsed', '4.collapsed']
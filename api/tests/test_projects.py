@@ -0,0 +1,111 @@
+"""
+Tests for the cached GitHub repos feed, against a local fixture server
+standing in for api.github.com.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from handlers import projects
+from routers.projects import router
+
+REPOS = [
+    {'name': 'aws-serverless-resume', 'html_url': 'https://github.com/u/aws-serverless-resume',
+     'language': 'Python', 'stargazers_count': 3, 'updated_at': '2026-01-01T00:00:00Z',
+     'owner': {'login': 'u'}, 'description': 'full object', 'topics': ['aws']},
+    {'name': 'bot-factory', 'html_url': 'https://github.com/u/bot-factory',
+     'language': 'Python', 'stargazers_count': 0, 'updated_at': '2026-02-01T00:00:00Z'},
+    {'name': 'unlisted', 'html_url': 'https://github.com/u/unlisted',
+     'language': None, 'stargazers_count': 0, 'updated_at': '2025-01-01T00:00:00Z'},
+]
+
+
+class FakeGitHub(BaseHTTPRequestHandler):
+    """Serves REPOS with an ETag and answers If-None-Match with 304."""
+    etag = '"v1"'
+    requests = []
+    down = False
+
+    def do_GET(self):
+        FakeGitHub.requests.append((self.path, self.headers.get('If-None-Match')))
+        if FakeGitHub.down:
+            self.send_response(503)
+            self.end_headers()
+            return
+        if self.headers.get('If-None-Match') == FakeGitHub.etag:
+            self.send_response(304)
+            self.send_header('ETag', FakeGitHub.etag)
+            self.end_headers()
+            return
+        body = json.dumps(REPOS).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('ETag', FakeGitHub.etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def github(monkeypatch):
+    """Point the handler at a fixture server with an empty cache."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeGitHub)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    FakeGitHub.requests, FakeGitHub.down = [], False
+    monkeypatch.setattr(projects, 'GITHUB_API_URL', f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setattr(projects, 'GITHUB_USERNAME', 'u')
+    projects.clear_cache()
+    yield FakeGitHub
+    server.shutdown()
+    projects.clear_cache()
+
+
+def test_returns_listed_repos_trimmed_in_order(github):
+    """Test only requested repos come back, with only the rendered fields."""
+    result = projects.get_projects(['bot-factory', 'aws-serverless-resume', 'missing'])
+
+    assert [r['name'] for r in result] == ['bot-factory', 'aws-serverless-resume']
+    assert set(result[1]) == set(projects.FIELDS)
+    assert github.requests == [('/users/u/repos?per_page=100', None)]
+
+
+def test_cached_within_ttl_then_revalidated(github, monkeypatch):
+    """Test one upstream call per TTL, then a conditional request that gets a 304."""
+    projects.get_projects()
+    projects.get_projects()
+    assert len(github.requests) == 1
+
+    monkeypatch.setattr(projects, 'TTL', 0)
+    assert len(projects.get_projects()) == 3
+    assert github.requests[-1][1] == '"v1"'
+
+
+def test_upstream_failure_serves_cached_feed(github, monkeypatch):
+    """Test GitHub outages fall back to the last fetched repos."""
+    projects.get_projects()
+    monkeypatch.setattr(projects, 'TTL', 0)
+    github.down = True
+
+    assert [r['name'] for r in projects.get_projects(['bot-factory'])] == ['bot-factory']
+
+
+def test_route_validates_and_returns_502_without_cache(github):
+    """Test the /projects route: 400 for bad names, 502 when GitHub is down and nothing is cached."""
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    assert client.get('/projects', params={'repos': '../etc'}).status_code == 400
+
+    github.down = True
+    assert client.get('/projects', params={'repos': 'bot-factory'}).status_code == 502
+
+    github.down = False
+    response = client.get('/projects', params={'repos': 'bot-factory'})
+    assert response.json() == {'repos': [{k: REPOS[1][k] for k in projects.FIELDS}]}
+    assert 'max-age' in response.headers['Cache-Control']
@@ -0,0 +1,86 @@
+"""
+Tests for typed resume records and JSON encoding.
+"""
+import json
+from decimal import Decimal
+from fastapi.encoders import jsonable_encoder
+from handlers import encoding, resume_all
+from handlers.records import Profile, SkillCategory, WorkExperience
+from tests.conftest import make_items
+
+
+def _legacy_json(items):
+    """The /resume body as it was built from dicts of Decimals."""
+    result = {"profile": None, "work_experience": [], "education": [], "skills": []}
+    for item in items:
+        if item['type'] == 'profile':
+            result["profile"] = {k: v for k, v in item.items() if k not in ('id', 'type')}
+        else:
+            result[item['type']].append(item)
+    return jsonable_encoder(result)
+
+
+def test_records_convert_decimals_once():
+    """Test Decimals become plain numbers and unknown attributes are kept."""
+    skill = SkillCategory.from_item({'id': 's1', 'type': 'skills', 'category': 'Cloud',
+                                     'skills': ['AWS'], 'sort_order': Decimal('2'),
+                                     'years': Decimal('1.5'), 'tenant': 'acme'})
+
+    assert skill.sort_order == 2 and type(skill.sort_order) is int
+    assert skill['years'] == 1.5
+    assert 'tenant' not in skill
+    assert skill.to_dict() == {'id': 's1', 'category': 'Cloud', 'skills': ('AWS',),
+                               'sort_order': 2, 'type': 'skills', 'years': 1.5}
+
+
+def test_profile_behaves_like_the_old_dict():
+    """Test profile mapping access and that unset fields are omitted."""
+    profile = Profile.from_item({'id': 'profile', 'type': 'profile', 'name': 'A', 'pronouns': 'they'})
+
+    assert profile.get('name') == 'A' and profile['pronouns'] == 'they'
+    assert profile.get('email', 'none') == 'none' and 'email' not in profile
+    assert profile.to_dict() == {'name': 'A', 'pronouns': 'they'}
+
+
+def test_sparse_items_keep_their_shape():
+    """Test attributes absent from the item are not emitted, while explicit Nones are."""
+    job = WorkExperience.from_item({'id': 'w1', 'type': 'work_experience',
+                                    'job_title': 'Engineer', 'end_date': None})
+    skill = SkillCategory.from_item({'id': 's1', 'type': 'skills', 'category': 'Cloud'})
+
+    assert job.to_dict() == {'id': 'w1', 'job_title': 'Engineer', 'end_date': None,
+                             'type': 'work_experience'}
+    assert job.get('description', '') == '' and 'accomplishments' not in job
+    assert skill.to_dict() == {'id': 's1', 'category': 'Cloud', 'type': 'skills'}
+    assert skill.get('sort_order', 999) == 999
+
+
+def test_encoded_resume_matches_previous_shape():
+    """Test the record-based payload has the same content as the dict version."""
+    data = resume_all._partition(make_items())
+
+    encoded = json.loads(encoding.dumps(data))
+    legacy = _legacy_json(make_items())
+
+    assert encoded['profile'] == legacy['profile']
+    for section in ('work_experience', 'education', 'skills'):
+        assert sorted(encoded[section], key=lambda x: x['id']) == \
+            sorted(legacy[section], key=lambda x: x['id'])
+
+
+def test_stdlib_fallback_matches_orjson(monkeypatch):
+    """Test the stdlib encoder produces the same JSON when orjson is missing."""
+    data = resume_all._partition(make_items())
+    expected = json.loads(encoding.dumps(data))
+
+    monkeypatch.setattr(encoding, 'ORJSON_AVAILABLE', False)
+    assert json.loads(encoding.dumps(data)) == expected
+
+
+def test_dumps_cached_reuses_bytes_until_data_changes():
+    """Test the payload is encoded once per dataset object."""
+    first = {"profile": None}
+    body = encoding.dumps_cached(first)
+
+    assert encoding.dumps_cached(first) is body
+    assert encoding.dumps_cached({"profile": {"name": "B"}}) is not body
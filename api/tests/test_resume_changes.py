@@ -0,0 +1,118 @@
+"""
+Tests for resume versions and the /resume/changes delta endpoint.
+"""
+from collections import deque
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from tests.conftest import make_items
+from handlers import resume_all
+from routers.resume import router
+
+
+@pytest.fixture
+def history(monkeypatch, fake_table):
+    """Fresh version state; returns a function that swaps the table contents."""
+    monkeypatch.setattr(resume_all, '_version', 0)
+    monkeypatch.setattr(resume_all, '_items', {})
+    monkeypatch.setattr(resume_all, '_history', deque(maxlen=3))
+
+    def publish(items):
+        fake_table.scan.side_effect = lambda **kwargs: {'Items': [dict(i) for i in items]}
+        resume_all.clear_cache()
+        resume_all.get_all_resume_data()
+        return resume_all.get_version()
+
+    return publish
+
+
+def test_delta_lists_added_changed_removed(history):
+    """Test a rebuild records per-item adds, changes and removals."""
+    items = make_items()
+    v1 = history(items)
+
+    items[1] = dict(items[1], description='Leads two platform teams.')
+    items = [i for i in items if i['id'] != 'edu_001']
+    items.append({'id': 'skills_003', 'type': 'skills', 'category': 'Data',
+                  'skills': ['SQL'], 'sort_order': 3})
+    v2 = history(items)
+
+    changes = resume_all.get_changes(v1)
+    assert v2 != v1
+    assert changes['version'] == v2 and not changes['full']
+    assert [(c['type'], c['id']) for c in changes['added']] == [('skills', 'skills_003')]
+    assert changes['changed'][0]['item']['description'] == 'Leads two platform teams.'
+    assert changes['removed'] == [{'type': 'education', 'id': 'edu_001'}]
+
+
+def test_deltas_compose_across_versions(history):
+    """Test an item added then removed after `since` does not appear at all."""
+    items = make_items()
+    v1 = history(items)
+    extra = {'id': 'edu_002', 'type': 'education', 'degree': 'MS', 'institution': 'X'}
+    history(items + [extra])
+    profile = dict(items[0], title='Principal Engineer')
+    history([profile] + items[1:])
+
+    changes = resume_all.get_changes(v1)
+    assert changes['added'] == [] and changes['removed'] == []
+    assert [c['id'] for c in changes['changed']] == ['profile']
+    assert changes['changed'][0]['item']['title'] == 'Principal Engineer'
+
+
+def test_unchanged_rebuild_keeps_version(history):
+    """Test a rebuild with identical data does not bump the version."""
+    v1 = history(make_items())
+    assert history(make_items()) == v1
+    assert resume_all.get_changes(v1) == {
+        'version': v1, 'full': False, 'added': [], 'changed': [], 'removed': []
+    }
+
+
+def test_versions_come_from_content(history, monkeypatch):
+    """Test another instance loading the same data agrees on the version, and reverts compose."""
+    items = make_items()
+    v1 = history(items)
+    v2 = history([dict(items[0], title='Staff Engineer')] + items[1:])
+
+    # A fresh instance (no history) behind the same Function URL
+    monkeypatch.setattr(resume_all, '_version', 0)
+    monkeypatch.setattr(resume_all, '_items', {})
+    monkeypatch.setattr(resume_all, '_history', deque(maxlen=3))
+    assert history([dict(items[0], title='Staff Engineer')] + items[1:]) == v2
+
+    # Reverting brings the old version back; deltas replay from its last occurrence
+    assert history(items) == v1
+    history([dict(items[0], title='Principal Engineer')] + items[1:])
+    changes = resume_all.get_changes(v1)
+    assert [c['item']['title'] for c in changes['changed']] == ['Principal Engineer']
+
+
+def test_evicted_version_returns_snapshot(history):
+    """Test a version older than the history ring falls back to a full snapshot."""
+    items = make_items()
+    v1 = history(items)
+    for title in ('A', 'B', 'C', 'D'):
+        history([dict(items[0], title=title)] + items[1:])
+
+    changes = resume_all.get_changes(v1)
+    assert changes['full'] is True
+    assert changes['data']['profile']['title'] == 'D'
+
+
+def test_changes_endpoint(history):
+    """Test /resume exposes its version and /resume/changes serves the delta."""
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+    items = make_items()
+    history(items)
+
+    version = int(client.get("/resume").headers["x-resume-version"])
+    history([dict(items[0], title='Staff Engineer')] + items[1:])
+    body = client.get("/resume/changes", params={"since": version}).json()
+
+    assert body['version'] != version
+    assert body['changed'] == [{'type': 'profile', 'id': 'profile', 'item': body['changed'][0]['item']}]
+    assert client.get("/resume/changes", params={"since": 1}).json()['full'] is True
+    assert client.get("/resume/changes").status_code == 422
@@ -0,0 +1,84 @@
+"""
+Tests for the NDJSON streaming mode of /resume.
+"""
+import json
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from tests.conftest import make_items
+from handlers import resume_all
+from routers.resume import router
+
+NDJSON = {"Accept": "application/x-ndjson"}
+
+
+def _client():
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_streams_sections_in_order(fake_table):
+    """Test each section is its own line, profile first, matching the JSON body."""
+    client = _client()
+    streamed = client.get("/resume", headers=NDJSON)
+    full = client.get("/resume").json()
+
+    assert streamed.status_code == 200
+    assert streamed.headers["content-type"].startswith("application/x-ndjson")
+    lines = _lines(streamed)
+    assert [line["section"] for line in lines] == list(resume_all.SECTIONS)
+    assert {line["section"]: line["data"] for line in lines} == full
+
+
+def test_cold_miss_sends_profile_before_scan_finishes(fake_table):
+    """Test the profile is yielded from the first Scan page and the cache is filled."""
+    items = make_items()
+    pages = [
+        {'Items': items[:2], 'LastEvaluatedKey': {'id': items[1]['id']}},
+        {'Items': items[2:]},
+    ]
+    fake_table.scan.side_effect = lambda **kwargs: pages.pop(0)
+
+    sections = resume_all.iter_resume_sections()
+    section, profile = next(sections)
+
+    assert section == 'profile' and profile['name'] == 'Test Person'
+    assert 'id' not in profile and 'type' not in profile
+    assert fake_table.scan.call_count == 1
+
+    rest = dict(sections)
+    assert [job['id'] for job in rest['work_experience']] == ['work_001', 'work_002', 'work_003']
+    assert resume_all.get_all_resume_data()['profile'] == profile
+    assert fake_table.scan.call_count == 2
+
+
+def test_scan_failure_before_first_line_is_500(fake_table):
+    """Test a DynamoDB error before anything is sent returns a normal 500."""
+    fake_table.scan.side_effect = RuntimeError("throttled")
+
+    response = _client().get("/resume", headers=NDJSON)
+
+    assert response.status_code == 500
+    assert "throttled" in response.json()["detail"]
+
+
+def test_scan_failure_mid_stream_is_reported_in_band(fake_table):
+    """Test an error after the profile was sent ends the stream with an error line."""
+    items = make_items()
+    pages = [{'Items': items[:1], 'LastEvaluatedKey': {'id': 'profile'}}]
+
+    def scan(**kwargs):
+        if pages:
+            return pages.pop(0)
+        raise RuntimeError("throttled")
+
+    fake_table.scan.side_effect = scan
+
+    lines = _lines(_client().get("/resume", headers=NDJSON))
+
+    assert lines[0]["section"] == "profile"
+    assert lines[-1] == {"error": "Error loading resume data"}
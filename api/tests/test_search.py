@@ -0,0 +1,70 @@
+"""
+Tests for the resume search index and /resume/search endpoint.
+"""
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from handlers import search
+from routers.resume import router
+
+
+def _client():
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_prefix_query_matches_and_highlights(fake_table):
+    """Test prefix terms expand via the vocabulary and are highlighted."""
+    result = search.search("terra")
+
+    ids = [r['id'] for r in result['results']]
+    assert 'work_001' in ids and 'skills_001' in ids
+    job = next(r for r in result['results'] if r['id'] == 'work_001')
+    assert job['highlights']['accomplishments'] == [
+        'Migrated services to AWS Lambda with <mark>Terraform</mark>'
+    ]
+
+
+def test_exact_match_when_prefix_disabled(fake_table):
+    """Test prefix=False only matches whole terms."""
+    assert search.search("terra", prefix=False)['total'] == 0
+    assert search.search("terraform", prefix=False)['total'] == 2
+
+
+def test_terms_are_anded(fake_table):
+    """Test every query term must match."""
+    result = search.search("python fastapi")
+
+    assert [r['id'] for r in result['results']] == ['work_002']
+
+
+def test_skill_facet_finds_roles(fake_table):
+    """Test the skill facet maps a skill to the roles that used it."""
+    result = search.search(skill="terraform", section="work_experience")
+
+    assert [r['id'] for r in result['results']] == ['work_001']
+    assert result['facets']['skills']['Terraform'] == 1
+
+
+def test_index_built_once_per_rebuild(fake_table):
+    """Test the index is reused across queries and reports its size."""
+    first = search.get_index()
+    search.search("aws")
+    assert search.get_index() is first
+
+    stats = first.stats()
+    assert stats['documents'] == 7
+    assert stats['memory_bytes'] > 0
+    assert fake_table.scan.call_count == 1
+
+
+def test_search_endpoint_validates_input(fake_table):
+    """Test the endpoint requires a query or skill and a known section."""
+    client = _client()
+
+    assert client.get("/resume/search").status_code == 400
+    assert client.get("/resume/search?q=aws&section=hobbies").status_code == 400
+
+    response = client.get("/resume/search?q=serverless")
+    assert response.status_code == 200
+    assert response.json()['results'][0]['type'] == 'profile'
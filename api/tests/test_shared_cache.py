@@ -0,0 +1,113 @@
+"""
+Tests for the cross-worker shared resume snapshot.
+"""
+import multiprocessing
+import os
+import time
+import pytest
+from handlers import encoding, resume_all, shared_cache
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, monkeypatch):
+    """Enable the shared snapshot at a temporary path."""
+    path = str(tmp_path / 'resume.snapshot')
+    monkeypatch.setattr(shared_cache, 'PATH', path)
+    monkeypatch.setattr(shared_cache, '_current', None)
+    monkeypatch.setattr(shared_cache, '_next_check', 0.0)
+    return path
+
+
+def test_write_then_read_maps_the_payload(snapshot_path):
+    """Test a written snapshot reads back and the mapping is reused."""
+    shared_cache.write(b'{"profile":null}', 42)
+
+    snapshot = shared_cache.read()
+    assert snapshot.version == 42
+    assert bytes(snapshot.payload) == b'{"profile":null}'
+    assert shared_cache.read() is snapshot
+
+    shared_cache.write(b'{}', 43)
+    assert shared_cache.read().version == 43
+    assert bytes(snapshot.payload) == b'{"profile":null}'  # old mapping still valid
+
+
+def test_invalid_snapshot_is_ignored(snapshot_path):
+    """Test missing, empty and foreign files read as no snapshot."""
+    assert shared_cache.read() is None
+    open(snapshot_path, 'wb').close()
+    assert shared_cache.read() is None
+    with open(snapshot_path, 'wb') as f:
+        f.write(b'not a snapshot at all, just some bytes')
+    assert shared_cache.read() is None
+
+
+def _worker(path, counter):
+    """One worker process missing the cache at the same time as the others."""
+    shared_cache.PATH = path
+    shared_cache._current = None
+
+    def build():
+        with open(counter, 'a') as f:
+            f.write('x')
+        time.sleep(0.2)
+        return b'{"profile":null}', 7
+
+    assert shared_cache.get_or_build(build).version == 7
+
+
+@pytest.mark.skipif(not shared_cache.FCNTL_AVAILABLE, reason='needs fcntl')
+def test_concurrent_workers_build_once(snapshot_path, tmp_path):
+    """Test concurrent misses across processes run a single build."""
+    counter = str(tmp_path / 'builds')
+    context = multiprocessing.get_context('fork')
+    workers = [context.Process(target=_worker, args=(snapshot_path, counter)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(10)
+
+    assert [w.exitcode for w in workers] == [0, 0, 0, 0]
+    with open(counter) as f:
+        assert f.read() == 'x'
+
+
+def test_workers_share_one_scan_and_version(fake_table, snapshot_path):
+    """Test a second worker loads the snapshot instead of scanning."""
+    data = resume_all.get_all_resume_data()
+    version = resume_all.get_version()
+    body = encoding.dumps_cached(data)
+
+    # Simulate another worker: no local cache, same snapshot file
+    resume_all._cached_resume = resume_all._shared_snapshot = None
+    shared_cache._current = None
+    other = resume_all.get_all_resume_data()
+
+    assert fake_table.scan.call_count == 1
+    assert other is not data
+    assert resume_all.get_version() == version
+    assert encoding.dumps_cached(other) == body
+    assert [x.id for x in other['work_experience']] == [x.id for x in data['work_experience']]
+
+
+def test_expired_snapshot_is_rebuilt(fake_table, snapshot_path, monkeypatch):
+    """Test workers drop an expired snapshot and one of them rescans."""
+    resume_all.get_all_resume_data()
+    version = resume_all.get_version()
+    history = len(resume_all._history)
+    monkeypatch.setattr(shared_cache, 'TTL', 0)
+
+    resume_all.get_all_resume_data()
+    assert fake_table.scan.call_count == 2
+    # Same data: the rebuilt snapshot keeps the version and adds no history entry
+    assert shared_cache._current.version == version == resume_all.get_version()
+    assert len(resume_all._history) == history
+
+
+def test_clear_cache_removes_the_snapshot(fake_table, snapshot_path):
+    """Test clearing the cache makes every worker rebuild."""
+    resume_all.get_all_resume_data()
+    assert os.path.exists(snapshot_path)
+
+    resume_all.clear_cache()
+    assert not os.path.exists(snapshot_path)
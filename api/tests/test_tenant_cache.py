@@ -0,0 +1,182 @@
+"""
+Tests for the per-tenant byte-bounded LRU and /resume/{tenant}.
+"""
+import json
+import threading
+from unittest.mock import MagicMock, patch
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from botocore.exceptions import ClientError
+from handlers import resume_all, tenant_cache
+from handlers.tenant_cache import TenantCache
+from routers.resume import router
+from tests.conftest import make_items
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_evicts_least_recently_used_by_bytes():
+    """Test the budget is in bytes: one large entry evicts several small ones."""
+    sizes = {'a': 40, 'b': 40, 'c': 90}
+    cache = TenantCache(lambda key: b'x' * sizes[key], max_bytes=100, ttl=60)
+
+    cache.get('a')
+    cache.get('b')
+    cache.get('a')          # a is now most recently used
+    cache.get('c')          # 170 bytes > 100: evict b, then a
+
+    assert cache.stats() == {"entries": 1, "bytes": 90, "max_bytes": 100}
+    loads = []
+    cache.loader = lambda key: loads.append(key) or b'x' * sizes[key]
+    cache.get('c')
+    assert loads == []
+
+
+def test_per_tenant_ttl():
+    """Test entries reload after their own TTL."""
+    clock = FakeClock()
+    loads = []
+    cache = TenantCache(lambda key: loads.append(key) or b'{}', max_bytes=1000,
+                        ttl=300, ttls={'fast': 10}, clock=clock)
+
+    cache.get('fast')
+    cache.get('slow')
+    clock.now = 11
+    cache.get('fast')
+    cache.get('slow')
+
+    assert loads == ['fast', 'slow', 'fast']
+
+
+def test_concurrent_misses_share_one_load():
+    """Test simultaneous requests for one tenant trigger a single load."""
+    release = threading.Event()
+    calls = []
+
+    def loader(key):
+        calls.append(key)
+        release.wait(5)
+        return b'{"profile": null}'
+
+    cache = TenantCache(loader, max_bytes=1000, ttl=60)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get('acme'))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == ['acme']
+    assert results == [b'{"profile": null}'] * 8
+
+
+def test_failed_load_is_not_cached():
+    """Test a loader error reaches the caller and the next request retries."""
+    outcomes = [RuntimeError("throttled"), b'{}']
+
+    def loader(key):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    cache = TenantCache(loader, max_bytes=1000, ttl=60)
+    with pytest.raises(RuntimeError):
+        cache.get('acme')
+    assert cache.get('acme') == b'{}'
+
+
+def test_failed_load_with_waiters_leaves_no_state():
+    """Test waiters get the loader's error and nothing about the flight is kept."""
+    release = threading.Event()
+
+    def loader(key):
+        release.wait(5)
+        raise RuntimeError("throttled")
+
+    cache = TenantCache(loader, max_bytes=1000, ttl=60)
+    errors = []
+
+    def get():
+        try:
+            cache.get('acme')
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=get) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(errors) == 4
+    assert cache._inflight == {}
+    assert not hasattr(cache, '_errors')
+
+
+def test_tenant_items_are_queried_and_unprefixed():
+    """Test a tenant is read from TenantIndex with its id prefix removed."""
+    items = make_items()
+    for item in items:
+        item['id'] = f"acme#{item['id']}"
+        item['tenant'] = 'acme'
+    table = MagicMock()
+    table.query.return_value = {'Items': items}
+
+    with patch.object(tenant_cache, 'get_dynamodb_table', return_value=table):
+        body = json.loads(tenant_cache.load_tenant_resume('acme'))
+
+    assert table.query.call_args.kwargs['IndexName'] == 'TenantIndex'
+    assert body['profile']['name'] == 'Test Person'
+    assert 'tenant' not in body['profile']
+    assert [job['id'] for job in body['work_experience']] == ['work_001', 'work_002', 'work_003']
+
+
+def test_default_tenant_uses_the_index_with_scan_fallback(fake_table, monkeypatch):
+    """Test the default tenant is a TenantIndex Query, scanning only for legacy tables."""
+    monkeypatch.setattr(tenant_cache, 'get_dynamodb_table', lambda: fake_table)
+    tagged = [dict(item, tenant=resume_all.DEFAULT_TENANT) for item in make_items()]
+    fake_table.query.side_effect = lambda **kwargs: {'Items': tagged}
+
+    data = resume_all.get_all_resume_data()
+    assert data['profile']['name'] == 'Test Person'
+    assert fake_table.query.call_args.kwargs['IndexName'] == 'TenantIndex'
+    assert fake_table.scan.call_count == 0
+
+    # No TenantIndex on this table: fall back to the filtered scan
+    error = ClientError({'Error': {'Code': 'ValidationException'}}, 'Query')
+    fake_table.query.side_effect = error
+    assert len(tenant_cache.load_tenant_items(resume_all.DEFAULT_TENANT)) == len(make_items())
+    assert 'FilterExpression' in fake_table.scan.call_args.kwargs
+
+
+def test_reserved_tenants_cover_resume_routes():
+    """Test every static /resume/<name> route is reserved, so no tenant can shadow it."""
+    names = {route.path.split('/')[2] for route in router.routes
+             if route.path.startswith('/resume/') and '{' not in route.path.split('/')[2]}
+    assert names and names <= tenant_cache.RESERVED_TENANTS
+
+
+def test_tenant_route():
+    """Test /resume/{tenant} serves cached bytes and 404s unknown tenants."""
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+    payloads = {'acme': b'{"profile":{"name":"Acme Person"}}'}
+
+    with patch.object(tenant_cache, 'get_tenant_resume', side_effect=payloads.get):
+        assert client.get("/resume/acme").json() == {"profile": {"name": "Acme Person"}}
+        assert client.get("/resume/nobody").status_code == 404
+        assert client.get("/resume/Not_Valid").status_code == 422
+        # Existing routes still win over the tenant path
+        assert client.get("/resume/search").status_code == 400
+        assert client.get("/resume/changes").status_code == 422
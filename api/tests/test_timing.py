@@ -0,0 +1,62 @@
+"""
+Tests for Server-Timing spans and middleware.
+"""
+from unittest.mock import patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from handlers import timing
+from middleware.timing import ServerTimingMiddleware
+from routers import resume
+
+
+def _app(sample_rate=1.0):
+    app = FastAPI()
+    app.include_router(resume.router)
+    app.add_middleware(ServerTimingMiddleware, sample_rate=sample_rate)
+    return app
+
+
+def test_header_value_sums_repeated_spans():
+    """Test repeated span names are summed and descriptions kept."""
+    spans = [
+        ('cache', 0.001, 'miss'),
+        ('dynamodb.scan', 0.010, None),
+        ('dynamodb.scan', 0.005, None),
+    ]
+
+    value = timing.header_value(spans)
+
+    assert value == 'cache;desc="miss";dur=1.00, dynamodb.scan;dur=15.00'
+
+
+def test_span_is_noop_outside_request():
+    """Test span() does nothing when no request is being timed."""
+    assert not timing.enabled()
+    with timing.span('anything'):
+        pass
+
+
+def test_resume_response_has_server_timing():
+    """Test /resume responses carry handler spans and the app total."""
+    def fake_data():
+        timing.record('cache', 0.0, desc='hit')
+        return {"profile": {"name": "Test"}, "work_experience": [], "education": [], "skills": []}
+
+    with patch.object(resume, 'get_all_resume_data', side_effect=fake_data):
+        response = TestClient(_app()).get("/resume")
+
+    header = response.headers['server-timing']
+    assert response.status_code == 200
+    assert 'cache;desc="hit"' in header
+    assert 'encode;dur=' in header
+    assert 'app;dur=' in header
+
+
+def test_unsampled_requests_have_no_header():
+    """Test a zero sample rate disables the header."""
+    data = {"profile": None, "work_experience": [], "education": [], "skills": []}
+
+    with patch.object(resume, 'get_all_resume_data', return_value=data):
+        response = TestClient(_app(sample_rate=0.0)).get("/resume")
+
+    assert 'server-timing' not in response.headers
@@ -0,0 +1,125 @@
+"""
+Tests for the scheduled warm-up path, driven by synthetic EventBridge events.
+"""
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import lambda_handler
+from handlers import encoding, resume_all, warmer
+from middleware.events import LambdaEventsMiddleware
+from middleware.request_id import RequestIdMiddleware
+from routers.warmer import router as warmer_router
+
+SCHEDULED_EVENT = {
+    'version': '0', 'id': 'abc', 'detail-type': 'Scheduled Event', 'source': 'aws.events',
+    'account': '123456789012', 'time': '2026-01-01T00:00:00Z', 'region': 'us-east-1',
+    'resources': ['arn:aws:events:us-east-1:123456789012:rule/aws-serverless-resume-warmer'],
+    'detail': {},
+}
+HTTP_EVENT = {'rawPath': '/api/resume', 'requestContext': {'http': {'method': 'GET'}}}
+
+
+@pytest.fixture
+def no_asgi(monkeypatch):
+    """Keep the real FastAPI app out of these tests."""
+    app = MagicMock(return_value={'statusCode': 200})
+    monkeypatch.setattr(lambda_handler, '_asgi', app)
+    monkeypatch.setattr(warmer, 'HOLD_SECONDS', 0)
+    return app
+
+
+def test_recognizes_warm_events():
+    """Test schedule and constant-input events are warm-ups; HTTP events are not."""
+    assert warmer.is_warm_event({'warmer': True, 'concurrency': 3})
+    assert warmer.is_warm_event(SCHEDULED_EVENT)
+    assert not warmer.is_warm_event(HTTP_EVENT)
+    assert not warmer.is_warm_event([])
+
+
+def test_warm_event_builds_cache_without_asgi(fake_table, no_asgi, monkeypatch):
+    """Test a warm-up builds the cache and encoded bytes and skips FastAPI."""
+    monkeypatch.setattr(warmer, '_cold', True)
+    result = lambda_handler.handler({'warmer': True, 'concurrency': 1}, None)
+
+    assert result['warmed'] and result['cold'] and result['invoked'] == 0
+    no_asgi.assert_not_called()
+    assert resume_all._cached_resume is not None
+    assert encoding._last[0] is resume_all._cached_resume
+
+    assert lambda_handler.handler({'warmer': True}, None)['cold'] is False
+
+
+def test_fan_out_invokes_concurrency_minus_one(fake_table, no_asgi, monkeypatch):
+    """Test the first warm-up invokes WARM_CONCURRENCY-1 targets, whatever the event asks."""
+    monkeypatch.setattr(warmer, 'CONCURRENCY', 4)
+    client = MagicMock()
+    client.invoke.return_value = {'StatusCode': 200}
+    context = SimpleNamespace(function_name='resume-api')
+
+    result = warmer.warm({'warmer': True, 'concurrency': 'lots'}, context, client=client)
+
+    assert result['invoked'] == 3
+    for call in client.invoke.call_args_list:
+        assert call.kwargs['FunctionName'] == 'resume-api'
+        assert json.loads(call.kwargs['Payload']) == {'warmer': True, 'fanout': False}
+
+
+def test_concurrency_setting_is_clamped():
+    """Test a bad or oversized WARM_CONCURRENCY cannot raise or exceed the cap."""
+    assert warmer._parse_concurrency('abc') == 1
+    assert warmer._parse_concurrency('0') == 1
+    assert warmer._parse_concurrency('500') == warmer.MAX_CONCURRENCY
+
+
+def test_events_route_rejects_http_requests(fake_table, no_asgi):
+    """Test /events only serves adapter pass-through events, not Function URL requests."""
+    app = FastAPI()
+    app.include_router(warmer_router)
+    client = TestClient(app)
+
+    assert client.post('/events', json={'warmer': True}).json()['warmed'] is True
+    spoofed = client.post('/events', json={'warmer': True},
+                          headers={'x-amzn-request-context': '{"http": {"method": "POST"}}'})
+    assert spoofed.status_code == 404
+    assert client.post('/events', json=HTTP_EVENT).status_code == 404
+
+
+def test_events_skip_the_middleware_stack(fake_table, no_asgi):
+    """Test /events reaches the warmer without passing through the app's middleware."""
+    app = FastAPI()
+    app.add_middleware(RequestIdMiddleware)
+    events_app = FastAPI()
+    events_app.include_router(warmer_router)
+    app.add_middleware(LambdaEventsMiddleware, events_app=events_app)
+    client = TestClient(app)
+
+    response = client.post('/events', json={'warmer': True})
+    assert response.json()['warmed'] is True
+    assert 'X-Request-ID' not in response.headers
+    assert 'X-Request-ID' in client.get('/missing').headers
+
+
+def test_only_the_cold_warm_up_imports_fastapi(fake_table, no_asgi, monkeypatch):
+    """Test later warm pings skip the FastAPI import entirely."""
+    monkeypatch.setattr(lambda_handler, '_asgi', None)
+    get_asgi = MagicMock(side_effect=lambda: monkeypatch.setattr(lambda_handler, '_asgi', no_asgi))
+    monkeypatch.setattr(lambda_handler, '_get_asgi', get_asgi)
+
+    lambda_handler.handler({'warmer': True, 'fanout': False}, None)
+    lambda_handler.handler({'warmer': True, 'fanout': False}, None)
+    assert get_asgi.call_count == 1
+
+
+def test_warm_survives_dynamodb_failure(fake_table, no_asgi):
+    """Test a failing build is logged, not raised."""
+    fake_table.query.side_effect = fake_table.scan.side_effect = RuntimeError('down')
+    assert warmer.warm({'warmer': True, 'fanout': False})['warmed'] is True
+
+
+def test_http_events_go_to_fastapi(no_asgi):
+    """Test non-warm events are passed to the Mangum app."""
+    assert lambda_handler.handler(HTTP_EVENT, None) == {'statusCode': 200}
+    no_asgi.assert_called_once_with(HTTP_EVENT, None)
@@ -4,30 +4,108 @@
  * Fetches ALL resume data in a single API call on first load,
  * caches the Promise so concurrent callers share one fetch.
  *
+ * Published pages (scripts/publish_static.py) name a content-hashed static
+ * copy in <meta name="resume-data">, served by CloudFront without Lambda.
+ * Otherwise — or if that copy is missing — the API is asked for NDJSON
+ * (one line per section, profile first), so each section resolves and
+ * renders as soon as its line arrives. Plain JSON bodies work too.
+ *
  * One fetch. Zero repeat calls.
  */
 
 import { API_BASE } from "/scripts/api.js";
 import { PROJECTS_CONFIG } from "/scripts/projects.config.js";
 
+const SECTIONS = ["profile", "work_experience", "education", "skills"];
+
 // ---------------------------------------------------------------------------
-// Module-level cache — stores the Promise, not the result
+// Module-level cache — stores Promises, not results
 // ---------------------------------------------------------------------------
-let _resumePromise = null;
+let _sections = null;
+
+function deferred() {
+  let resolve, reject;
+  const promise = new Promise((res, rej) => {
+    resolve = res;
+    reject = rej;
+  });
+  return { promise, resolve, reject };
+}
+
+/**
+ * Read an NDJSON body line by line, resolving each section as it arrives.
+ */
+async function readSections(response, sections) {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+
+  const handleLine = (line) => {
+    if (!line.trim()) return;
+    const message = JSON.parse(line);
+    if (message.error) throw new Error(message.error);
+    sections[message.section]?.resolve(message.data);
+  };
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split("\n");
+    buffer = lines.pop();
+    lines.forEach(handleLine);
+  }
+  handleLine(buffer + decoder.decode());
+}
 
 /**
- * Fetch all resume data and cache it.
+ * Start the resume fetch once and return the per-section Promises.
  * Safe to call multiple times — only fetches once.
- * Caches the Promise itself so concurrent callers share one request.
  */
-async function fetchResumeData() {
-  if (!_resumePromise) {
-    _resumePromise = fetch(`${API_BASE}/resume`).then((response) => {
+function startResumeFetch() {
+  if (_sections) return _sections;
+
+  _sections = Object.fromEntries(SECTIONS.map((name) => [name, deferred()]));
+  const sections = _sections;
+
+  const fetchFromApi = () =>
+    fetch(`${API_BASE}/resume`, {
+      headers: { Accept: "application/x-ndjson, application/json;q=0.9" },
+    });
+  const staticUrl = document.querySelector('meta[name="resume-data"]')?.content;
+  const request = staticUrl
+    ? fetch(staticUrl)
+        .then((response) => (response.ok ? response : fetchFromApi()))
+        .catch(fetchFromApi)
+    : fetchFromApi();
+
+  request
+    .then(async (response) => {
       if (!response.ok) throw new Error("Failed to load resume data");
-      return response.json();
+      const type = response.headers.get("content-type") || "";
+      if (type.includes("application/x-ndjson") && response.body) {
+        await readSections(response, sections);
+      } else {
+        const data = await response.json();
+        SECTIONS.forEach((name) => sections[name].resolve(data[name]));
+      }
+      // A section missing from the stream is an error, not a hang
+      SECTIONS.forEach((name) =>
+        sections[name].reject(new Error(`Missing resume section: ${name}`))
+      );
+    })
+    .catch((error) => {
+      SECTIONS.forEach((name) => sections[name].reject(error));
     });
-  }
-  return _resumePromise;
+
+  return _sections;
+}
+
+/**
+ * Resolve one section of the resume as soon as it is available.
+ */
+function fetchSection(name) {
+  return startResumeFetch()[name].promise;
 }
 
 // ---------------------------------------------------------------------------
@@ -35,8 +113,7 @@ async function fetchResumeData() {
 // ---------------------------------------------------------------------------
 
 async function loadProfile(container) {
-  const data = await fetchResumeData();
-  const profile = data.profile;
+  const profile = await fetchSection("profile");
 
   container.innerHTML = `
     <div class="experience-item">
@@ -60,8 +137,7 @@ async function loadProfile(container) {
 }
 
 async function loadExperience(container) {
-  const data = await fetchResumeData();
-  const items = data.work_experience;
+  const items = await fetchSection("work_experience");
 
   // Separate main experience from additional experience
   const mainExperience = items.filter((exp) => !exp.is_additional);
@@ -119,8 +195,7 @@ async function loadExperience(container) {
 }
 
 async function loadSkills(container) {
-  const data = await fetchResumeData();
-  const items = data.skills;
+  const items = await fetchSection("skills");
 
   let html = '<div class="skills-grid">';
   items.forEach((skillItem) => {
@@ -139,8 +214,7 @@ async function loadSkills(container) {
 }
 
 async function loadEducation(container) {
-  const data = await fetchResumeData();
-  const items = data.education;
+  const items = await fetchSection("education");
 
   let html = "";
   items.forEach((edu) => {
@@ -176,8 +250,7 @@ async function loadEducation(container) {
 
 async function loadHeaderData() {
   try {
-    const data = await fetchResumeData();
-    const profile = data.profile;
+    const profile = await fetchSection("profile");
 
     // Update page title
     document.title = `${profile.name} - ${profile.title}`;
@@ -190,7 +263,8 @@ async function loadHeaderData() {
     document.getElementById("header-photo").src = profile.photo;
 
     // Update links
-    document.getElementById("pdf-link").href = profile.resume_pdf;
+    // Rendered by the API from the same data, so it never goes stale
+    document.getElementById("pdf-link").href = `${API_BASE}/resume.pdf`;
     document.getElementById("linkedin-link").href = profile.linkedin;
     document.getElementById("github-link").href = profile.github;
   } catch (error) {
@@ -199,21 +273,21 @@ async function loadHeaderData() {
 }
 
 // ---------------------------------------------------------------------------
-// Projects — GitHub API, driven by projects.config.js
+// Projects — GitHub repos via the API's cached /projects feed,
+// driven by projects.config.js
 // ---------------------------------------------------------------------------
 
 async function loadProjects(container) {
   container.innerHTML = `<div class="loading">Loading projects...</div>`;
 
   try {
-    const { github_username, repos } = PROJECTS_CONFIG;
+    const { repos } = PROJECTS_CONFIG;
 
-    const response = await fetch(
-      `https://api.github.com/users/${github_username}/repos?per_page=100`
-    );
+    const names = repos.map((config) => encodeURIComponent(config.name)).join(",");
+    const response = await fetch(`${API_BASE}/projects?repos=${names}`);
     if (!response.ok) throw new Error("Failed to load GitHub repos");
 
-    const githubRepos = await response.json();
+    const { repos: githubRepos } = await response.json();
 
     const cards = repos
       .map((config) => {
@@ -2,6 +2,10 @@
  * Projects Configuration
  * Edit this file to update what shows on the Projects section.
  *
+ * Repo details (stars, language, last update) come from the API's
+ * /projects route, which caches GitHub's feed server-side. The account
+ * is set on the API with GITHUB_USERNAME; keep github_username in sync.
+ *
  * Fields:
  *   name        — exact GitHub repo name (must match exactly)
  *   label       — display name shown on the card
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+ResumeData Backup
+Exports the raw table to a local archive and restores it.
+
+Export runs a parallel segmented Scan (one thread per segment). Each
+segment streams into its own gzip'd NDJSON file. Lines are in DynamoDB JSON,
+the same `{"Item": {...}}` shape as DynamoDB's export to S3, so every type
+(numbers, binaries, sets) round-trips exactly. A manifest records item counts
+and a sha256 per file.
+
+    backups/ResumeData-20260101T120000Z/
+        manifest.json
+        segment-00.ndjson.gz
+        segment-01.ndjson.gz
+        ...
+
+Restore verifies the checksums before writing anything, then puts the
+items back with the same batch writer load_resume.py uses (items are
+overwritten by id; nothing is deleted).
+
+load_resume.py takes a snapshot automatically before clearing a tenant.
+"""
+import argparse
+import base64
+import gzip
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import boto3
+from boto3.dynamodb.types import TypeDeserializer
+
+from publish_static import use_api_handlers
+
+# Tenant defaults shared with the API and load_resume.py
+use_api_handlers()
+from handlers.resume_all import DEFAULT_TENANT
+
+ROOT = Path(__file__).resolve().parent.parent
+BACKUP_DIR = Path(os.getenv('RESUME_BACKUP_DIR', ROOT / 'backups'))
+TABLE_NAME = 'ResumeData'
+SEGMENTS = 4
+FORMAT = 'dynamodb-json/ndjson+gzip'
+
+
+def get_dynamodb_table():
+    """Get DynamoDB table connection (shared by the table scripts)"""
+    endpoint_url = os.getenv('AWS_ENDPOINT_URL', 'http://localhost:4566')
+
+    # Use real AWS if endpoint_url is empty
+    if endpoint_url == "":
+        dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
+    else:
+        dynamodb = boto3.resource(
+            'dynamodb',
+            endpoint_url=endpoint_url,
+            region_name=os.getenv('AWS_REGION', 'us-east-1'),
+            aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID', 'test'),
+            aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY', 'test')
+        )
+    return dynamodb.Table(TABLE_NAME)
+
+
+def write_to_dynamodb(table, items):
+    """Write items to DynamoDB"""
+    # Write items in batches for speed
+    with table.batch_writer() as batch:
+        for item in items:
+            batch.put_item(Item=item)
+            item_type = item['type']
+            item_name = item.get('job_title') or item.get('degree') or item.get('category') or item['id']
+            print(f"  ✓ Added {item_type}: {item_name}")
+
+
+# ---------------------------------------------------------------------------
+# DynamoDB JSON ↔ NDJSON lines (binary values as base64, like DynamoDB exports)
+# ---------------------------------------------------------------------------
+
+def _to_json(attribute):
+    (kind, value), = attribute.items()
+    if kind == 'B':
+        return {'B': base64.b64encode(value).decode('ascii')}
+    if kind == 'BS':
+        return {'BS': [base64.b64encode(v).decode('ascii') for v in value]}
+    if kind == 'L':
+        return {'L': [_to_json(v) for v in value]}
+    if kind == 'M':
+        return {'M': {k: _to_json(v) for k, v in value.items()}}
+    return attribute
+
+
+def _from_json(attribute):
+    (kind, value), = attribute.items()
+    if kind == 'B':
+        return {'B': base64.b64decode(value)}
+    if kind == 'BS':
+        return {'BS': [base64.b64decode(v) for v in value]}
+    if kind == 'L':
+        return {'L': [_from_json(v) for v in value]}
+    if kind == 'M':
+        return {'M': {k: _from_json(v) for k, v in value.items()}}
+    return attribute
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+def _export_segment(client, table_name, segment, total_segments, path):
+    """Scan one segment into a gzip'd NDJSON file: (items, raw bytes, consumed RCU)."""
+    items = raw_bytes = 0
+    capacity = 0.0
+    kwargs = {'TableName': table_name, 'Segment': segment, 'TotalSegments': total_segments,
+              'ReturnConsumedCapacity': 'TOTAL'}
+    with gzip.open(path, 'wb') as out:
+        while True:
+            response = client.scan(**kwargs)
+            capacity += response.get('ConsumedCapacity', {}).get('CapacityUnits', 0)
+            for item in response.get('Items', []):
+                line = json.dumps({'Item': {k: _to_json(v) for k, v in item.items()}},
+                                  separators=(',', ':')).encode('utf-8') + b'\n'
+                out.write(line)
+                items += 1
+                raw_bytes += len(line)
+            if 'LastEvaluatedKey' not in response:
+                break
+            kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    return items, raw_bytes, capacity
+
+
+def export_table(table, out_dir=BACKUP_DIR, segments=SEGMENTS):
+    """
+    Back up every item of the table to a new archive directory.
+
+    Args:
+        table: boto3 Table resource
+        out_dir: Directory the archive is created in
+        segments: Parallel Scan segments (and threads)
+
+    Returns:
+        Path: The archive directory
+    """
+    created = datetime.now(timezone.utc)
+    archive = Path(out_dir) / f"{table.name}-{created.strftime('%Y%m%dT%H%M%SZ')}"
+    archive.mkdir(parents=True, exist_ok=False)
+    client = table.meta.client  # low-level client: thread-safe, DynamoDB JSON out
+
+    print(f"📦 Backing up {table.name} ({segments} segments) → {archive}")
+    start = time.perf_counter()
+    paths = [archive / f"segment-{segment:02d}.ndjson.gz" for segment in range(segments)]
+    with ThreadPoolExecutor(max_workers=segments) as pool:
+        results = list(pool.map(
+            lambda segment: _export_segment(client, table.name, segment, segments, paths[segment]),
+            range(segments)
+        ))
+    elapsed = time.perf_counter() - start
+
+    files = [
+        {'name': path.name, 'items': items, 'bytes': path.stat().st_size, 'sha256': _sha256(path)}
+        for path, (items, _, _) in zip(paths, results)
+    ]
+    total_items = sum(f['items'] for f in files)
+    raw_bytes = sum(r[1] for r in results)
+    manifest = {
+        'table': table.name,
+        'created_at': created.isoformat(),
+        'format': FORMAT,
+        'segments': segments,
+        'items': total_items,
+        'uncompressed_bytes': raw_bytes,
+        'consumed_capacity': sum(r[2] for r in results),
+        'files': files,
+    }
+    (archive / 'manifest.json').write_text(json.dumps(manifest, indent=2) + '\n')
+
+    _report('Exported', total_items, raw_bytes, sum(f['bytes'] for f in files), elapsed)
+    return archive
+
+
+# ---------------------------------------------------------------------------
+# Restore
+# ---------------------------------------------------------------------------
+
+def read_archive(archive):
+    """
+    Load and verify an archive's manifest.
+
+    Raises:
+        ValueError: A file is missing or its checksum doesn't match
+    """
+    archive = Path(archive)
+    manifest = json.loads((archive / 'manifest.json').read_text())
+    if manifest.get('format') != FORMAT:
+        raise ValueError(f"Unsupported archive format: {manifest.get('format')}")
+    for entry in manifest['files']:
+        path = archive / entry['name']
+        if not path.exists():
+            raise ValueError(f"Missing archive file: {entry['name']}")
+        if _sha256(path) != entry['sha256']:
+            raise ValueError(f"Checksum mismatch: {entry['name']}")
+    return manifest
+
+
+def iter_archive(archive, manifest):
+    """Yield the archived items as boto3 resource items (Decimals, Binary, sets)."""
+    deserializer = TypeDeserializer()
+    for entry in manifest['files']:
+        with gzip.open(Path(archive) / entry['name'], 'rb') as f:
+            for line in f:
+                item = json.loads(line)['Item']
+                yield {k: deserializer.deserialize(_from_json(v)) for k, v in item.items()}
+
+
+def restore_table(table, archive, tenant=None):
+    """
+    Put an archive's items back into the table.
+
+    Args:
+        table: boto3 Table resource
+        archive: Archive directory written by export_table()
+        tenant: Only restore this tenant's items
+
+    Returns:
+        int: Items written
+    """
+    manifest = read_archive(archive)
+    print(f"♻️  Restoring {manifest['items']} items from {archive} "
+          f"(backed up {manifest['created_at']})")
+
+    counted = {'items': 0}
+
+    def selected():
+        for item in iter_archive(archive, manifest):
+            if tenant is None or item.get('tenant', DEFAULT_TENANT) == tenant:
+                counted['items'] += 1
+                yield item
+
+    start = time.perf_counter()
+    write_to_dynamodb(table, selected())
+    elapsed = time.perf_counter() - start
+    _report('Restored', counted['items'], None, None, elapsed)
+    return counted['items']
+
+
+def _report(action, items, raw_bytes, compressed_bytes, elapsed):
+    elapsed = max(elapsed, 1e-9)
+    line = f"  ✓ {action} {items} items in {elapsed:.2f}s ({items / elapsed:,.0f} items/s"
+    if raw_bytes is not None:
+        line += (f", {raw_bytes / elapsed / 1e6:.2f} MB/s; "
+                 f"{raw_bytes / 1024:.1f} KiB → {compressed_bytes / 1024:.1f} KiB gzip")
+    print(line + ")")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Back up or restore the ResumeData table')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export = commands.add_parser('export', help='Parallel scan into a compressed archive')
+    export.add_argument('--out', default=str(BACKUP_DIR), help=f"Archive directory (default {BACKUP_DIR})")
+    export.add_argument('--segments', type=int, default=SEGMENTS, help='Parallel scan segments')
+
+    restore = commands.add_parser('restore', help='Write an archive back into the table')
+    restore.add_argument('archive', help='Archive directory (contains manifest.json)')
+    restore.add_argument('--tenant', help='Only restore this tenant')
+    args = parser.parse_args()
+
+    try:
+        table = get_dynamodb_table()
+        if args.command == 'export':
+            export_table(table, args.out, args.segments)
+        else:
+            restore_table(table, args.archive, args.tenant)
+    except Exception as e:
+        print(f"\n❌ {args.command.capitalize()} failed: {e}")
+        sys.exit(1)
+
+    print("\n✅ Done\n")
+
+
+if __name__ == '__main__':
+    main()
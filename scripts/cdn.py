@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+CDN helpers
+Targeted CloudFront invalidations shared by the publishing scripts.
+
+API responses carry surrogate keys (see api/handlers/cache_policy.py), but
+CloudFront can only invalidate paths. purge_tags() maps the keys back to
+the paths that carry them.
+
+Invalidations are stubbed (printed, not sent) with --dry-run or whenever
+AWS_ENDPOINT_URL points at LocalStack, which has no CloudFront.
+"""
+import os
+import time
+
+import boto3
+
+# Must match the tags in api/handlers/cache_policy.py
+API_PREFIX = '/api'
+RESUME_PATHS = ['/resume', '/resume.pdf', '/resume/changes*', '/resume/search*']
+TAG_PATHS = {
+    'resume': RESUME_PATHS,
+    'health': ['/health'],
+    'projects': ['/projects*'],
+}
+
+
+def is_local():
+    """Whether AWS calls go to LocalStack rather than real AWS"""
+    return bool(os.getenv('AWS_ENDPOINT_URL', ''))
+
+
+def invalidate(paths, distribution_id=None, dry_run=False):
+    """
+    Invalidate specific paths on the CloudFront distribution.
+
+    Args:
+        paths: Paths to invalidate, e.g. ["/", "/index.html"]
+        distribution_id: Defaults to CLOUDFRONT_DISTRIBUTION_ID
+        dry_run: Print the request instead of sending it
+
+    Returns:
+        str | None: Invalidation id, or None when stubbed or skipped
+    """
+    paths = sorted(set(paths))
+    if not paths:
+        return None
+
+    distribution_id = distribution_id or os.getenv('CLOUDFRONT_DISTRIBUTION_ID', '')
+    if dry_run or is_local() or not distribution_id:
+        reason = 'dry run' if dry_run else ('local' if is_local() else 'no distribution id')
+        print(f"  ↷ Skipping CloudFront invalidation ({reason}): {' '.join(paths)}")
+        return None
+
+    response = boto3.client('cloudfront').create_invalidation(
+        DistributionId=distribution_id,
+        InvalidationBatch={
+            'Paths': {'Quantity': len(paths), 'Items': paths},
+            'CallerReference': f"publish-{time.time_ns()}",
+        }
+    )
+    invalidation_id = response['Invalidation']['Id']
+    print(f"  ✓ CloudFront invalidation {invalidation_id}: {' '.join(paths)}")
+    return invalidation_id
+
+
+def tag_paths(tags):
+    """
+    CloudFront paths for surrogate keys.
+
+    Args:
+        tags: Keys such as "resume", "resume-v12", "section-skills", "tenant-jane-doe"
+
+    Returns:
+        list[str]: Paths under the /api behavior
+    """
+    paths = set()
+    for tag in tags:
+        if tag.startswith('tenant-'):
+            paths.add(f"/resume/{tag[len('tenant-'):]}")
+        elif tag.startswith(('resume-v', 'section-')):
+            # Sections and versions all live in the resume paths
+            paths.update(RESUME_PATHS)
+        else:
+            paths.update(TAG_PATHS.get(tag, ()))
+    return [API_PREFIX + path for path in paths]
+
+
+def purge_tags(tags, distribution_id=None, dry_run=False):
+    """
+    Purge cached API responses by surrogate key.
+
+    Args:
+        tags: Surrogate keys to purge
+        distribution_id: Defaults to CLOUDFRONT_DISTRIBUTION_ID
+        dry_run: Print the request instead of sending it
+
+    Returns:
+        str | None: Invalidation id, or None when stubbed or skipped
+    """
+    return invalidate(tag_paths(tags), distribution_id, dry_run=dry_run)
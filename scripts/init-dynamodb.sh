@@ -6,10 +6,11 @@ sleep 5
 echo "Creating DynamoDB table..."
 aws --endpoint-url=http://localstack:4566 dynamodb create-table \
     --table-name ResumeData \
-    --attribute-definitions AttributeName=id,AttributeType=S AttributeName=type,AttributeType=S \
+    --attribute-definitions AttributeName=id,AttributeType=S AttributeName=type,AttributeType=S AttributeName=tenant,AttributeType=S \
     --key-schema AttributeName=id,KeyType=HASH \
     --global-secondary-indexes \
         "IndexName=TypeIndex,KeySchema=[{AttributeName=type,KeyType=HASH}],Projection={ProjectionType=ALL},ProvisionedThroughput={ReadCapacityUnits=5,WriteCapacityUnits=5}" \
+        "IndexName=TenantIndex,KeySchema=[{AttributeName=tenant,KeyType=HASH}],Projection={ProjectionType=ALL},ProvisionedThroughput={ReadCapacityUnits=5,WriteCapacityUnits=5}" \
     --billing-mode PROVISIONED \
     --provisioned-throughput ReadCapacityUnits=5,WriteCapacityUnits=5 \
     --region us-east-1 2>/dev/null
@@ -2,13 +2,35 @@
 """
 Resume Data Loader
 Reads resume data from Excel template and loads into DynamoDB
+
+Display order is worked out here, once per load: every item gets a `rank`
+within its section (api/handlers/ordering.py), and dates are stored as ISO
+strings, so the API never sorts on its read path.
 """
+import argparse
+import re
 import sys
-import boto3
 import pandas as pd
+from boto3.dynamodb.conditions import Attr
 from pathlib import Path
 import os
 
+from backup_table import BACKUP_DIR, export_table, get_dynamodb_table, write_to_dynamodb
+from cdn import purge_tags
+from publish_static import use_api_handlers
+
+# Display order shared with the API's read path
+use_api_handlers()
+from handlers.codec import compress_items, item_size
+from handlers.ordering import assign_ranks, iso_date
+# Tenant naming rules, as enforced by /resume/{tenant}
+from handlers.resume_all import DEFAULT_TENANT
+from handlers.tenant_cache import RESERVED_TENANTS, TENANT_PATTERN
+
+def cache_tag(tenant):
+    """Surrogate key for a tenant's cached API responses (api/handlers/cache_policy.resume_tag)"""
+    return 'resume' if tenant == DEFAULT_TENANT else f"tenant-{tenant}"
+
 def load_work_experience(df):
     """Transform work experience data from DataFrame to DynamoDB format"""
     items = []
@@ -34,9 +56,7 @@ def load_work_experience(df):
             is_additional = str(row['is_additional']).strip().upper() == 'TRUE'
         
         # Handle end_date
-        end_date = None
-        if pd.notna(row['end_date']) and str(row['end_date']).strip():
-            end_date = str(row['end_date']).strip()
+        end_date = iso_date(row['end_date'])
         
         # If is_additional is TRUE, ignore description and accomplishments
         if is_additional:
@@ -51,7 +71,7 @@ def load_work_experience(df):
             'type': 'work_experience',
             'job_title': str(row['job_title']).strip(),
             'company_name': str(row['company_name']).strip(),
-            'start_date': str(row['start_date']).strip(),
+            'start_date': iso_date(row['start_date']) or '',
             'end_date': end_date,
             'is_current': is_current,
             'is_additional': is_additional,
@@ -76,8 +96,8 @@ def load_education(df):
             'type': 'education',
             'degree': str(row['degree']).strip(),
             'institution': str(row['institution']).strip(),
-            'start_date': str(row['start_date']).strip(),
-            'end_date': str(row['end_date']).strip(),
+            'start_date': iso_date(row['start_date']) or '',
+            'end_date': iso_date(row['end_date']) or '',
             'description': str(row['description']).strip() if pd.notna(row['description']) else ''
         }
         items.append(item)
@@ -132,34 +152,32 @@ def load_profile(df):
     
     return [profile_data]
 
-def get_dynamodb_table():
-    """Get DynamoDB table connection"""
-    endpoint_url = os.getenv('AWS_ENDPOINT_URL', 'http://localhost:4566')
-    
-    # Use real AWS if endpoint_url is empty
-    if endpoint_url == "":
-        dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
-    else:
-        dynamodb = boto3.resource(
-            'dynamodb',
-            endpoint_url=endpoint_url,
-            region_name=os.getenv('AWS_REGION', 'us-east-1'),
-            aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID', 'test'),
-            aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY', 'test')
-        )
-    return dynamodb.Table('ResumeData')
-
-def clear_table(table):
-    """Delete all items from DynamoDB table"""
-    print("🗑️  Clearing existing data...")
-    
-    # Scan all items
-    response = table.scan()
+def tenant_filter(tenant):
+    """Scan filter selecting one tenant's items (legacy items belong to the default tenant)"""
+    if tenant == DEFAULT_TENANT:
+        return Attr('tenant').not_exists() | Attr('tenant').eq(tenant)
+    return Attr('tenant').eq(tenant)
+
+def apply_tenant(items, tenant):
+    """Tag items with their tenant; ids outside the default tenant get a "<tenant>#" prefix"""
+    for item in items:
+        item['tenant'] = tenant
+        if tenant != DEFAULT_TENANT:
+            item['id'] = f"{tenant}#{item['id']}"
+    return items
+
+def clear_table(table, tenant=DEFAULT_TENANT):
+    """Delete one tenant's items from DynamoDB table"""
+    print(f"🗑️  Clearing existing data for tenant '{tenant}'...")
+    
+    # Scan this tenant's items
+    response = table.scan(FilterExpression=tenant_filter(tenant))
     items = response.get('Items', [])
     
     # Handle pagination
     while 'LastEvaluatedKey' in response:
-        response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
+        response = table.scan(FilterExpression=tenant_filter(tenant),
+                              ExclusiveStartKey=response['LastEvaluatedKey'])
         items.extend(response.get('Items', []))
     
     # Delete all items
@@ -169,24 +187,31 @@ def clear_table(table):
     
     print(f"  ✓ Deleted {len(items)} items")
 
-def write_to_dynamodb(table, items):
-    """Write items to DynamoDB"""
-    # Write items in batches for speed
-    with table.batch_writer() as batch:
-        for item in items:
-            batch.put_item(Item=item)
-            item_type = item['type']
-            item_name = item.get('job_title') or item.get('degree') or item.get('category', 'Unknown')
-            print(f"  ✓ Added {item_type}: {item_name}")
-
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python load_resume.py <excel_file>")
-        print("Example: python load_resume.py resume-data-template.xlsx")
+    parser = argparse.ArgumentParser(
+        description='Load resume data from Excel into DynamoDB',
+        epilog='Example: python load_resume.py resume-data-template.xlsx --tenant jane-doe'
+    )
+    parser.add_argument('excel_file', help='Resume data workbook')
+    parser.add_argument('--tenant', default=DEFAULT_TENANT,
+                        help=f"Tenant to load into (default '{DEFAULT_TENANT}', served at /resume)")
+    parser.add_argument('--compress', action='store_true',
+                        help='Store long descriptions/accomplishments zlib-compressed (fewer read/write units)')
+    parser.add_argument('--no-backup', action='store_true',
+                        help=f"Skip the table snapshot taken before clearing (saved under {BACKUP_DIR})")
+    parser.add_argument('--distribution-id', default=os.getenv('CLOUDFRONT_DISTRIBUTION_ID', ''),
+                        help='Distribution to purge (terraform output cloudfront_distribution_id)')
+    parser.add_argument('--no-purge', action='store_true',
+                        help="Leave cached API responses to expire instead of purging them")
+    args = parser.parse_args()
+
+    excel_file = args.excel_file
+    tenant = args.tenant
+    if not re.match(TENANT_PATTERN, tenant) or tenant in RESERVED_TENANTS:
+        print(f"Error: invalid tenant '{tenant}' (lowercase letters, digits and '-', "
+              f"not one of: {', '.join(sorted(RESERVED_TENANTS))})")
         sys.exit(1)
     
-    excel_file = sys.argv[1]
-    
     if not Path(excel_file).exists():
         print(f"Error: File '{excel_file}' not found")
         sys.exit(1)
@@ -210,6 +235,21 @@ def main():
     edu_items = load_education(edu_df)
     skills_items = load_skills(skills_df)
     
+    for items in (profile_items, work_items, edu_items, skills_items):
+        apply_tenant(items, tenant)
+    assign_ranks(work_items + edu_items + skills_items)
+
+    # Optional: compress bulky attributes with a dictionary trained on this resume
+    codec_items = []
+    if args.compress:
+        before = sum(item_size(item) for item in work_items + edu_items)
+        codec_dict = compress_items(work_items + edu_items)
+        if codec_dict is not None:
+            codec_items = apply_tenant([codec_dict], tenant)
+            after = sum(item_size(item) for item in work_items + edu_items + codec_items)
+            print(f"🗜️  Compressed work/education items: {before:,} → {after:,} bytes "
+                  f"(including the {item_size(codec_dict):,}-byte dictionary)\n")
+
     total_items = len(profile_items) + len(work_items) + len(edu_items) + len(skills_items)
     
     if total_items == 0:
@@ -230,9 +270,18 @@ def main():
         print(f"\n❌ Error connecting to DynamoDB: {e}")
         sys.exit(1)
     
+    # Snapshot the whole table before deleting anything (scripts/backup_table.py restore)
+    if not args.no_backup:
+        try:
+            export_table(table)
+        except Exception as e:
+            print(f"\n❌ Error backing up table, nothing was cleared (--no-backup to skip): {e}")
+            sys.exit(1)
+        print()
+
     # Clear existing data
     try:
-        clear_table(table)
+        clear_table(table, tenant)
     except Exception as e:
         print(f"\n❌ Error clearing table: {e}")
         sys.exit(1)
@@ -241,6 +290,8 @@ def main():
     
     # Write to DynamoDB
     try:
+        # Dictionary first, so compressed items are never readable without it
+        write_to_dynamodb(table, codec_items)
         write_to_dynamodb(table, profile_items)
         write_to_dynamodb(table, work_items)
         write_to_dynamodb(table, edu_items)
@@ -249,7 +300,14 @@ def main():
         print(f"\n❌ Error writing to DynamoDB: {e}")
         sys.exit(1)
     
-    print(f"\n✅ Successfully loaded {total_items} items into DynamoDB!\n")
+    # Drop this tenant's cached API responses so CloudFront refetches them
+    if not args.no_purge:
+        try:
+            purge_tags([cache_tag(tenant)], args.distribution_id)
+        except Exception as e:
+            print(f"\n⚠️  Loaded, but purging the CDN failed: {e}")
+
+    print(f"\n✅ Successfully loaded {total_items} items into DynamoDB for tenant '{tenant}'!\n")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Profile Report
+Merges collapsed-stack dumps written by the API's profiling middleware
+into a ranked hot-function report.
+
+Usage:
+    python profile_report.py <dump_dir> [--top N] [--merge merged.collapsed]
+    python profile_report.py token <secret> [ttl_seconds]
+
+"self" counts samples where the function was on top of the stack;
+"total" counts samples where it appeared anywhere in the stack.
+"""
+import argparse
+import sys
+from collections import Counter
+from pathlib import Path
+
+from publish_static import use_api_handlers
+
+
+def read_dumps(directory):
+    """Merge every *.collapsed file in a directory into one Counter"""
+    stacks = Counter()
+    files = sorted(Path(directory).glob('*.collapsed'))
+    for path in files:
+        for line in path.read_text().splitlines():
+            stack, _, count = line.rpartition(' ')
+            if stack and count.isdigit():
+                stacks[stack] += int(count)
+    return stacks, len(files)
+
+
+def rank_functions(stacks):
+    """Compute self and total sample counts per function"""
+    self_counts = Counter()
+    total_counts = Counter()
+    for stack, count in stacks.items():
+        frames = stack.split(';')
+        self_counts[frames[-1]] += count
+        for frame in set(frames):
+            total_counts[frame] += count
+    return self_counts, total_counts
+
+
+def print_report(stacks, files, top):
+    total_samples = sum(stacks.values())
+    self_counts, total_counts = rank_functions(stacks)
+
+    print(f"\n🔥 {total_samples} samples from {files} dumps\n")
+    print(f"{'self %':>7} {'total %':>8}  function")
+    for frame, count in self_counts.most_common(top):
+        print(f"{100 * count / total_samples:6.1f}% "
+              f"{100 * total_counts[frame] / total_samples:7.1f}%  {frame}")
+
+    print(f"\nTop {top} by inclusive time:")
+    for frame, count in total_counts.most_common(top):
+        print(f"{100 * count / total_samples:6.1f}%  {frame}")
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'token':
+        if len(sys.argv) < 3:
+            print("Usage: python profile_report.py token <secret> [ttl_seconds]")
+            sys.exit(1)
+        ttl = int(sys.argv[3]) if len(sys.argv) > 3 else 300
+        # The middleware's own signer, so CLI tokens always verify
+        use_api_handlers()
+        from middleware.profiling import sign_debug_token
+        print(sign_debug_token(sys.argv[2], ttl))
+        return
+
+    parser = argparse.ArgumentParser(description='Rank hot functions across profile dumps')
+    parser.add_argument('directory', help='Directory containing *.collapsed dumps')
+    parser.add_argument('--top', type=int, default=25, help='Number of functions to show')
+    parser.add_argument('--merge', help='Write the merged stacks to this file')
+    args = parser.parse_args()
+
+    stacks, files = read_dumps(args.directory)
+    if not stacks:
+        print(f"No *.collapsed dumps found in {args.directory}")
+        sys.exit(1)
+
+    print_report(stacks, files, args.top)
+
+    if args.merge:
+        Path(args.merge).write_text(
+            "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+        )
+        print(f"\n✅ Merged stacks written to {args.merge} (open in speedscope.app)")
+
+
+if __name__ == '__main__':
+    main()
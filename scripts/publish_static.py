@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Static Publisher
+Reads the resume table once and publishes it as static files, so page
+views are served by CloudFront + S3 without invoking Lambda:
+
+- data/resume.<hash>.json   Content-hashed resume, cached for a year (immutable)
+- index.html                Header and resume sections pre-rendered, pointing
+                            at the hashed JSON via <meta name="resume-data">
+
+Only "/" and "/index.html" are invalidated; the JSON is a new object on
+every content change. /api/resume stays available as the fallback.
+
+Usage:
+    python publish_static.py --bucket BUCKET [--distribution-id ID] [--dry-run]
+    python publish_static.py --out build/   # write files locally instead
+
+Set AWS_ENDPOINT_URL for LocalStack (invalidation is then stubbed), or
+AWS_ENDPOINT_URL="" for real AWS, as with load_resume.py.
+"""
+import argparse
+import hashlib
+import os
+import re
+import sys
+from html import escape
+from pathlib import Path
+
+import boto3
+
+from cdn import invalidate
+
+ROOT = Path(__file__).resolve().parent.parent
+
+IMMUTABLE = 'public, max-age=31536000, immutable'
+# Browsers revalidate; CloudFront keeps it until the next publish invalidates it
+HTML_CACHE = 'public, max-age=0, s-maxage=86400, must-revalidate'
+
+
+def use_api_handlers():
+    """Make the API's handlers importable (repo checkout or the api container)"""
+    for candidate in (ROOT / 'api', ROOT):
+        if (candidate / 'handlers' / 'resume_all.py').exists():
+            sys.path.insert(0, str(candidate))
+            return
+    raise RuntimeError("Could not find the api/handlers package")
+
+
+def encode_resume(data):
+    """Compact JSON bytes (same encoder as /api/resume) and the content-hashed object key"""
+    from handlers import encoding  # importable once use_api_handlers() has run
+    body = encoding.dumps(data)
+    digest = hashlib.sha256(body).hexdigest()[:12]
+    return body, f"data/resume.{digest}.json"
+
+
+# ---------------------------------------------------------------------------
+# Section rendering — mirrors the templates in app/scripts/loaders.js
+# ---------------------------------------------------------------------------
+
+def render_profile(profile):
+    e = lambda field: escape(str(profile.get(field) or ''))
+    html = f"""
+    <div class="experience-item">
+      <h3>{e('name')}</h3>
+      <p class="company">{e('title')}</p>
+      <p class="description">{e('summary')}</p>
+      <p><strong>Location:</strong> {e('location')}</p>
+      {f'<p><strong>Email:</strong> {e("email")}</p>' if profile.get('email') else ''}
+    </div>"""
+    if profile.get('professional_summary'):
+        html += f"""
+    <div class="experience-item" style="margin-top: 1.5rem;">
+      <h3>Professional Summary</h3>
+      <p class="description">{e('professional_summary')}</p>
+    </div>"""
+    return html
+
+
+def render_experience(items):
+    html = ""
+    for exp in (x for x in items if not x.get('is_additional')):
+        end_date = 'present' if exp.get('is_current') else exp.get('end_date')
+        highlights = "".join(f"<li>{escape(h)}</li>" for h in exp.get('accomplishments', []))
+        html += f"""
+      <div class="experience-item">
+        <div class="experience-header">
+          <div>
+            <h3>{escape(exp.get('job_title', ''))}</h3>
+            <p class="company">{escape(exp.get('company_name', ''))}</p>
+          </div>
+          <span class="date">{escape(str(exp.get('start_date', '')))} — {escape(str(end_date))}</span>
+        </div>
+        <p class="description">{escape(exp.get('description', ''))}</p>
+        <ul class="highlights">
+          {highlights}
+        </ul>
+      </div>"""
+
+    additional = [x for x in items if x.get('is_additional')]
+    if additional:
+        entries = []
+        for exp in additional:
+            start_year = (exp.get('start_date') or '')[:4]
+            end_year = (exp.get('end_date') or '')[:4] or ('Present' if exp.get('is_current') else '')
+            year_range = f"({start_year} — {end_year})" if start_year and end_year else ''
+            entries.append(f"<li>{escape(exp.get('job_title', ''))}, "
+                           f"{escape(exp.get('company_name', ''))} {year_range}</li>")
+        html += f"""
+      <div class="additional-experience">
+        <h3>Additional Experience</h3>
+        <ul>
+          {"".join(entries)}
+        </ul>
+      </div>"""
+    return html
+
+
+def render_skills(items):
+    html = '<div class="skills-grid">'
+    for item in items:
+        tags = "".join(f'<span class="skill-tag">{escape(s)}</span>' for s in item.get('skills', []))
+        html += f"""
+      <div class="skill-category">
+        <h3>{escape(item.get('category', ''))}</h3>
+        <div class="skill-tags">
+          {tags}
+        </div>
+      </div>"""
+    return html + "</div>"
+
+
+def render_education(items):
+    html = ""
+    for edu in items:
+        start = edu.get('start_date') if edu.get('start_date') not in (None, '', 'nan') else ''
+        end = edu.get('end_date') if edu.get('end_date') not in (None, '', 'nan') else ''
+        date_range = f"{start} — {end}" if start and end else (start or end)
+        html += f"""
+      <div class="experience-item">
+        <div class="experience-header">
+          <div>
+            <h3>{escape(edu.get('degree', ''))}</h3>
+            <p class="company">{escape(edu.get('institution', ''))}</p>
+          </div>
+          {f'<span class="date">{escape(str(date_range))}</span>' if date_range else ''}
+        </div>
+        {f'<p class="description">{escape(edu["description"])}</p>' if edu.get('description') else ''}
+      </div>"""
+    return html
+
+
+def _sub(pattern, replace, page, label):
+    """Replace the first match, warning when the template has no placeholder"""
+    page, count = re.subn(pattern, replace, page, count=1, flags=re.S)
+    if not count:
+        print(f"  ⚠️  index.html: no placeholder for {label}, left as is")
+    return page
+
+
+def _set_attribute(page, element_id, attribute, value):
+    """Set an attribute on the tag with the given id"""
+    def replace(match):
+        return re.sub(rf'\b{attribute}="[^"]*"', f'{attribute}="{escape(value)}"', match.group(0))
+    return _sub(rf'<[^>]*\bid="{element_id}"[^>]*>', replace, page, element_id)
+
+
+def render_index(template, data, data_key):
+    """Fill index.html with the resume and point it at the hashed JSON"""
+    profile = data.get('profile') or {}
+    page = _sub(r'</head>',
+                lambda _: f'  <meta name="resume-data" content="/{data_key}" />\n  </head>',
+                template, 'resume-data meta')
+
+    if profile.get('name'):
+        title = f"{profile['name']} - {profile.get('title', '')}"
+        page = _sub(r'<title>.*?</title>', lambda _: f"<title>{escape(title)}</title>", page, 'title')
+
+    for element_id, field in (('header-name', 'name'), ('header-title', 'title')):
+        if profile.get(field):
+            page = _sub(rf'(<[^>]*\bid="{element_id}"[^>]*>)Loading\.\.\.(</)',
+                        lambda m: m.group(1) + escape(str(profile[field])) + m.group(2),
+                        page, element_id)
+
+    for element_id, field, attribute in (('header-photo', 'photo', 'src'),
+                                         ('linkedin-link', 'linkedin', 'href'),
+                                         ('github-link', 'github', 'href')):
+        if profile.get(field):
+            page = _set_attribute(page, element_id, attribute, str(profile[field]))
+
+    sections = (
+        ('about', render_profile(profile)),
+        ('experience', render_experience(data.get('work_experience', []))),
+        ('skills', render_skills(data.get('skills', []))),
+        ('education', render_education(data.get('education', []))),
+    )
+    for section_id, html in sections:
+        # Keep the <h2>, replace the "Loading..." placeholder after it
+        page = _sub(rf'(<section id="{section_id}"[^>]*>\s*<h2>.*?</h2>)\s*<div class="loading">.*?</div>',
+                    lambda m: m.group(1) + html, page, section_id)
+    return page
+
+
+# ---------------------------------------------------------------------------
+# Publishing
+# ---------------------------------------------------------------------------
+
+def get_s3_client():
+    """S3 client for LocalStack or real AWS (same convention as load_resume.py)"""
+    endpoint_url = os.getenv('AWS_ENDPOINT_URL', '')
+    if not endpoint_url:
+        return boto3.client('s3', region_name=os.getenv('AWS_REGION', 'us-east-1'))
+    return boto3.client(
+        's3',
+        endpoint_url=endpoint_url,
+        region_name=os.getenv('AWS_REGION', 'us-east-1'),
+        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID', 'test'),
+        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY', 'test')
+    )
+
+
+def publish(files, bucket=None, out=None, dry_run=False):
+    """
+    Write files to a local directory or upload them to S3.
+
+    Args:
+        files: [(key, body bytes, content type, cache control)], uploaded in order
+    """
+    if out:
+        for key, body, _, _ in files:
+            path = Path(out) / key
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(body)
+            print(f"  ✓ Wrote {path} ({len(body):,} bytes)")
+        return
+
+    s3 = None if dry_run else get_s3_client()
+    for key, body, content_type, cache_control in files:
+        if dry_run:
+            print(f"  ↷ Would upload s3://{bucket}/{key} ({len(body):,} bytes, {cache_control})")
+            continue
+        s3.put_object(Bucket=bucket, Key=key, Body=body,
+                      ContentType=content_type, CacheControl=cache_control)
+        print(f"  ✓ Uploaded s3://{bucket}/{key} ({len(body):,} bytes)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Publish the resume as static files to S3')
+    parser.add_argument('--bucket', default=os.getenv('S3_BUCKET'),
+                        help='Website bucket (terraform output s3_bucket_name)')
+    parser.add_argument('--distribution-id', default=os.getenv('CLOUDFRONT_DISTRIBUTION_ID'),
+                        help='Distribution to invalidate (terraform output cloudfront_distribution_id)')
+    parser.add_argument('--app-dir', default=str(ROOT / 'app'), help='Directory containing index.html')
+    parser.add_argument('--out', help='Write the files to this directory instead of S3')
+    parser.add_argument('--dry-run', action='store_true', help='Print what would be uploaded and invalidated')
+    args = parser.parse_args()
+
+    if not args.out and not args.bucket:
+        parser.error('--bucket (or S3_BUCKET) is required unless --out is given')
+
+    template_path = Path(args.app_dir) / 'index.html'
+    if not template_path.exists():
+        print(f"Error: '{template_path}' not found (use --app-dir)")
+        sys.exit(1)
+
+    print("\n📖 Reading resume data...\n")
+    try:
+        use_api_handlers()
+        from handlers.resume_all import get_all_resume_data
+        data = get_all_resume_data()
+    except Exception as e:
+        print(f"\n❌ Error reading DynamoDB: {e}")
+        sys.exit(1)
+
+    body, data_key = encode_resume(data)
+    page = render_index(template_path.read_text(encoding='utf-8'), data, data_key)
+
+    print(f"\n🚀 Publishing {data_key}...\n")
+    try:
+        # JSON first, so the new index.html never points at a missing object
+        publish([
+            (data_key, body, 'application/json', IMMUTABLE),
+            ('index.html', page.encode('utf-8'), 'text/html; charset=utf-8', HTML_CACHE),
+        ], bucket=args.bucket, out=args.out, dry_run=args.dry_run)
+        if not args.out:
+            invalidate(['/', '/index.html'], args.distribution_id, dry_run=args.dry_run)
+    except Exception as e:
+        print(f"\n❌ Error publishing: {e}")
+        sys.exit(1)
+
+    print("\n✅ Published static resume\n")
+
+
+if __name__ == '__main__':
+    main()
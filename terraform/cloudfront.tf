@@ -7,6 +7,68 @@ resource "aws_cloudfront_origin_access_control" "website" {
   signing_protocol                  = "sigv4"
 }
 
+# API caching: honor the origin's Cache-Control (s-maxage, stale-while-revalidate,
+# stale-if-error). Responses without one (POSTs, errors) are not cached.
+resource "aws_cloudfront_cache_policy" "api" {
+  name        = "${var.project_name}-api"
+  comment     = "Cache-Control driven caching for /api/*"
+  min_ttl     = 0
+  default_ttl = 0
+  max_ttl     = 86400
+
+  parameters_in_cache_key_and_forwarded_to_origin {
+    enable_accept_encoding_gzip   = true
+    enable_accept_encoding_brotli = true
+
+    # /resume varies on Accept (JSON vs NDJSON) and CORS headers on Origin.
+    # X-Debug-Profile tokens are unique, so profiled requests always miss
+    # (and the origin answers them with no-store)
+    headers_config {
+      header_behavior = "whitelist"
+      headers {
+        items = ["Accept", "Origin", "X-Debug-Profile"]
+      }
+    }
+
+    query_strings_config {
+      query_string_behavior = "all"
+    }
+
+    cookies_config {
+      cookie_behavior = "none"
+    }
+  }
+}
+
+# Forward everything else (Content-Type for POSTs, etc.) without adding it to
+# the cache key. The Function URL rejects a forwarded Host header.
+data "aws_cloudfront_origin_request_policy" "all_viewer_except_host" {
+  name = "Managed-AllViewerExceptHostHeader"
+}
+
+# Surrogate keys are for purging; don't send them to browsers. X-Request-ID
+# and Server-Timing describe the request that filled the cache, so a cached
+# copy would replay one viewer's id and timings to everyone else
+resource "aws_cloudfront_response_headers_policy" "api" {
+  name    = "${var.project_name}-api"
+  comment = "Strip surrogate-key and per-request headers from /api/* responses"
+
+  remove_headers_config {
+    items {
+      header = "Surrogate-Key"
+    }
+    items {
+      header = "Cache-Tag"
+    }
+    items {
+      header = "X-Request-ID"
+    }
+    items {
+      header = "Server-Timing"
+    }
+  }
+}
+
 # CloudFront distribution
 resource "aws_cloudfront_distribution" "website" {
   enabled             = true
@@ -44,9 +106,24 @@ resource "aws_cloudfront_distribution" "website" {
     viewer_protocol_policy = "redirect-to-https"
     compress               = true
 
+    # Cache-Control from the API decides what is cached (api/handlers/cache_policy.py)
+    cache_policy_id            = aws_cloudfront_cache_policy.api.id
+    origin_request_policy_id   = data.aws_cloudfront_origin_request_policy.all_viewer_except_host.id
+    response_headers_policy_id = aws_cloudfront_response_headers_policy.api.id
+  }
+
+  # Content-hashed resume JSON from scripts/publish_static.py — never changes,
+  # so cache it as long as the object's Cache-Control allows
+  ordered_cache_behavior {
+    path_pattern           = "/data/*"
+    allowed_methods        = ["GET", "HEAD", "OPTIONS"]
+    cached_methods         = ["GET", "HEAD"]
+    target_origin_id       = "S3-${aws_s3_bucket.website.id}"
+    viewer_protocol_policy = "redirect-to-https"
+    compress               = true
+
     forwarded_values {
-      query_string = true
-      headers      = ["Origin", "Authorization", "Content-Type"]
+      query_string = false
 
       cookies {
         forward = "none"
@@ -54,8 +131,8 @@ resource "aws_cloudfront_distribution" "website" {
     }
 
     min_ttl     = 0
-    default_ttl = 0
-    max_ttl     = 0
+    default_ttl = 86400
+    max_ttl     = 31536000
   }
 
   # Default: serve everything else from S3
@@ -14,6 +14,11 @@ resource "aws_dynamodb_table" "resume_data" {
     type = "S"
   }
 
+  attribute {
+    name = "tenant"
+    type = "S"
+  }
+
   # Global Secondary Index for querying by type
   global_secondary_index {
     name            = "TypeIndex"
@@ -21,6 +26,13 @@ resource "aws_dynamodb_table" "resume_data" {
     projection_type = "ALL"
   }
 
+  # One resume per tenant for multi-tenant hosting (/resume/{tenant})
+  global_secondary_index {
+    name            = "TenantIndex"
+    hash_key        = "tenant"
+    projection_type = "ALL"
+  }
+
   # Enable point-in-time recovery
   point_in_time_recovery {
     enabled = true
@@ -26,6 +26,7 @@ resource "aws_lambda_function" "fastapi_app" {
       AWS_LWA_PORT            = "8080"
       AWS_LAMBDA_EXEC_WRAPPER = "/opt/bootstrap"
       AWS_LWA_INVOKE_MODE = "response_stream"
+      WARM_CONCURRENCY        = tostring(var.warm_concurrency)
     }
   }
 
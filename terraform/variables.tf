@@ -38,3 +38,15 @@ variable "api_gateway_id" {
   description = "API Gateway REST API ID"
   type        = string
 }
+
+variable "warm_concurrency" {
+  description = "Lambda execution environments kept warm by the EventBridge warmer (0 disables it)"
+  type        = number
+  default     = 2
+}
+
+variable "warm_schedule" {
+  description = "EventBridge schedule for the Lambda warmer"
+  type        = string
+  default     = "rate(5 minutes)"
+}
@@ -0,0 +1,50 @@
+# Keep-warm schedule: EventBridge pings the API Lambda, which primes its
+# cache and fans out to keep var.warm_concurrency environments warm
+# (see api/handlers/warmer.py)
+
+resource "aws_cloudwatch_event_rule" "warmer" {
+  name                = "${var.project_name}-warmer"
+  description         = "Keep ${var.warm_concurrency} API Lambda environments warm"
+  schedule_expression = var.warm_schedule
+  state               = var.warm_concurrency > 0 ? "ENABLED" : "DISABLED"
+
+  tags = {
+    Name        = "${var.project_name}-warmer"
+    Environment = var.environment
+  }
+}
+
+resource "aws_cloudwatch_event_target" "warmer" {
+  rule = aws_cloudwatch_event_rule.warmer.name
+  arn  = aws_lambda_function.fastapi_app.arn
+
+  # The fan-out size comes from WARM_CONCURRENCY (lambda.tf), never the event
+  input = jsonencode({
+    warmer = true
+  })
+}
+
+resource "aws_lambda_permission" "warmer" {
+  statement_id  = "AllowEventBridgeWarmer"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.fastapi_app.function_name
+  principal     = "events.amazonaws.com"
+  source_arn    = aws_cloudwatch_event_rule.warmer.arn
+}
+
+# The warmed function invokes itself to warm additional environments
+resource "aws_iam_role_policy" "lambda_self_invoke" {
+  name = "${var.project_name}-lambda-self-invoke-policy"
+  role = aws_iam_role.lambda_execution.id
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect   = "Allow"
+        Action   = ["lambda:InvokeFunction"]
+        Resource = aws_lambda_function.fastapi_app.arn
+      }
+    ]
+  })
+}